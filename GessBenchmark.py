@@ -0,0 +1,231 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Benchmark suite for the make_move() pipeline of the Gess Game. Times each validation stage, whole
+# make_move() calls, random self-play games and the memory of a game instance on fixed seeded move sequences, saves
+# the results as JSON and compares them against a saved baseline.
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from GessBitboard import BitboardGessGame
+from GessGame import GessGame
+
+BACKENDS = {"string": GessGame, "bitboard": BitboardGessGame}
+
+# Stages called by make_move(), in order
+STAGES = ("convert_to_axes", "generate_piece_and_footprint", "verify_piece_choice_validity", "check_center",
+          "check_direction", "check_obstruction", "check_ring_break", "border_scrubber", "check_win")
+
+
+def record_game(seed, length):
+    """
+    Play a random game and record its moves, so every backend and every run is timed on the same positions.
+    :param seed: int seed of the random move choices
+    :param length: int maximum number of moves
+    :return: List of (centr, new_centr) pairs
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    game = BitboardGessGame()
+    moves = []
+    while len(moves) < length and game.get_game_state() == "UNFINISHED":
+        legal = list(game.generate_legal_moves())
+        if not legal:
+            break
+        move = rng.choice(legal)
+        game.make_move(*move)
+        moves.append(move)
+    return moves
+
+
+def bench_stages(game_class, sequences, repeat):
+    """
+    Time each stage of make_move() on every position of the move sequences. Stages are run in make_move() order so
+    each one sees the state left by the stages before it, and each is repeated on the same position.
+    :param game_class: GessGame or a backend subclass
+    :param sequences: list of move lists from record_game()
+    :param repeat: int number of times each stage is timed per position
+    :return: Dict of stage name to microseconds per call
+    :rtype: dict
+    """
+    totals = dict.fromkeys(STAGES, 0.0)
+    calls = 0
+    timer = time.perf_counter
+    for moves in sequences:
+        game = game_class()
+        for centr, new_centr in moves:
+            for stage in STAGES:
+                if stage == "convert_to_axes":
+                    arguments = (centr, new_centr)
+                else:
+                    arguments = ()
+                method = getattr(game, stage)
+                start = timer()
+                for _ in range(repeat):
+                    method(*arguments)
+                totals[stage] += timer() - start
+            calls += repeat
+            game.make_move(centr, new_centr)
+
+    results = {}
+    for stage in STAGES:
+        results[stage] = totals[stage] / calls * 1e6
+    return results
+
+
+def bench_make_move(game_class, sequences):
+    """
+    Time whole make_move() calls replaying the move sequences.
+    :param game_class: GessGame or a backend subclass
+    :param sequences: list of move lists from record_game()
+    :return: Microseconds per call
+    :rtype: float
+    """
+    elapsed = 0.0
+    calls = 0
+    for moves in sequences:
+        game = game_class()
+        start = time.perf_counter()
+        for centr, new_centr in moves:
+            game.make_move(centr, new_centr)
+        elapsed += time.perf_counter() - start
+        calls += len(moves)
+    return elapsed / calls * 1e6
+
+
+def bench_self_play(game_class, games, length, seed):
+    """
+    Time random self-play games, each choosing uniformly among the legal moves of every position.
+    :param game_class: GessGame or a backend subclass
+    :param games: int number of games
+    :param length: int maximum number of moves per game
+    :param seed: int seed of the random move choices
+    :return: Milliseconds per game
+    :rtype: float
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(games):
+        game = game_class()
+        for _ in range(length):
+            if game.get_game_state() != "UNFINISHED":
+                break
+            legal = list(game.generate_legal_moves())
+            if not legal:
+                break
+            game.make_move(*rng.choice(legal))
+    return (time.perf_counter() - start) / games * 1000
+
+
+def bench_memory(game_class, instances):
+    """
+    Measure the memory held by live game instances in their starting position.
+    :param game_class: GessGame or a backend subclass
+    :param instances: int number of instances to create
+    :return: Bytes per instance
+    :rtype: float
+    """
+    game_class()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [game_class() for _ in range(instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del games
+    return (after - before) / instances
+
+
+def run_benchmarks(backends, seeds, length, repeat, games, instances):
+    """
+    Run every benchmark on each backend.
+    :param backends: list of backend names from BACKENDS
+    :param seeds: list of int seeds of the recorded move sequences
+    :param length: int number of moves per sequence and self-play game
+    :param repeat: int number of times each stage is timed per position
+    :param games: int number of self-play games
+    :param instances: int number of instances for the memory measurement
+    :return: Results holding the settings and, per backend, metrics for which lower is better
+    :rtype: dict
+    """
+    sequences = [record_game(seed, length) for seed in seeds]
+    results = {"python": platform.python_version(), "seeds": list(seeds), "length": length, "backends": {}}
+    for name in backends:
+        game_class = BACKENDS[name]
+        metrics = {}
+        for stage, value in bench_stages(game_class, sequences, repeat).items():
+            metrics[stage + "_us"] = value
+        metrics["make_move_us"] = bench_make_move(game_class, sequences)
+        metrics["self_play_ms_per_game"] = bench_self_play(game_class, games, length, seeds[0])
+        metrics["bytes_per_game"] = bench_memory(game_class, instances)
+        results["backends"][name] = metrics
+    return results
+
+
+def compare(baseline, current, threshold):
+    """
+    Find the metrics that got worse than the baseline by more than the threshold.
+    :param baseline: dict results of an earlier run
+    :param current: dict results of this run
+    :param threshold: float allowed slowdown as a fraction, such as 0.1 for 10 percent
+    :return: List of (backend, metric, baseline value, current value) for each regression
+    :rtype: list
+    """
+    regressions = []
+    for name, metrics in current["backends"].items():
+        old_metrics = baseline["backends"].get(name, {})
+        for metric, value in metrics.items():
+            old = old_metrics.get(metric)
+            if old and value > old * (1 + threshold):
+                regressions.append((name, metric, old, value))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point: run the benchmarks, print them, optionally save them as JSON and compare them against
+    a baseline file.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status, 1 if a metric regressed past the threshold
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Gess Game move pipeline.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), action="append",
+                        help="backend to benchmark, may be repeated; defaults to all")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3], help="seeds of the move sequences")
+    parser.add_argument("--length", type=int, default=40, help="moves per sequence and self-play game")
+    parser.add_argument("--repeat", type=int, default=20, help="times each stage is timed per position")
+    parser.add_argument("--games", type=int, default=3, help="self-play games to time")
+    parser.add_argument("--instances", type=int, default=100, help="instances for the memory measurement")
+    parser.add_argument("--output", help="file to save the results to as JSON")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown before failing, as a fraction")
+    arguments = parser.parse_args(argv)
+
+    results = run_benchmarks(arguments.backend or sorted(BACKENDS), arguments.seeds, arguments.length,
+                             arguments.repeat, arguments.games, arguments.instances)
+    for name, metrics in results["backends"].items():
+        print(name)
+        for metric, value in metrics.items():
+            print("  %-36s %12.2f" % (metric, value))
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline:
+            regressions = compare(json.load(baseline), results, arguments.threshold)
+        for name, metric, old, value in regressions:
+            print("REGRESSION %s %s: %.2f -> %.2f" % (name, metric, old, value))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
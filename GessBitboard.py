@@ -0,0 +1,535 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Bitboard backend for the Gess Game. Stones are tracked as one integer bitmask per color instead of the
+# list of list string board, which is only rendered when the board is displayed.
+
+from GessGame import GessGame, INITIAL_BOARD, FOOTPRINTS, SWEEPS, ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_WHITE_TO_MOVE
+
+# Every cell of the 20x20 grid maps to one bit of a Python integer; x (letter) * 20 + y (number) - 1
+BOARD_SIZE = 20
+
+
+def cell_index(x, y):
+    """
+    Convert game board indexes into the bit index used by the bitboards
+    :param x: int x axis (letter) index of the game board, 0 to 19
+    :param y: int y axis (number) index of the game board, 1 to 20
+    :return: Bit index of the cell
+    :rtype: int
+    """
+    return x * BOARD_SIZE + y - 1
+
+
+def build_footprint_masks():
+    """
+    Generate the 3x3 footprint mask centered on every cell of the grid. Parts of a footprint falling off the grid are
+    left out of the mask.
+    :return: List of footprint masks indexed by the bit index of the footprint center
+    :rtype: list
+    """
+    masks = []
+    for center in range(BOARD_SIZE * BOARD_SIZE):
+        x, y = divmod(center, BOARD_SIZE)
+        y += 1
+        mask = 0
+        for x_step in (-1, 0, 1):
+            for y_step in (-1, 0, 1):
+                if 0 <= x + x_step < BOARD_SIZE and 1 <= y + y_step <= BOARD_SIZE:
+                    mask |= 1 << cell_index(x + x_step, y + y_step)
+        masks.append(mask)
+    return masks
+
+
+def build_region_mask(x_range, y_range):
+    """
+    Generate the mask covering every cell within the given index ranges
+    :param x_range: range of x axis (letter) indexes
+    :param y_range: range of y axis (number) indexes
+    :return: Mask of the region
+    :rtype: int
+    """
+    mask = 0
+    for x in x_range:
+        for y in y_range:
+            if 0 <= x < BOARD_SIZE and 1 <= y <= BOARD_SIZE:
+                mask |= 1 << cell_index(x, y)
+    return mask
+
+
+FOOTPRINT_MASKS = build_footprint_masks()
+FULL_MASK = build_region_mask(range(0, 20), range(1, 21))
+
+# Rows a and t plus columns 1 and 20; cleared by border_scrubber() after each move
+BORDER_MASK = FULL_MASK & ~build_region_mask(range(1, 19), range(2, 20))
+
+# Ring centers counted by check_win() and check_ring_break(); rows c to r, columns 3 to 18
+RING_REGION_MASK = build_region_mask(range(2, 18), range(3, 19))
+
+
+def build_ring_update_masks():
+    """
+    Generate, for every footprint center, the mask of ring centers whose window overlaps that footprint; a move can
+    only create or break rings inside the masks of its old and new centers.
+    :return: List of masks indexed by the bit index of the footprint center
+    :rtype: list
+    """
+    masks = []
+    for center in range(BOARD_SIZE * BOARD_SIZE):
+        x, y = divmod(center, BOARD_SIZE)
+        y += 1
+        masks.append(build_region_mask(range(x - 2, x + 3), range(y - 2, y + 3)) & RING_REGION_MASK)
+    return masks
+
+
+RING_UPDATE_MASKS = build_ring_update_masks()
+
+
+def build_sweep_masks():
+    """
+    Convert the obstruction sweeps of GessGame into masks, leaving out squares that fall off the grid.
+    :return: Dict of (center cell index, orientation, distance) to the mask of squares that must be empty
+    :rtype: dict
+    """
+    masks = {}
+    for key, cells in SWEEPS.items():
+        mask = 0
+        for x, y in cells:
+            if 0 <= x < BOARD_SIZE and 1 <= y <= BOARD_SIZE:
+                mask |= 1 << cell_index(x, y)
+        masks[key] = mask
+    return masks
+
+
+SWEEP_MASKS = build_sweep_masks()
+
+# Pattern code weight of each 9 bit piece mask, so a piece's pattern is TERNARY[black] + 2 * TERNARY[white]
+TERNARY = [sum(3 ** position for position in range(9) if mask >> position & 1) for mask in range(512)]
+
+# Bit offsets from a ring center to the eight stones that surround it
+RING_OFFSETS = (-21, -20, -19, -1, 1, 19, 20, 21)
+
+AXIS_ROW = [" ", "-1-", "-2-", "-3-", "-4-", "-5-", "-6-", "-7-", "-8-", "-9-", "-10", "-11", "-12", "-13", "-14",
+            "-15", "-16", "-17", "-18", "-19", "-20"]
+
+
+def count_bits(mask):
+    """
+    Count the stones present in a mask
+    :param mask: int bitmask
+    :return: Number of set bits
+    :rtype: int
+    """
+    return bin(mask).count("1")
+
+
+def shift(mask, offset):
+    """
+    Shift a mask so that the bit at index + offset lands on index
+    :param mask: int bitmask
+    :param offset: int bit offset, may be negative
+    :return: Shifted mask
+    :rtype: int
+    """
+    if offset >= 0:
+        return mask >> offset
+    return mask << -offset
+
+
+def ring_centers(stones, occupied, region=RING_REGION_MASK):
+    """
+    Locate the rings of one color. A ring is an empty center cell surrounded by eight stones of the same color; only
+    centers inside RING_REGION_MASK are considered, matching the windows counted by GessGame.
+    :param stones: int bitmask of the stones of one color
+    :param occupied: int bitmask of all stones on the board
+    :param region: int mask of the centers to test, defaults to the whole ring region
+    :return: Mask of ring centers
+    :rtype: int
+    """
+    centers = region & ~occupied
+    for offset in RING_OFFSETS:
+        centers &= shift(stones, offset)
+    return centers
+
+
+def hash_bits(mask, keys):
+    """
+    Combine the Zobrist keys of every set bit of a mask
+    :param mask: int bitmask
+    :param keys: list of keys indexed by bit index
+    :return: XOR of the keys
+    :rtype: int
+    """
+    combined = 0
+    while mask:
+        bit = mask & -mask
+        combined ^= keys[bit.bit_length() - 1]
+        mask ^= bit
+    return combined
+
+
+def masks_from_board(board):
+    """
+    Convert a list of list string game board into black and white bitboards
+    :param board: list of list game board as stored in GessGame._board
+    :return: Black bitboard, white bitboard
+    :rtype: tuple
+    """
+    black = 0
+    white = 0
+    for x in range(BOARD_SIZE):
+        for y in range(1, BOARD_SIZE + 1):
+            if board[x][y] == "-B-":
+                black |= 1 << cell_index(x, y)
+            elif board[x][y] == "-W-":
+                white |= 1 << cell_index(x, y)
+    return black, white
+
+
+class BitboardGessGame(GessGame):
+    """
+    Gess Game backed by bitboards. Rules, turn tracking and the public interface are inherited from GessGame; the
+    methods that read or write the board are replaced by mask operations:
+    - Footprint extraction shifts three 3-bit rows out of each color mask
+    - Obstruction sweeps are a single AND against the mask of the footprints the piece passes through
+    - The ring test shifts each color mask onto the ring centers instead of building 256 temporary pieces
+    - Border clearing is an AND with the complement of the border mask
+    The string board is only generated for display by get_board().
+    """
+
+    def __init__(self):
+        """
+        Initialization method; extends GessGame.__init__() with the following data attributes:
+        :var self._black - Bitboard of black stones
+        :var self._white - Bitboard of white stones
+        :var self._piece_black - 9 bit mask of black stones in the selected piece, bit order matching self._piece
+        :var self._piece_white - 9 bit mask of white stones in the selected piece, bit order matching self._piece
+        :var self._black_rings - Ring index; mask of the centers of every black ring
+        :var self._white_rings - Ring index; mask of the centers of every white ring
+        The string board self._board and the window patterns self._patterns are not used by this backend.
+        """
+        self._black, self._white = masks_from_board(INITIAL_BOARD)
+        super().__init__()
+        self._board = None
+        self._piece_black = 0
+        self._piece_white = 0
+
+    def render_board(self):
+        """
+        Generate the list of list string game board from the bitboards
+        :return: Game board in the same layout as GessGame._board
+        :rtype: list
+        """
+        board = []
+        for x in range(BOARD_SIZE):
+            row = [self._x_axis[x]]
+            for y in range(1, BOARD_SIZE + 1):
+                bit = 1 << cell_index(x, y)
+                if self._black & bit:
+                    row.append("-B-")
+                elif self._white & bit:
+                    row.append("-W-")
+                else:
+                    row.append("---")
+            board.append(row)
+        board.append(list(AXIS_ROW))
+        return board
+
+    def get_board(self):
+        """
+        Get method used to return gameboard
+        :return: Rendered game board
+        :rtype: Print-out of list of list
+        """
+        for i in self.render_board():
+            print(' '.join(i))
+
+    def get_ring_board(self):
+        """
+        Get method used to return gameboard; the bitboard backend has no separate ring board
+        :return: Rendered game board
+        :rtype: Print-out of list of list
+        """
+        self.get_board()
+
+    def get_piece(self):
+        """
+        Get method to return Piece
+        :return: Selected piece rendered from the piece masks
+        :rtype: list
+        """
+        piece = []
+        for i in range(9):
+            if self._piece_black >> i & 1:
+                piece.append("-B-")
+            elif self._piece_white >> i & 1:
+                piece.append("-W-")
+            else:
+                piece.append("---")
+        return piece
+
+    def get_snapshot(self):
+        """
+        Get method to return a compact copy of the position; the bitboards already are the snapshot format.
+        :return: Black stones, white stones, turn count, game state
+        :rtype: tuple
+        """
+        return self._black, self._white, self._turn_count, self._state
+
+    def load_snapshot(self, snapshot):
+        """
+        Method to set up the position of a snapshot from get_snapshot(). The journal is cleared.
+        :param snapshot: tuple returned by get_snapshot()
+        :return: No return.
+        """
+        self._black, self._white, self._turn_count, self._state = snapshot
+        self._journal = []
+        self.build_ring_index()
+        self.build_hash()
+        self.count_rings()
+        self._snapshot_cache = None
+        if self._subscribers:
+            self.publish(range(BOARD_SIZE * BOARD_SIZE))
+
+    def get_stone(self, x, y):
+        """
+        Get method to return the contents of a square
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :return: "-B-", "-W-" or "---"
+        :rtype: str
+        """
+        bit = 1 << cell_index(x, y)
+        if self._black & bit:
+            return "-B-"
+        if self._white & bit:
+            return "-W-"
+        return "---"
+
+    def get_stone_counts(self):
+        """
+        Get method to return the number of stones of each color on the game board
+        :return: Number of black stones, number of white stones
+        :rtype: tuple
+        """
+        return count_bits(self._black), count_bits(self._white)
+
+    def get_ring_counts(self):
+        """
+        Get method to return the number of rings of each color, read from the ring index
+        :return: Number of black rings, number of white rings
+        :rtype: tuple
+        """
+        return count_bits(self._black_rings), count_bits(self._white_rings)
+
+    def get_ring_centers(self):
+        """
+        Get method to return the centers of the rings on the game board
+        :return: Alphanumeric centers of black rings
+        :rtype: list
+        :return: Alphanumeric centers of white rings
+        :rtype: list
+        """
+        black = []
+        white = []
+        for cell in range(BOARD_SIZE * BOARD_SIZE):
+            x, y = divmod(cell, BOARD_SIZE)
+            if self._black_rings >> cell & 1:
+                black.append(self._x_axis[x] + str(y + 1))
+            if self._white_rings >> cell & 1:
+                white.append(self._x_axis[x] + str(y + 1))
+        return sorted(black), sorted(white)
+
+    def get_ring_masks(self):
+        """
+        Get method to return the ring index as bitmasks of ring centers
+        :return: Mask of black ring centers, mask of white ring centers
+        :rtype: tuple
+        """
+        return self._black_rings, self._white_rings
+
+    def get_footprint(self):
+        """
+        Get method to return old and new footprints
+        :return: Footprint of the selected piece, footprint of the new location
+        :rtype: tuple
+        """
+        return FOOTPRINTS[self._center_old], FOOTPRINTS[self._center_new]
+
+    def generate_piece_and_footprint(self):
+        """
+        Support method for make_move() to locate the old and new footprint centers and extract the selected piece as
+        one 9 bit mask per color and as its pattern code.
+        :return: No return.
+        """
+        self._center_old = cell_index(self._coord_x_old, self._coord_y_old)
+        self._center_new = cell_index(self._coord_x_new, self._coord_y_new)
+
+        # Pull the three rows of the piece out of each bitboard
+        top = cell_index(self._coord_x_old - 1, self._coord_y_old - 1)
+        self._piece_black = ((self._black >> top) & 7) | ((self._black >> (top + 20)) & 7) << 3 | \
+                            ((self._black >> (top + 40)) & 7) << 6
+        self._piece_white = ((self._white >> top) & 7) | ((self._white >> (top + 20)) & 7) << 3 | \
+                            ((self._white >> (top + 40)) & 7) << 6
+        self._pattern = TERNARY[self._piece_black] + 2 * TERNARY[self._piece_white]
+
+    def verify_piece_choice_validity(self):
+        """
+        Support method for make_move() that assures the player has chosen a piece in line with the game rules.
+        :return: No return.
+        """
+        # Check for color singularity
+        if self._piece_black and self._piece_white:
+            return self.reject("INVALID PIECE SELECTION; STONES OF BOTH COLOR PRESENT")
+
+        # Verify the chosen piece belongs to the player who's turn it is
+        if (self._turn_count % 2) == 0:
+            if self._piece_white:
+                return self.reject("NOT YOUR TURN; BLACK TO MAKE MOVE")
+        else:
+            if self._piece_black:
+                return self.reject("NOT YOUR TURN; WHITE TO MAKE MOVE")
+
+    def check_direction(self):
+        """
+        Interpret direction of movement and verify the piece has a stone in the matching square.
+        :return: No return.
+        """
+        self.find_orientation()
+
+        if self._orientation is None or not (self._piece_black | self._piece_white) >> self._orientation & 1:
+            return self.reject("INVALID MOVE; MOVEMENT DIRECTION NOT SUPPORTED BY PIECE STRUCTURE")
+
+    def check_obstruction(self):
+        """
+        Method to verify unobstructed travel for piece from old center coordinates to new center coordinates with a
+        single AND of the occupied cells against the precomputed sweep mask of the move.
+        :return: No return.
+        """
+        x_diff = self._coord_x_new - self._coord_x_old
+        y_diff = self._coord_y_new - self._coord_y_old
+
+        # The piece steps abs(x_diff) times, so moves along the y axis are never swept
+        if self._orientation is not None and (x_diff > 1 or y_diff > 1) and x_diff != 0:
+            if (self._black | self._white) & SWEEP_MASKS[(self._center_old, self._orientation, abs(x_diff))]:
+                return self.reject("INVALID MOVE; OBSTRUCTION")
+
+    def moved_boards(self):
+        """
+        Support method to compute the bitboards after the selected piece moves to the new footprint. Stones under the
+        new footprint are replaced by the piece and the rest of the old footprint is emptied.
+        :return: Black bitboard, white bitboard
+        :rtype: tuple
+        """
+        footprint_old = FOOTPRINT_MASKS[self._center_old]
+        footprint_new = FOOTPRINT_MASKS[self._center_new]
+        offset = self._center_old - self._center_new
+        keep = ~(footprint_old | footprint_new)
+
+        black = (self._black & keep) | (shift(self._black & footprint_old, offset) & footprint_new)
+        white = (self._white & keep) | (shift(self._white & footprint_old, offset) & footprint_new)
+        return black, white
+
+    def changed_cells(self, changes):
+        """
+        Support method listing the cells whose stone differs between the bitboards before a move and the current ones.
+        :param changes: tuple returned by apply_move()
+        :return: Cell indexes of the changed squares
+        :rtype: list
+        """
+        changed = (self._black ^ changes[0]) | (self._white ^ changes[1])
+        cells = []
+        while changed:
+            bit = changed & -changed
+            cells.append(bit.bit_length() - 1)
+            changed ^= bit
+        return cells
+
+    def ring_update_region(self):
+        """
+        Support method returning the mask of ring centers whose window overlaps the old or new footprint.
+        :return: Mask of window centers
+        :rtype: int
+        """
+        return RING_UPDATE_MASKS[self._center_old] | RING_UPDATE_MASKS[self._center_new]
+
+    def move_piece(self):
+        """
+        Support method for make_move() that moves the validated piece on the bitboards.
+        :return: No return.
+        """
+        self._black, self._white = self.moved_boards()
+
+    def border_scrubber(self):
+        """
+        Method to maintain vacancy of border zones on the game board.
+        :return: No return.
+        """
+        self._black &= ~BORDER_MASK
+        self._white &= ~BORDER_MASK
+
+    def build_patterns(self):
+        """
+        Method to compute window patterns; the pattern of the selected piece is derived from the piece masks instead.
+        :return: No return.
+        """
+        self._patterns = None
+
+    def build_ring_index(self):
+        """
+        Method to fill the ring index from the whole board.
+        :return: No return.
+        """
+        occupied = self._black | self._white
+        self._black_rings = ring_centers(self._black, occupied)
+        self._white_rings = ring_centers(self._white, occupied)
+
+    def update_ring_index(self):
+        """
+        Method to bring the ring index up to date after a piece has moved, re-testing only the windows around it.
+        :return: No return.
+        """
+        occupied = self._black | self._white
+        region = self.ring_update_region()
+        self._black_rings = (self._black_rings & ~region) | ring_centers(self._black, occupied, region)
+        self._white_rings = (self._white_rings & ~region) | ring_centers(self._white, occupied, region)
+
+    def apply_move(self):
+        """
+        Support method that carries out the validated move on the bitboards. Bitboards are immutable integers, so
+        the masks in place before the move are all that is needed to take it back; the hash is updated from the bits
+        that changed.
+        :return: Black bitboard, white bitboard, black ring index, white ring index and hash before the move
+        :rtype: tuple
+        """
+        changes = (self._black, self._white, self._black_rings, self._white_rings, self._hash)
+        self.move_piece()
+        self.border_scrubber()
+        self.update_ring_index()
+        self._hash ^= hash_bits(self._black ^ changes[0], ZOBRIST_BLACK) ^ hash_bits(self._white ^ changes[1],
+                                                                                   ZOBRIST_WHITE)
+        return changes
+
+    def revert_move(self, changes):
+        """
+        Support method that takes back a move carried out by apply_move().
+        :param changes: tuple returned by apply_move()
+        :return: No return.
+        """
+        self._black, self._white, self._black_rings, self._white_rings, self._hash = changes
+
+    def build_hash(self):
+        """
+        Method to compute the hash of the position from the bitboards.
+        :return: No return.
+        """
+        self._hash = hash_bits(self._black, ZOBRIST_BLACK) ^ hash_bits(self._white, ZOBRIST_WHITE)
+        if self._turn_count % 2 == 1:
+            self._hash ^= ZOBRIST_WHITE_TO_MOVE
+
+    def count_rings(self):
+        """
+        Support method to read the number of rings of each color from the ring index.
+        :return: No return.
+        """
+        self._black_ring_count = count_bits(self._black_rings)
+        self._white_ring_count = count_bits(self._white_rings)
@@ -0,0 +1,535 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Memory compact Gess Game for hosting very many idle sessions. A game is a 400 cell bytearray, the turn
+# count, the state and the ring counts; every lookup table is shared at module level and a move is worked out in
+# local variables instead of scratch attributes.
+
+from GessBitboard import AXIS_ROW, RING_OFFSETS
+from GessGame import INITIAL_BOARD, X_AXIS, CENTER_ROWS, CELL_INDEX, CELL_AXES, PIECE_COMPASS, SWEEPS, STONE_DIGITS, \
+    DIGIT_STONES, MAX_RANGE, ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_WHITE_TO_MOVE, REJECTION_MESSAGES, ACCEPTED, \
+    GAME_FINISHED, INVALID_CENTER_X, INVALID_NEW_CENTER_X, INVALID_Y, MIXED_PIECE, BLACK_TO_MOVE, WHITE_TO_MOVE, \
+    TOO_FAR, INVALID_DIRECTION, OBSTRUCTION, OWN_LAST_RING
+
+# Cells hold the digits of STONE_DIGITS: 0 empty, 1 black, 2 white
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+
+# Starting cells, copied into each new game
+INITIAL_CELLS = bytes(STONE_DIGITS[INITIAL_BOARD[x][y]] for x, y in CELL_AXES)
+
+# Rows a and t plus columns 1 and 20; cleared after each move
+BORDER_CELLS = tuple(cell for cell, (x, y) in enumerate(CELL_AXES) if x in (0, 19) or y in (1, 20))
+
+# Ring centers counted by GessGame; rows c to r, columns 3 to 18
+RING_CELLS = tuple(cell for cell, (x, y) in enumerate(CELL_AXES) if 2 <= x <= 17 and 3 <= y <= 18)
+
+
+def build_footprint_cells():
+    """
+    Generate the footprint of a piece centered on every cell as cell indexes in PIECE_COMPASS order. Squares in the
+    label column, where a piece centered on column 1 hangs off the board, are None: stones placed there leave the
+    position.
+    :return: List of footprint tuples indexed by the cell index of the center, None for centers on rows a and t
+    :rtype: list
+    """
+    footprints = []
+    for x, y in CELL_AXES:
+        if not 0 < x < 19:
+            footprints.append(None)
+            continue
+        cells = []
+        for x_step, y_step in PIECE_COMPASS:
+            if 0 < y + y_step <= 20:
+                cells.append(CELL_INDEX[X_AXIS[x + x_step] + str(y + y_step)])
+            else:
+                cells.append(None)
+        footprints.append(tuple(cells))
+    return footprints
+
+
+def build_ring_regions():
+    """
+    Generate, for every footprint center, the ring centers whose window overlaps that footprint; a move can only
+    create or break rings around its old and new centers.
+    :return: List of tuples of ring center cell indexes, indexed by the cell index of the footprint center
+    :rtype: list
+    """
+    regions = []
+    for x, y in CELL_AXES:
+        regions.append(tuple(cell for cell in RING_CELLS
+                             if abs(CELL_AXES[cell][0] - x) <= 2 and abs(CELL_AXES[cell][1] - y) <= 2))
+    return regions
+
+
+FOOTPRINT_CELLS = build_footprint_cells()
+RING_REGIONS = build_ring_regions()
+
+# Obstruction sweeps of GessGame as cell indexes, leaving out squares of the label column
+SWEEP_CELLS = {key: tuple(x * 20 + y - 1 for x, y in cells if y > 0) for key, cells in SWEEPS.items()}
+
+
+class CompactGessGame:
+    """
+    Compact Gess Game class that serves to do the following:
+    - Play the same rules as GessGame with a few hundred bytes per game instead of tens of kilobytes
+    - Track turns, game state and ring counts
+    - Allow player to make move, resign and display the game board
+    - Convert to and from the snapshots shared with the other backends
+    It keeps no move history, so moves cannot be taken back, and rejected moves report only the first failed check.
+    """
+
+    __slots__ = ("_cells", "_turn_count", "_state", "_black_ring_count", "_white_ring_count")
+
+    def __init__(self):
+        """
+        Initialization method containing class data attributes:
+        :var self._cells - Game board; bytearray of one STONE_DIGITS digit per square, indexed by cell index
+        x * 20 + y - 1, copied from INITIAL_CELLS
+        :var self._turn_count - Initiated as zero, used to keep track of turns and ergo which player is allowed to move
+        :var self._state - State of game initialized as "UNFINISHED"
+        :var self._black_ring_count - Number of black rings on the game board
+        :var self._white_ring_count - Number of white rings on the game board
+        """
+        self._cells = bytearray(INITIAL_CELLS)
+        self._turn_count = 0
+        self._state = "UNFINISHED"
+        self._black_ring_count = 0
+        self._white_ring_count = 0
+        self.count_rings()
+
+    def get_game_state(self):
+        """
+        Get method to return Game State
+        :return: self._state
+        :rtype: str
+        """
+        return self._state
+
+    def get_turn_count(self):
+        """
+        Get method to return Turn Count
+        :return: self._turn_count
+        :rtype: int
+        """
+        return self._turn_count
+
+    def get_stone(self, x, y):
+        """
+        Get method to return the contents of a square
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :return: "-B-", "-W-" or "---"
+        :rtype: str
+        """
+        return DIGIT_STONES[self._cells[x * 20 + y - 1]]
+
+    def get_stone_counts(self):
+        """
+        Get method to return the number of stones of each color on the game board
+        :return: Number of black stones, number of white stones
+        :rtype: tuple
+        """
+        return self._cells.count(BLACK), self._cells.count(WHITE)
+
+    def get_ring_counts(self):
+        """
+        Get method to return the number of rings of each color
+        :return: Number of black rings, number of white rings
+        :rtype: tuple
+        """
+        return self._black_ring_count, self._white_ring_count
+
+    def get_hash(self):
+        """
+        Get method to return the Zobrist hash of the position, computed from the cells as no hash is stored
+        :return: Hash equal to GessGame.get_hash() for the same position
+        :rtype: int
+        """
+        combined = 0
+        for cell, digit in enumerate(self._cells):
+            if digit == BLACK:
+                combined ^= ZOBRIST_BLACK[cell]
+            elif digit == WHITE:
+                combined ^= ZOBRIST_WHITE[cell]
+        if self._turn_count % 2 == 1:
+            combined ^= ZOBRIST_WHITE_TO_MOVE
+        return combined
+
+    def get_board(self):
+        """
+        Get method used to return gameboard
+        :return: Rendered game board
+        :rtype: Print-out of list of list
+        """
+        for x in range(20):
+            row = [X_AXIS[x]]
+            for digit in self._cells[x * 20:x * 20 + 20]:
+                row.append(DIGIT_STONES[digit])
+            print(' '.join(row))
+        print(' '.join(AXIS_ROW))
+
+    def get_snapshot(self):
+        """
+        Get method to return a compact copy of the position in the format of GessGame.get_snapshot()
+        :return: Black stones, white stones, turn count, game state
+        :rtype: tuple
+        """
+        black = 0
+        white = 0
+        for cell, digit in enumerate(self._cells):
+            if digit == BLACK:
+                black |= 1 << cell
+            elif digit == WHITE:
+                white |= 1 << cell
+        return black, white, self._turn_count, self._state
+
+    def load_snapshot(self, snapshot):
+        """
+        Method to set up the position of a snapshot from get_snapshot() of any backend.
+        :param snapshot: tuple returned by get_snapshot()
+        :return: No return.
+        """
+        black, white, self._turn_count, self._state = snapshot
+        for cell in range(400):
+            if black >> cell & 1:
+                self._cells[cell] = BLACK
+            elif white >> cell & 1:
+                self._cells[cell] = WHITE
+            else:
+                self._cells[cell] = EMPTY
+        self.count_rings()
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Method to create a game set up with the position of a snapshot from get_snapshot().
+        :param snapshot: tuple returned by get_snapshot()
+        :return: New game
+        :rtype: CompactGessGame
+        """
+        game = cls()
+        game.load_snapshot(snapshot)
+        return game
+
+    @classmethod
+    def from_cells(cls, cells, turn_count, state, ring_counts):
+        """
+        Method to create a game from cells and ring counts that are already known, skipping the ring scan of
+        __init__().
+        :param cells: bytes-like of 400 STONE_DIGITS digits, copied into the game
+        :param turn_count: int turn count
+        :param state: str game state
+        :param ring_counts: tuple of the number of black rings and white rings
+        :return: New game
+        :rtype: CompactGessGame
+        """
+        game = cls.__new__(cls)
+        game._cells = bytearray(cells)
+        game._turn_count = turn_count
+        game._state = state
+        game._black_ring_count, game._white_ring_count = ring_counts
+        return game
+
+    def get_cells(self):
+        """
+        Get method to return a copy of the cells
+        :return: One STONE_DIGITS digit per square, indexed by cell index
+        :rtype: bytes
+        """
+        return bytes(self._cells)
+
+    def is_ring(self, center):
+        """
+        Support method to check whether the window on a ring center is a ring: an empty center surrounded by eight
+        stones of the same color.
+        :param center: int cell index of the window center
+        :return: BLACK or WHITE for the ring color, EMPTY if the window is not a ring
+        :rtype: int
+        """
+        cells = self._cells
+        if cells[center] != EMPTY:
+            return EMPTY
+        color = cells[center - 21]
+        if color == EMPTY:
+            return EMPTY
+        for offset in RING_OFFSETS:
+            if cells[center + offset] != color:
+                return EMPTY
+        return color
+
+    def count_rings(self):
+        """
+        Method to count the rings of each color over every ring center; only needed when a board is set up.
+        :return: No return.
+        """
+        black = 0
+        white = 0
+        for center in RING_CELLS:
+            ring = self.is_ring(center)
+            if ring == BLACK:
+                black += 1
+            elif ring == WHITE:
+                white += 1
+        self._black_ring_count = black
+        self._white_ring_count = white
+
+    def count_region_rings(self, center_old, center_new):
+        """
+        Support method counting the rings of each color whose window overlaps the old or new footprint of a move.
+        :param center_old: int cell index of the piece center
+        :param center_new: int cell index of the new center
+        :return: Number of black rings, number of white rings
+        :rtype: tuple
+        """
+        black = 0
+        white = 0
+        for center in set(RING_REGIONS[center_old] + RING_REGIONS[center_new]):
+            ring = self.is_ring(center)
+            if ring == BLACK:
+                black += 1
+            elif ring == WHITE:
+                white += 1
+        return black, white
+
+    def parse_move(self, centr, new_centr):
+        """
+        Support method converting the alphanumeric inputs into cell indexes with the checks of
+        GessGame.convert_to_axes().
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: Rejection code, cell index of the piece center and of the new center, both None if rejected
+        :rtype: tuple
+        """
+        centr = str(centr)
+        new_centr = str(new_centr)
+        if centr[:1] not in CENTER_ROWS:
+            return INVALID_CENTER_X, None, None
+        if new_centr[:1] not in CENTER_ROWS:
+            return INVALID_NEW_CENTER_X, None, None
+        cell_old = CELL_INDEX.get(centr)
+        cell_new = CELL_INDEX.get(new_centr)
+        if cell_old is None or not 1 < CELL_AXES[cell_old][1] < 20:
+            return INVALID_Y, None, None
+        if cell_new is None or not 0 < CELL_AXES[cell_new][1] < 20:
+            return INVALID_Y, None, None
+        return ACCEPTED, cell_old, cell_new
+
+    def check_piece(self, center_old):
+        """
+        Support method checking that the piece on a center has stones of a single color and belongs to the player
+        whose turn it is.
+        :param center_old: int cell index of the piece center
+        :return: Rejection code, ACCEPTED if the piece may be moved
+        :rtype: int
+        """
+        cells = self._cells
+        colors = 0
+        for cell in FOOTPRINT_CELLS[center_old]:
+            colors |= 1 << cells[cell]
+        if colors & 6 == 6:
+            return MIXED_PIECE
+        if self._turn_count % 2 == 0:
+            if colors & 4:
+                return BLACK_TO_MOVE
+        elif colors & 2:
+            return WHITE_TO_MOVE
+        return ACCEPTED
+
+    def check_travel(self, center_old, center_new):
+        """
+        Support method checking the distance, direction and obstruction of a move with the rules of GessGame's
+        check_center(), check_direction() and check_obstruction().
+        :param center_old: int cell index of the piece center
+        :param center_new: int cell index of the new center
+        :return: Rejection code, ACCEPTED if the piece may travel to the new center
+        :rtype: int
+        """
+        x_old, y_old = CELL_AXES[center_old]
+        x_new, y_new = CELL_AXES[center_new]
+        x_diff = x_new - x_old
+        y_diff = y_new - y_old
+        if abs(x_diff) > MAX_RANGE or abs(y_diff) > MAX_RANGE:
+            return TOO_FAR
+
+        # A compass direction moves the same distance along each axis it moves on
+        distance = max(abs(x_diff), abs(y_diff))
+        if (x_diff and abs(x_diff) != distance) or (y_diff and abs(y_diff) != distance):
+            return INVALID_DIRECTION
+        x_step = (x_diff > 0) - (x_diff < 0)
+        y_step = (y_diff > 0) - (y_diff < 0)
+        orientation = (x_step + 1) * 3 + y_step + 1
+        if self._cells[FOOTPRINT_CELLS[center_old][orientation]] == EMPTY:
+            return INVALID_DIRECTION
+
+        # The piece steps abs(x_diff) times, so moves along the y axis are never swept
+        if (x_diff > 1 or y_diff > 1) and x_diff != 0:
+            cells = self._cells
+            for cell in SWEEP_CELLS[(center_old, orientation, abs(x_diff))]:
+                if cells[cell] != EMPTY:
+                    return OBSTRUCTION
+        return ACCEPTED
+
+    def move_cells(self, center_old, center_new):
+        """
+        Support method moving the piece from the old footprint to the new footprint, capturing any stones under the new
+        footprint.
+        :param center_old: int cell index of the piece center
+        :param center_new: int cell index of the new center
+        :return: Changed cells as (cell index, previous digit), to take the move back with restore_cells()
+        :rtype: list
+        """
+        cells = self._cells
+        footprint_old = FOOTPRINT_CELLS[center_old]
+        footprint_new = FOOTPRINT_CELLS[center_new]
+        piece = [cells[cell] for cell in footprint_old]
+        changes = []
+        for cell in footprint_old:
+            if cell not in footprint_new and cells[cell] != EMPTY:
+                changes.append((cell, cells[cell]))
+                cells[cell] = EMPTY
+        for cell, digit in zip(footprint_new, piece):
+            if cell is not None and cells[cell] != digit:
+                changes.append((cell, cells[cell]))
+                cells[cell] = digit
+        return changes
+
+    def restore_cells(self, changes):
+        """
+        Support method taking back the cells changed by move_cells(), newest change first.
+        :param changes: list returned by move_cells()
+        :return: No return.
+        """
+        cells = self._cells
+        for cell, digit in reversed(changes):
+            cells[cell] = digit
+
+    def check_move(self, centr, new_centr):
+        """
+        Method to check a move against the rules without making it, stopping at the first failed check. The ring break
+        check moves the piece on the board and takes it back.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: Rejection code, ACCEPTED for a legal move; messages are in REJECTION_MESSAGES
+        :rtype: int
+        """
+        if self._state != "UNFINISHED":
+            return GAME_FINISHED
+        code, center_old, center_new = self.parse_move(centr, new_centr)
+        if code == ACCEPTED:
+            code = self.check_piece(center_old)
+        if code == ACCEPTED:
+            code = self.check_travel(center_old, center_new)
+        if code == ACCEPTED and self.breaks_own_ring(center_old, center_new):
+            code = OWN_LAST_RING
+        return code
+
+    def breaks_own_ring(self, center_old, center_new):
+        """
+        Support method checking whether a move would leave the player moving without a ring.
+        :param center_old: int cell index of the piece center
+        :param center_new: int cell index of the new center
+        :return: Boolean value True if the player would have no ring left
+        :rtype: bool
+        """
+        before = self.count_region_rings(center_old, center_new)
+        changes = self.move_cells(center_old, center_new)
+        after = self.count_region_rings(center_old, center_new)
+        self.restore_cells(changes)
+        if self._turn_count % 2 == 0:
+            return self._black_ring_count - before[0] + after[0] == 0
+        return self._white_ring_count - before[1] + after[1] == 0
+
+    def make_move(self, centr, new_centr):
+        """
+        Method to move user-selected piece to new location on the gameboard. A rejected move prints the reason of the
+        first failed check, except in a finished game.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: Boolean value True if the move was made. False if it is not allowed.
+        """
+        code = self.try_move(centr, new_centr)
+        if code != ACCEPTED and code != GAME_FINISHED:
+            print(REJECTION_MESSAGES[code])
+        return code == ACCEPTED
+
+    def try_move(self, centr, new_centr):
+        """
+        Method to make a move quietly, as GessGame.try_move() does: nothing is printed and the reason a move is not
+        allowed is returned as a code.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: ACCEPTED if the move was made, otherwise the code of the first failed check
+        :rtype: int
+        """
+        code = self.check_move(centr, new_centr)
+        if code != ACCEPTED:
+            return code
+
+        center_old = CELL_INDEX[str(centr)]
+        center_new = CELL_INDEX[str(new_centr)]
+        before = self.count_region_rings(center_old, center_new)
+        self.move_cells(center_old, center_new)
+        after = self.count_region_rings(center_old, center_new)
+        cells = self._cells
+        for cell in BORDER_CELLS:
+            cells[cell] = EMPTY
+        self._black_ring_count += after[0] - before[0]
+        self._white_ring_count += after[1] - before[1]
+
+        # Check if move made has reduced the ring tally of opposing player to 0
+        if self._black_ring_count == 0:
+            self._state = "WHITE_WON"
+        if self._white_ring_count == 0:
+            self._state = "BLACK_WON"
+        self._turn_count += 1
+        return ACCEPTED
+
+    def generate_legal_moves(self):
+        """
+        Generator of every legal move for the player whose turn it is, in the order of
+        GessGame.generate_legal_moves(). Each direction is walked outward until the edge of the game board, the maximum
+        distance or the first square the piece cannot reach. Make moves only after the generator is exhausted.
+        :return: Generator of (centr, new_centr) alphanumeric coordinate pairs
+        :rtype: generator
+        """
+        if self._state != "UNFINISHED":
+            return
+
+        for x in range(1, 19):
+            for y in range(2, 20):
+                center_old = x * 20 + y - 1
+                if self.check_piece(center_old) != ACCEPTED:
+                    continue
+                for orientation in range(9):
+                    x_step, y_step = PIECE_COMPASS[orientation]
+                    distance = 1
+                    if orientation == 4:
+                        distance = 0
+                    while distance <= MAX_RANGE:
+                        x_new = x + x_step * distance
+                        y_new = y + y_step * distance
+                        if not (0 < x_new < 19 and 0 < y_new < 20):
+                            break
+                        center_new = x_new * 20 + y_new - 1
+                        if self.check_travel(center_old, center_new) != ACCEPTED:
+                            break
+                        if not self.breaks_own_ring(center_old, center_new):
+                            yield X_AXIS[x] + str(y), X_AXIS[x_new] + str(y_new)
+                        if orientation == 4:
+                            break
+                        distance += 1
+
+    def resign_game(self):
+        """
+        Method to allow player to resign during their turn in the game
+        :return: No return.
+        """
+        if self._turn_count % 2 == 0:
+            self._state = "WHITE_WON"
+        else:
+            self._state = "BLACK_WON"
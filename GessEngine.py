@@ -0,0 +1,330 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Alpha-beta search engine that picks a move for the player whose turn it is in a Gess Game, using
+# iterative deepening within a per move time budget.
+
+import time
+
+from GessGame import CELL_AXES, CELL_INDEX
+from GessTransposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+# Scores are from the point of view of the player to move; a won game outweighs any material balance
+WIN_SCORE = 100000
+RING_WEIGHT = 50
+STONE_WEIGHT = 1
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget of the move runs out, to unwind back to choose_move().
+    """
+
+
+def side_stones(game):
+    """
+    Determine the stone colors of the player to move and of the opponent
+    :param game: GessGame instance
+    :return: Stone of the player to move, stone of the opponent
+    :rtype: tuple
+    """
+    if game.get_turn_count() % 2 == 0:
+        return "-B-", "-W-"
+    return "-W-", "-B-"
+
+
+def evaluate(game, ply=0):
+    """
+    Score a position for the player to move. Finished games score as a win or loss, closer results scoring higher;
+    otherwise rings and stones are counted for both sides.
+    :param game: GessGame instance
+    :param ply: int distance from the root of the search
+    :return: Score of the position
+    :rtype: int
+    """
+    state = game.get_game_state()
+    to_move = game.get_turn_count() % 2
+    if state != "UNFINISHED":
+        if (state == "BLACK_WON") == (to_move == 0):
+            return WIN_SCORE - ply
+        return ply - WIN_SCORE
+
+    black_stones, white_stones = game.get_stone_counts()
+    black_rings, white_rings = game.get_ring_counts()
+    score = STONE_WEIGHT * (black_stones - white_stones) + RING_WEIGHT * (black_rings - white_rings)
+    if to_move == 0:
+        return score
+    return -score
+
+
+def to_table(value, ply):
+    """
+    Convert a win or loss score measured from the root into one measured from the stored position
+    :param value: int score
+    :param ply: int distance from the root of the search
+    :return: Score to store in the transposition table
+    :rtype: int
+    """
+    if value >= WIN_SCORE - 1000:
+        return value + ply
+    if value <= 1000 - WIN_SCORE:
+        return value - ply
+    return value
+
+
+def from_table(value, ply):
+    """
+    Convert a stored win or loss score back into one measured from the root
+    :param value: int score read from the transposition table
+    :param ply: int distance from the root of the search
+    :return: Score relative to the root
+    :rtype: int
+    """
+    if value >= WIN_SCORE - 1000:
+        return value - ply
+    if value <= 1000 - WIN_SCORE:
+        return value + ply
+    return value
+
+
+class GessEngine:
+    """
+    Gess Engine class that serves to do the following:
+    - Choose a move for the player to move with alpha-beta search and iterative deepening
+    - Order moves with the transposition table move first, then captures and attacks on enemy rings
+    - Stop on the time budget and return the best move found so far
+    - Report depth, score, nodes and nodes per second of the last search
+    The game passed in is searched with make_move() and unmake_move() and is left as it was found.
+    """
+
+    def __init__(self, time_limit_ms=1000, max_depth=32, table_size=1 << 18):
+        """
+        Initialization method containing class data attributes:
+        :param time_limit_ms: int default time budget of a move in milliseconds
+        :param max_depth: int deepest iteration to search
+        :param table_size: int number of transposition table slots
+        :var self._time_limit_ms - Default time budget of a move in milliseconds
+        :var self._max_depth - Deepest iteration to search
+        :var self._table - Transposition table shared between searches
+        :var self._history - Dict of move to bonus for moves that caused cutoffs, used to order quiet moves
+        :var self._deadline - time.perf_counter() value at which the current search stops
+        :var self._nodes - Positions visited by the current search
+        :var self._root_best - Best root move of the iteration in progress, used if time runs out during it
+        :var self._stats - Results of the last search, returned by get_stats()
+        """
+        self._time_limit_ms = time_limit_ms
+        self._max_depth = max_depth
+        self._table = TranspositionTable(table_size)
+        self._history = {}
+        self._deadline = None
+        self._nodes = 0
+        self._root_best = None
+        self._stats = {}
+
+    def get_stats(self):
+        """
+        Get method to return the results of the last search
+        :return: Move, score, depth completed, nodes, elapsed milliseconds, nodes per second and table counters
+        :rtype: dict
+        """
+        return dict(self._stats)
+
+    def choose_move(self, game, time_limit_ms=None):
+        """
+        Method to search the position of the game and pick a move for the player to move. Each iteration searches
+        one ply deeper than the last until the time budget or the maximum depth is reached; the move of the deepest
+        completed iteration is returned, or a better one found by an iteration cut short.
+        :param game: GessGame instance to search
+        :param time_limit_ms: int time budget in milliseconds, defaults to the engine setting
+        :return: Chosen (centr, new_centr) pair, None if there is no legal move
+        :rtype: tuple
+        """
+        if time_limit_ms is None:
+            time_limit_ms = self._time_limit_ms
+        start = time.perf_counter()
+        self._deadline = start + time_limit_ms / 1000
+        self._nodes = 0
+        self._table.new_search()
+        self._history = {}
+
+        moves = list(game.generate_legal_moves())
+        best_move = None
+        best_score = 0
+        depth_done = 0
+        if moves:
+            moves = self.order_moves(game, moves, None)
+            best_move = moves[0]
+
+        for depth in range(1, self._max_depth + 1):
+            if not moves:
+                break
+            self._root_best = None
+            try:
+                best_score, best_move = self.search_root(game, moves, depth)
+            except SearchTimeout:
+                if self._root_best is not None:
+                    best_score, best_move = self._root_best
+                break
+            depth_done = depth
+
+            # Search the best move first on the next iteration
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+            if abs(best_score) >= WIN_SCORE - 1000:
+                break
+
+        elapsed = time.perf_counter() - start
+        self._stats = {"move": best_move, "score": best_score, "depth": depth_done, "nodes": self._nodes,
+                       "elapsed_ms": elapsed * 1000, "nodes_per_second": self._nodes / elapsed if elapsed else 0.0,
+                       "table": self._table.get_stats()}
+        return best_move
+
+    def search_root(self, game, moves, depth):
+        """
+        Support method for choose_move() searching every root move to the given depth.
+        :param game: GessGame instance
+        :param moves: list of root moves, best first
+        :param depth: int depth of the iteration
+        :return: Best score, best move
+        :rtype: tuple
+        """
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.make_move(*move)
+            try:
+                value = -self.search(game, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            finally:
+                game.unmake_move()
+            if value > alpha:
+                alpha = value
+                best_move = move
+                self._root_best = (value, move)
+        self._table.store(game.get_hash(), depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def search(self, game, depth, alpha, beta, ply):
+        """
+        Support method searching a position with negamax alpha-beta.
+        :param game: GessGame instance
+        :param depth: int remaining depth
+        :param alpha: int lower bound of the search window
+        :param beta: int upper bound of the search window
+        :param ply: int distance from the root
+        :return: Score of the position for the player to move
+        :rtype: int
+        """
+        self._nodes += 1
+        if time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+        if game.get_game_state() != "UNFINISHED":
+            return evaluate(game, ply)
+        # A position met before in the game or the line searched is a draw, leaves included
+        if game.count_repetitions():
+            return 0
+        if depth == 0:
+            return evaluate(game, ply)
+
+        key = game.get_hash()
+        entry = self._table.probe(key)
+        best_move = None
+        if entry is not None:
+            best_move = entry[4]
+            if entry[1] >= depth:
+                value = from_table(entry[2], ply)
+                if entry[3] == EXACT:
+                    return value
+                if entry[3] == LOWER_BOUND and value >= beta:
+                    return value
+                if entry[3] == UPPER_BOUND and value <= alpha:
+                    return value
+
+        moves = self.legal_moves(game)
+        if not moves:
+            return 0
+        moves = self.order_moves(game, moves, best_move)
+
+        original_alpha = alpha
+        best_value = -WIN_SCORE - 1
+        for move in moves:
+            game.make_move(*move)
+            try:
+                value = -self.search(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.unmake_move()
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                self._history[move] = self._history.get(move, 0) + depth * depth
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table.store(key, depth, to_table(best_value, ply), flag, best_move)
+        return best_value
+
+    def legal_moves(self, game):
+        """
+        Support method listing the legal moves of a position, checking the clock between pieces so move generation
+        does not run past the time budget.
+        :param game: GessGame instance
+        :return: List of (centr, new_centr) pairs
+        :rtype: list
+        """
+        moves = []
+        for move in game.generate_legal_moves():
+            if time.perf_counter() >= self._deadline:
+                raise SearchTimeout()
+            moves.append(move)
+        return moves
+
+    def order_moves(self, game, moves, best_move):
+        """
+        Support method sorting moves so that likely good ones are searched first: the move stored in the
+        transposition table, then moves capturing the most enemy stones, then moves whose new footprint overlaps an
+        enemy ring, then moves that caused cutoffs elsewhere in the search.
+        :param game: GessGame instance
+        :param moves: list of (centr, new_centr) pairs
+        :param best_move: Move from the transposition table or None
+        :return: Sorted list of moves
+        :rtype: list
+        """
+        own, enemy = side_stones(game)
+        black_rings, white_rings = game.get_ring_centers()
+        if enemy == "-B-":
+            enemy_rings = [CELL_AXES[CELL_INDEX[center]] for center in black_rings]
+        else:
+            enemy_rings = [CELL_AXES[CELL_INDEX[center]] for center in white_rings]
+
+        scored = []
+        for move in moves:
+            if move == best_move:
+                scored.append((1 << 30, move))
+                continue
+            x_old, y_old = CELL_AXES[CELL_INDEX[move[0]]]
+            x_new, y_new = CELL_AXES[CELL_INDEX[move[1]]]
+
+            # Enemy stones under the new footprint that the piece does not already cover
+            captures = 0
+            for x in range(x_new - 1, x_new + 2):
+                for y in range(max(y_new - 1, 1), y_new + 2):
+                    if (abs(x - x_old) > 1 or abs(y - y_old) > 1) and game.get_stone(x, y) == enemy:
+                        captures += 1
+
+            threat = 0
+            for ring_x, ring_y in enemy_rings:
+                if abs(x_new - ring_x) <= 2 and abs(y_new - ring_y) <= 2:
+                    threat = 1
+                    break
+
+            scored.append((captures * 1000 + threat * 500 + self._history.get(move, 0), move))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [move for _, move in scored]
@@ -0,0 +1,276 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Position evaluation for the Gess Game from material, rings, ring threats and piece mobility. Features of
+# a tracked game are updated from the cells each move changes, and scores are memoized by position hash in a size
+# bounded least recently used cache.
+
+import collections
+
+from GessEngine import WIN_SCORE
+from GessGame import CELL_AXES, CELL_WINDOWS, PATTERN_COUNT, PATTERN_OWNER, PATTERN_RING
+
+# Feature vector layout; each feature is counted for black then white
+FEATURES = ("black_stones", "white_stones", "black_rings", "white_rings", "black_threats", "white_threats",
+            "black_mobility", "white_mobility")
+
+# Weight of each feature pair in the score; the stone and ring weights match GessEngine.evaluate()
+STONE_WEIGHT = 1
+RING_WEIGHT = 50
+THREAT_WEIGHT = 10
+MOBILITY_WEIGHT = 1
+
+# Ring centers counted by GessGame; rows c to r, columns 3 to 18
+RING_REGION = bytes(2 <= x <= 17 and 3 <= y <= 18 for x, y in CELL_AXES)
+
+# Centers of the windows that can be a piece, whose pattern codes CELL_WINDOWS keeps; rows b to s, columns 2 to 19
+WINDOW_CENTERS = tuple(cell for cell, (x, y) in enumerate(CELL_AXES) if 0 < x < 19 and 1 < y < 20)
+
+
+def build_window_features():
+    """
+    Generate the features each possible 3x3 window adds, indexed by pattern code. A window owned by one color adds
+    one mobility per outer stone, each being a direction the piece can move in; a ring center adds a ring, and an
+    empty center with seven stones of one color around it and the eighth square empty adds a ring threat. Rings and
+    threats only count for windows in RING_REGION.
+    :return: List of (black mobility, white mobility) and list of (black ring, white ring, black threat, white threat)
+    :rtype: tuple
+    """
+    piece_features = []
+    ring_features = []
+    for code in range(PATTERN_COUNT):
+        digits = []
+        remainder = code
+        for _ in range(9):
+            remainder, digit = divmod(remainder, 3)
+            digits.append(digit)
+        outer = digits[:4] + digits[5:]
+
+        mobility = len(outer) - outer.count(0)
+        owner = PATTERN_OWNER[code]
+        piece_features.append((mobility if owner == "-B-" else 0, mobility if owner == "-W-" else 0))
+
+        ring = PATTERN_RING[code]
+        threats = [0, 0]
+        if digits[4] == 0 and outer.count(0) == 1:
+            for color in (1, 2):
+                if outer.count(color) == 7:
+                    threats[color - 1] = 1
+        ring_features.append((int(ring == "-B-"), int(ring == "-W-"), threats[0], threats[1]))
+    return piece_features, ring_features
+
+
+PIECE_FEATURES, RING_FEATURES = build_window_features()
+
+
+def window_features(features, center, code, sign):
+    """
+    Add or remove the features of one window.
+    :param features: list laid out as FEATURES, updated in place
+    :param center: int cell index of the window center
+    :param code: int pattern code of the window
+    :param sign: int 1 to add, -1 to remove
+    :return: No return.
+    """
+    black_mobility, white_mobility = PIECE_FEATURES[code]
+    features[6] += sign * black_mobility
+    features[7] += sign * white_mobility
+    if RING_REGION[center]:
+        black_ring, white_ring, black_threat, white_threat = RING_FEATURES[code]
+        features[2] += sign * black_ring
+        features[3] += sign * white_ring
+        features[4] += sign * black_threat
+        features[5] += sign * white_threat
+
+
+def scan_position(snapshot):
+    """
+    Compute the cells, window pattern codes and features of a position from scratch.
+    :param snapshot: tuple from GessGame.get_snapshot()
+    :return: bytearray of STONE_DIGITS digits by cell index, list of pattern codes by window center, list of
+    features laid out as FEATURES
+    :rtype: tuple
+    """
+    black, white = snapshot[:2]
+    cells = bytearray(400)
+    patterns = [0] * 400
+    features = [0] * len(FEATURES)
+    for cell in range(400):
+        digit = (black >> cell & 1) + 2 * (white >> cell & 1)
+        cells[cell] = digit
+        if digit:
+            features[digit - 1] += 1
+            for center, weight in CELL_WINDOWS[cell]:
+                patterns[center] += digit * weight
+    for center in WINDOW_CENTERS:
+        window_features(features, center, patterns[center], 1)
+    return cells, patterns, features
+
+
+def score_features(features, turn_count, state):
+    """
+    Score a position for the player to move from its features. Finished games score as a win or loss as in
+    GessEngine.evaluate().
+    :param features: list laid out as FEATURES
+    :param turn_count: int turn count; even for black to move
+    :param state: str game state
+    :return: Score of the position
+    :rtype: int
+    """
+    to_move = turn_count % 2
+    if state != "UNFINISHED":
+        if (state == "BLACK_WON") == (to_move == 0):
+            return WIN_SCORE
+        return -WIN_SCORE
+    score = STONE_WEIGHT * (features[0] - features[1]) + RING_WEIGHT * (features[2] - features[3]) + \
+        THREAT_WEIGHT * (features[4] - features[5]) + MOBILITY_WEIGHT * (features[6] - features[7])
+    if to_move == 0:
+        return score
+    return -score
+
+
+class PositionEvaluator:
+    """
+    Position Evaluator class that serves to do the following:
+    - Score positions of any backend for the player to move from material, rings, ring threats and mobility
+    - Keep the features of one attached game up to date from the changed cells of each of its moves, so scoring it
+      never scans the board
+    - Memoize scores by position hash and game state in a least recently used cache of bounded size, counting hits,
+      misses and evictions
+    """
+
+    def __init__(self, cache_size=4096):
+        """
+        Initialization method containing class data attributes:
+        :param cache_size: int maximum number of cached scores
+        :var self._cache_size - Maximum number of cached scores
+        :var self._cache - OrderedDict of (hash, state) to score, least recently used first
+        :var self._hits - Number of scores found in the cache
+        :var self._misses - Number of scores computed
+        :var self._evictions - Number of scores dropped to make room
+        :var self._game - Attached game, None if there is none
+        :var self._cells - Digits of the attached game's cells, by cell index
+        :var self._patterns - Pattern codes of the attached game's windows, by window center
+        :var self._features - Features of the attached game, laid out as FEATURES
+        """
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._game = None
+        self._cells = None
+        self._patterns = None
+        self._features = None
+
+    def attach(self, game):
+        """
+        Method to track a game: its features are computed once and then updated from the delta of every change to
+        it, received through GessGame.subscribe().
+        :param game: GessGame instance or backend subclass
+        :return: No return.
+        """
+        self.detach()
+        self._game = game
+        self._cells, self._patterns, self._features = scan_position(game.get_snapshot())
+        game.subscribe(self.apply_delta, raw=True)
+
+    def detach(self):
+        """
+        Method to stop tracking the attached game, if any.
+        :return: No return.
+        """
+        if self._game is not None:
+            self._game.unsubscribe(self.apply_delta)
+        self._game = None
+        self._cells = None
+        self._patterns = None
+        self._features = None
+
+    def apply_delta(self, change):
+        """
+        Support method updating the features of the attached game from the cells a change touched: the features of
+        every window covering a changed cell are taken out, the cells and pattern codes updated, and the features of
+        those windows put back.
+        :param change: dict delta from GessGame.publish()
+        :return: No return.
+        """
+        cells = self._cells
+        patterns = self._patterns
+        features = self._features
+        changed = [(cell, digit) for cell, digit in change["cells"] if cells[cell] != digit]
+        windows = set()
+        for cell, digit in changed:
+            for center, weight in CELL_WINDOWS[cell]:
+                windows.add(center)
+        for center in windows:
+            window_features(features, center, patterns[center], -1)
+        for cell, digit in changed:
+            old = cells[cell]
+            if old:
+                features[old - 1] -= 1
+            if digit:
+                features[digit - 1] += 1
+            for center, weight in CELL_WINDOWS[cell]:
+                patterns[center] += (digit - old) * weight
+            cells[cell] = digit
+        for center in windows:
+            window_features(features, center, patterns[center], 1)
+
+    def get_features(self):
+        """
+        Get method to return the features of the attached game
+        :return: Dict of feature name to value, None if no game is attached
+        :rtype: dict
+        """
+        if self._features is None:
+            return None
+        return dict(zip(FEATURES, self._features))
+
+    def evaluate(self, game=None):
+        """
+        Method to score a position for the player to move. The cache is consulted first; on a miss the attached
+        game is scored from its tracked features and any other game from a scan of its board.
+        :param game: GessGame instance of any backend, defaults to the attached game
+        :return: Score of the position
+        :rtype: int
+        """
+        if game is None:
+            game = self._game
+        key = (game.get_hash(), game.get_game_state())
+        score = self._cache.get(key)
+        if score is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return score
+
+        self._misses += 1
+        if game is self._game:
+            features = self._features
+        else:
+            features = scan_position(game.get_snapshot())[2]
+        score = score_features(features, game.get_turn_count(), game.get_game_state())
+        self._cache[key] = score
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+        return score
+
+    def clear(self):
+        """
+        Method to empty the cache and reset its counters.
+        :return: No return.
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_stats(self):
+        """
+        Get method to return the cache counters
+        :return: Hits, misses, hit rate, evictions, cached scores and cache size
+        :rtype: dict
+        """
+        lookups = self._hits + self._misses
+        return {"hits": self._hits, "misses": self._misses, "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions, "entries": len(self._cache), "cache_size": self._cache_size}
@@ -0,0 +1,628 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Differential fuzzing of the Gess Game backends. Seeded random sequences of move attempts, legal and
+# illegal, through try_move() and make_move(), with take backs and snapshot loads among them, are played on the
+# reference GessGame and a candidate backend side by side across worker processes; the first position where the
+# board, state, turn, rings, hash, repetition count or legality differ is reported with its sequence minimized, and
+# the throughput of both backends is reported once their results match. Hashes and repetition counts are checked
+# against values worked out from scratch, so a defect both backends share is found as well.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from GessBitboard import BitboardGessGame
+from GessCompact import CompactGessGame
+from GessGame import GessGame, CELL_AXES, PIECE_COMPASS, REJECTION_MESSAGES, X_AXIS, ZOBRIST_BLACK, ZOBRIST_WHITE, \
+    ZOBRIST_WHITE_TO_MOVE, ACCEPTED
+
+REFERENCE = GessGame
+CANDIDATES = {"string": GessGame, "bitboard": BitboardGessGame, "compact": CompactGessGame}
+
+# Chances of each kind of move attempt; the rest move a piece around a stone in a compass direction
+RESIGN_RATE = 0.0005
+GARBAGE_RATE = 0.03
+SKEW_RATE = 0.07
+
+# Coordinates no move may use, tried now and then alongside random squares just off the board
+GARBAGE = ("", "a", "b", "b0", "c21", "u5", "C3", "c-1", "3c", "c3 ", "cc3", "t20", "a1")
+
+# Chances of an action besides a move attempt: taking back the last change, where the candidate can, or loading the
+# snapshot of an earlier position; and of a move attempt going through make_move() rather than try_move()
+UNMAKE_RATE = 0.03
+LOAD_RATE = 0.005
+MAKE_RATE = 0.1
+
+# Number of changes back the position a snapshot load returns to, 0 reloading the current one
+LOAD_DEPTHS = (0, 1, 2, 5, 20)
+
+# Distances tried, weighted towards short moves; 4 is always too far
+DISTANCES = (1, 1, 1, 2, 2, 3, 3, 4)
+
+# Sequences per executor task
+CHUNK_SIZE = 25
+
+
+def coordinate(x, y):
+    """
+    Write a square as an alphanumeric coordinate, with a letter past the board for rows off it
+    :param x: int x axis index
+    :param y: int y axis index
+    :return: Coordinate
+    :rtype: str
+    """
+    if 0 <= x < 20:
+        return X_AXIS[x] + str(y)
+    return "z" + str(y)
+
+
+def stone_cells(bits):
+    """
+    List the cells holding stones in a stone bitmask
+    :param bits: int stone bitmask
+    :return: List of cell indexes
+    :rtype: list
+    """
+    cells = []
+    while bits:
+        low = bits & -bits
+        cells.append(low.bit_length() - 1)
+        bits ^= low
+    return cells
+
+
+def stone_on(snapshot, cell):
+    """
+    Get the contents of a square of a snapshot
+    :param snapshot: tuple from get_snapshot()
+    :param cell: int cell index of the square
+    :return: "-B-", "-W-" or "---"
+    :rtype: str
+    """
+    if snapshot[0] >> cell & 1:
+        return "-B-"
+    if snapshot[1] >> cell & 1:
+        return "-W-"
+    return "---"
+
+
+def position_hash(snapshot):
+    """
+    Work out the Zobrist hash of a snapshot from scratch, as GessGame.build_hash() does from the game board
+    :param snapshot: tuple from get_snapshot()
+    :return: Hash equal to get_hash() of a game in the position
+    :rtype: int
+    """
+    black, white, turn_count = snapshot[:3]
+    key = 0
+    for cell in stone_cells(black):
+        key ^= ZOBRIST_BLACK[cell]
+    for cell in stone_cells(white):
+        key ^= ZOBRIST_WHITE[cell]
+    if turn_count % 2 == 1:
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    return key
+
+
+def random_try(rng, own_cells, all_cells):
+    """
+    Make up a move attempt. Most pick a square next to a stone as the piece center and move it in a compass direction
+    for one to four squares; some move it by an arbitrary offset, some use malformed coordinates, and a few resign.
+    :param rng: random.Random generator
+    :param own_cells: list of the cells of the stones of the player to move
+    :param all_cells: list of the cells of all stones
+    :return: (centr, new_centr) pair, or None to resign
+    :rtype: tuple
+    """
+    roll = rng.random()
+    if roll < RESIGN_RATE:
+        return None
+    if roll < RESIGN_RATE + GARBAGE_RATE or not all_cells:
+        return rng.choice(GARBAGE), rng.choice(GARBAGE + ("c3", "d4", "k10"))
+
+    cells = own_cells if own_cells and rng.random() < 0.8 else all_cells
+    x, y = CELL_AXES[rng.choice(cells)]
+    x += rng.randint(-1, 1)
+    y += rng.randint(-1, 1)
+    if roll < RESIGN_RATE + GARBAGE_RATE + SKEW_RATE:
+        x_new = x + rng.randint(-3, 3)
+        y_new = y + rng.randint(-3, 3)
+    else:
+        x_step, y_step = rng.choice(PIECE_COMPASS)
+        distance = rng.choice(DISTANCES)
+        x_new = x + x_step * distance
+        y_new = y + y_step * distance
+    return coordinate(x, y), coordinate(x_new, y_new)
+
+
+def random_action(rng, own_cells, all_cells, unmake=True):
+    """
+    Make up the next action of a sequence: mostly a move attempt from random_try(), some of them through make_move(),
+    and now and then a take back or a snapshot load.
+    :param rng: random.Random generator
+    :param own_cells: list of the cells of the stones of the player to move
+    :param all_cells: list of the cells of all stones
+    :param unmake: Boolean value True if the candidate backend can take moves back
+    :return: (centr, new_centr) pair, None to resign, ("make", centr, new_centr), ("unmake",) or ("load", depth)
+    :rtype: tuple
+    """
+    roll = rng.random()
+    if roll < UNMAKE_RATE:
+        if unmake:
+            return ("unmake",)
+    elif roll < UNMAKE_RATE + LOAD_RATE:
+        return ("load", rng.choice(LOAD_DEPTHS))
+    move = random_try(rng, own_cells, all_cells)
+    if move is not None and rng.random() < MAKE_RATE:
+        return ("make",) + move
+    return move
+
+
+def attempt(game, move, snapshot=None):
+    """
+    Carry out an action quietly; the first line make_move() prints is caught and becomes the outcome of a rejected
+    move
+    :param game: GessGame, a backend subclass or CompactGessGame
+    :param move: action from random_action()
+    :param snapshot: tuple from get_snapshot() a load action sets up
+    :return: Rejection code, ACCEPTED, the reason make_move() printed, or the name of the exception raised
+    """
+    try:
+        if move is None:
+            game.resign_game()
+            return ACCEPTED
+        # No coordinate is spelled like an action
+        if move[0] == "make":
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                made = game.make_move(move[1], move[2])
+            # GessGame prints every failed check, CompactGessGame only the first, so the first reason is compared
+            return ACCEPTED if made else "make_move: " + output.getvalue().split("\n", 1)[0]
+        if move[0] == "unmake":
+            return ACCEPTED if game.unmake_move() else "nothing to take back"
+        if move[0] == "load":
+            game.load_snapshot(snapshot)
+            return ACCEPTED
+        return game.try_move(*move)
+    except Exception as error:
+        return type(error).__name__
+
+
+def describe(outcome):
+    """
+    Describe the outcome of an action for a report
+    :param outcome: rejection code, printed text or exception name from attempt()
+    :return: "ACCEPTED", the rejection message, the printed text or the exception name
+    :rtype: str
+    """
+    if outcome == ACCEPTED:
+        return "ACCEPTED"
+    if isinstance(outcome, int):
+        return REJECTION_MESSAGES[outcome]
+    if outcome.startswith("make_move: ") or outcome == "nothing to take back":
+        return outcome
+    return "raised " + outcome
+
+
+def compare_positions(snapshot, ring_counts, candidate, key=None, repetitions=None):
+    """
+    Compare the position of the candidate game against the reference snapshot
+    :param snapshot: tuple from get_snapshot() of the reference game
+    :param ring_counts: tuple of the reference game's black and white ring counts
+    :param candidate: game of the candidate backend
+    :param key: int hash of the snapshot from position_hash(), None to leave the hash unchecked
+    :param repetitions: int number of earlier positions of the journal equal to the snapshot, None to leave
+    count_repetitions() unchecked; it is also skipped for backends without it
+    :return: Divergence kind and the reference and candidate values, None if the positions match
+    :rtype: dict
+    """
+    other = candidate.get_snapshot()
+    if other[:2] != snapshot[:2]:
+        expected = {}
+        found = {}
+        for cell in sorted(set(stone_cells((snapshot[0] ^ other[0]) | (snapshot[1] ^ other[1])))):
+            square = coordinate(*CELL_AXES[cell])
+            expected[square] = stone_on(snapshot, cell)
+            found[square] = stone_on(other, cell)
+        return {"kind": "board", "reference": expected, "candidate": found}
+    if other[2] != snapshot[2]:
+        return {"kind": "turn", "reference": snapshot[2], "candidate": other[2]}
+    if other[3] != snapshot[3]:
+        return {"kind": "state", "reference": snapshot[3], "candidate": other[3]}
+    if tuple(candidate.get_ring_counts()) != tuple(ring_counts):
+        return {"kind": "rings", "reference": list(ring_counts), "candidate": list(candidate.get_ring_counts())}
+    if key is not None and candidate.get_hash() != key:
+        return {"kind": "hash", "reference": key, "candidate": candidate.get_hash()}
+    if repetitions is not None and hasattr(candidate, "count_repetitions") and \
+            candidate.count_repetitions() != repetitions:
+        return {"kind": "repetitions", "reference": repetitions, "candidate": candidate.count_repetitions()}
+    return None
+
+
+def compare_legal_moves(reference, candidate, timers):
+    """
+    Compare the full lists of legal moves of the two games
+    :param reference: reference game
+    :param candidate: game of the candidate backend
+    :param timers: list of seconds spent, updated in place: reference and candidate attempts, reference and candidate
+    legal move generation
+    :return: Divergence with up to five moves only one backend allows, None if the lists hold the same moves
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    expected = set(reference.generate_legal_moves())
+    middle = time.perf_counter()
+    found = set(candidate.generate_legal_moves())
+    timers[2] += middle - start
+    timers[3] += time.perf_counter() - middle
+    if expected == found:
+        return None
+    return {"kind": "legal_moves", "reference": sorted(expected - found)[:5], "candidate": sorted(found - expected)[:5]}
+
+
+class DifferentialGame:
+    """
+    Differential Game class that serves to do the following:
+    - Play every move attempt, take back and snapshot load on a reference game and a candidate game of the same
+      position
+    - Compare the outcome of each action, then the board, turn, state, rings, hash and repetition count of the
+      candidate after it, accepted or not, and every few accepted changes the full legal move lists
+    - Check the hash and repetition count of the reference game too, against a hash worked out from the snapshot and
+      a stack of earlier positions kept in step with the journal
+    - Time the attempts on each backend separately
+    """
+
+    def __init__(self, candidate_class, legal_every=0, timers=None):
+        """
+        Initialization method containing class data attributes:
+        :param candidate_class: GessGame, a backend subclass or CompactGessGame to test
+        :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+        :param timers: list of four seconds counters to add to, see compare_legal_moves()
+        :var self._reference - Reference game
+        :var self._candidate - Candidate game
+        :var self._legal_every - Accepted moves between legal move list comparisons
+        :var self._timers - Seconds spent on each backend
+        :var self._snapshot - Snapshot of the reference game
+        :var self._ring_counts - Ring counts of the reference game
+        :var self._history - List of the snapshots of the reference game after each accepted change, for load actions
+        :var self._key - Hash of the reference snapshot, worked out from scratch
+        :var self._positions - List of the hashes of the positions each change of the journal was made from, pushed
+        by moves and resignations, popped by take backs and cleared by loads
+        :var self._repetitions - Number of hashes in self._positions equal to self._key
+        :var self._accepted - Number of accepted attempts
+        :var self._legal_checks - Number of legal move list comparisons
+        :var self._outcomes - Dict of outcome description to the number of attempts that had it, showing which
+        checks the attempts reached
+        """
+        self._reference = REFERENCE()
+        self._candidate = candidate_class()
+        self._legal_every = legal_every
+        self._timers = timers if timers is not None else [0.0] * 4
+        self._snapshot = self._reference.get_snapshot()
+        self._ring_counts = self._reference.get_ring_counts()
+        self._history = [self._snapshot]
+        self._key = position_hash(self._snapshot)
+        self._positions = []
+        self._repetitions = 0
+        self._accepted = 0
+        self._legal_checks = 0
+        self._outcomes = {}
+
+    def get_snapshot(self):
+        """
+        Get method to return the snapshot of the reference game
+        :return: self._snapshot
+        :rtype: tuple
+        """
+        return self._snapshot
+
+    def get_counts(self):
+        """
+        Get method to return the number of accepted attempts and legal move list comparisons
+        :return: self._accepted, self._legal_checks
+        :rtype: tuple
+        """
+        return self._accepted, self._legal_checks
+
+    def get_outcomes(self):
+        """
+        Get method to return the number of attempts with each outcome
+        :return: self._outcomes
+        :rtype: dict
+        """
+        return self._outcomes
+
+    def step(self, move):
+        """
+        Method to carry out one action on both games and compare them. Where the reference game itself is wrong, the
+        divergence kind starts with "reference_" and its candidate value is the one of the reference game.
+        :param move: action from random_action()
+        :return: Divergence found, None if the games still match
+        :rtype: dict
+        """
+        snapshot = None
+        if move is not None and move[0] == "load":
+            snapshot = self._history[max(len(self._history) - 1 - move[1], 0)]
+        start = time.perf_counter()
+        expected = attempt(self._reference, move, snapshot)
+        middle = time.perf_counter()
+        found = attempt(self._candidate, move, snapshot)
+        self._timers[0] += middle - start
+        self._timers[1] += time.perf_counter() - middle
+        if expected != found:
+            return {"kind": "legality", "reference": describe(expected), "candidate": describe(found)}
+        outcome = describe(expected)
+        self._outcomes[outcome] = self._outcomes.get(outcome, 0) + 1
+
+        if expected == ACCEPTED:
+            self._accepted += 1
+            if move is not None and move[0] == "unmake":
+                self._positions.pop()
+            elif move is not None and move[0] == "load":
+                self._positions = []
+            else:
+                self._positions.append(self._key)
+            self._snapshot = self._reference.get_snapshot()
+            self._ring_counts = self._reference.get_ring_counts()
+            self._history.append(self._snapshot)
+            self._key = position_hash(self._snapshot)
+            self._repetitions = self._positions.count(self._key)
+        # Both backends could share a hashing or journal defect, so the reference is held to the values from scratch
+        divergence = compare_positions(self._snapshot, self._ring_counts, self._reference, self._key,
+                                       self._repetitions)
+        if divergence is not None:
+            divergence["kind"] = "reference_" + divergence["kind"]
+            return divergence
+        divergence = compare_positions(self._snapshot, self._ring_counts, self._candidate, self._key,
+                                       self._repetitions)
+        if divergence is None and expected == ACCEPTED and self._legal_every and \
+                self._accepted % self._legal_every == 0 and self._snapshot[3] == "UNFINISHED":
+            self._legal_checks += 1
+            divergence = compare_legal_moves(self._reference, self._candidate, self._timers)
+        return divergence
+
+
+def fuzz_sequence(candidate_class, seed, number, length, legal_every=0, timers=None, outcomes=None):
+    """
+    Play one seeded random sequence of actions on the reference and candidate games, until the actions run out, the
+    game is finished or the games diverge. Take backs are left out for candidates without unmake_move().
+    :param candidate_class: GessGame, a backend subclass or CompactGessGame to test
+    :param seed: int seed of the run
+    :param number: int number of the sequence in the run
+    :param length: int maximum number of move attempts
+    :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+    :param timers: list of four seconds counters to add to, see compare_legal_moves()
+    :param outcomes: dict of outcome description to count to add to, or None
+    :return: List of the actions taken, divergence or None, number accepted, number of legal move list comparisons
+    :rtype: tuple
+    """
+    rng = random.Random("%d:%d" % (seed, number))
+    game = DifferentialGame(candidate_class, legal_every, timers)
+    unmake = hasattr(candidate_class, "unmake_move")
+    moves = []
+    divergence = None
+    own_cells = all_cells = None
+    position = None
+    while len(moves) < length and game.get_snapshot()[3] == "UNFINISHED":
+        # Take backs and loads can return to another position of the same turn
+        if game.get_snapshot() is not position:
+            position = game.get_snapshot()
+            black, white, turn_count = position[:3]
+            own_cells = stone_cells(white if turn_count % 2 else black)
+            all_cells = stone_cells(black | white)
+        move = random_action(rng, own_cells, all_cells, unmake)
+        moves.append(move)
+        divergence = game.step(move)
+        if divergence is not None:
+            divergence["index"] = len(moves) - 1
+            break
+    accepted, legal_checks = game.get_counts()
+    if outcomes is not None:
+        for outcome, count in game.get_outcomes().items():
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+    return moves, divergence, accepted, legal_checks
+
+
+def replay_sequence(candidate_class, moves, legal_every=0):
+    """
+    Play a fixed sequence of actions on the reference and candidate games
+    :param candidate_class: GessGame, a backend subclass or CompactGessGame to test
+    :param moves: list of actions from random_action()
+    :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+    :return: First divergence, with the index of the attempt it followed, None if the games match throughout
+    :rtype: dict
+    """
+    game = DifferentialGame(candidate_class, legal_every)
+    for index, move in enumerate(moves):
+        divergence = game.step(move)
+        if divergence is not None:
+            divergence["index"] = index
+            return divergence
+    return None
+
+
+def minimize(candidate_class, moves, kind, legal_every=0):
+    """
+    Shrink a diverging sequence of move attempts by delta debugging: the attempts after the divergence are cut, then
+    ever smaller runs of attempts are dropped for as long as the games still diverge the same way.
+    :param candidate_class: GessGame, a backend subclass or CompactGessGame to test
+    :param moves: list of attempts ending in a divergence
+    :param kind: str kind of the divergence to keep
+    :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+    :return: Shortest sequence found and its divergence
+    :rtype: tuple
+    """
+    def diverges(trial):
+        divergence = replay_sequence(candidate_class, trial, legal_every)
+        if divergence is not None and divergence["kind"] == kind:
+            return divergence
+        return None
+
+    divergence = diverges(moves)
+    if divergence is None:
+        return moves, None
+    moves = moves[:divergence["index"] + 1]
+    size = max(len(moves) // 2, 1)
+    while True:
+        index = 0
+        while index < len(moves):
+            trial = moves[:index] + moves[index + size:]
+            found = diverges(trial) if trial else None
+            if found is not None:
+                moves = trial[:found["index"] + 1]
+                divergence = found
+            else:
+                index += size
+        if size == 1:
+            return moves, divergence
+        size //= 2
+
+
+def fuzz_chunk(candidate, seed, first, count, length, legal_every):
+    """
+    Executor entry point playing a run of consecutive sequences, stopping at the first that diverges.
+    :param candidate: str name of the candidate backend in CANDIDATES
+    :param seed: int seed of the run
+    :param first: int number of the first sequence
+    :param count: int number of sequences
+    :param length: int maximum number of move attempts per sequence
+    :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+    :return: Counts, outcome counts, seconds spent on each backend, and the first failure as its number, attempts and
+    divergence
+    :rtype: dict
+    """
+    candidate_class = CANDIDATES[candidate]
+    timers = [0.0] * 4
+    result = {"sequences": 0, "attempts": 0, "accepted": 0, "legal_checks": 0, "outcomes": {}, "failure": None}
+    for number in range(first, first + count):
+        moves, divergence, accepted, legal_checks = fuzz_sequence(candidate_class, seed, number, length, legal_every,
+                                                                  timers, result["outcomes"])
+        result["sequences"] += 1
+        result["attempts"] += len(moves)
+        result["accepted"] += accepted
+        result["legal_checks"] += legal_checks
+        if divergence is not None:
+            result["failure"] = {"number": number, "moves": moves, "divergence": divergence}
+            break
+    result["timers"] = timers
+    return result
+
+
+def run_fuzz(candidate, sequences, length=200, seed=1, workers=1, legal_every=0, minimize_failure=True):
+    """
+    Fuzz a candidate backend against the reference over a process pool, with no more than four chunks per worker
+    waiting. The run stops at the first divergence; the earliest diverging sequence among the chunks finished is
+    reported, minimized. Throughput is only compared when no divergence is found.
+    :param candidate: str name of the candidate backend in CANDIDATES
+    :param sequences: int number of sequences
+    :param length: int maximum number of move attempts per sequence
+    :param seed: int seed of the run
+    :param workers: int number of worker processes, 1 fuzzes in process
+    :param legal_every: int accepted moves between legal move list comparisons, 0 for none
+    :param minimize_failure: Boolean value True to minimize the diverging sequence
+    :return: Counts, outcome counts, elapsed seconds, attempts per second of each backend and the speedup, and the
+    first divergence
+    :rtype: dict
+    """
+    totals = {"sequences": 0, "attempts": 0, "accepted": 0, "legal_checks": 0}
+    outcomes = {}
+    timers = [0.0] * 4
+    failures = []
+    start = time.perf_counter()
+
+    def record(result):
+        for key in totals:
+            totals[key] += result[key]
+        for outcome, count in result["outcomes"].items():
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+        for index, seconds in enumerate(result["timers"]):
+            timers[index] += seconds
+        if result["failure"] is not None:
+            failures.append(result["failure"])
+
+    chunks = ((first, min(CHUNK_SIZE, sequences - first)) for first in range(0, sequences, CHUNK_SIZE))
+    arguments = (length, legal_every)
+    if workers == 1:
+        for first, count in chunks:
+            record(fuzz_chunk(candidate, seed, first, count, *arguments))
+            if failures:
+                break
+    else:
+        executor = ProcessPoolExecutor(workers)
+        pending = set()
+        try:
+            while not failures:
+                while len(pending) < workers * 4:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.add(executor.submit(fuzz_chunk, candidate, seed, chunk[0], chunk[1], *arguments))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+        finally:
+            executor.shutdown(cancel_futures=True)
+    elapsed = time.perf_counter() - start
+
+    result = dict(totals, candidate=candidate, seed=seed, elapsed_s=elapsed,
+                  sequences_per_second=totals["sequences"] / elapsed if elapsed else 0.0,
+                  outcomes=dict(sorted(outcomes.items(), key=lambda item: -item[1])))
+    result["reference_attempts_per_second"] = totals["attempts"] / timers[0] if timers[0] else 0.0
+    result["candidate_attempts_per_second"] = totals["attempts"] / timers[1] if timers[1] else 0.0
+    if timers[2] and timers[3]:
+        result["legal_move_speedup"] = timers[2] / timers[3]
+    result["divergence"] = None
+    if failures:
+        failure = min(failures, key=lambda found: found["number"])
+        moves = failure["moves"]
+        divergence = failure["divergence"]
+        report = {"sequence": failure["number"], "attempts": len(moves), "found": divergence}
+        if minimize_failure:
+            moves, divergence = minimize(CANDIDATES[candidate], moves, divergence["kind"], legal_every)
+            report["minimized"] = divergence
+        report["moves"] = [list(move) if move is not None else None for move in moves]
+        result["divergence"] = report
+    elif timers[1]:
+        result["speedup"] = timers[0] / timers[1]
+    return result
+
+
+def main(argv=None):
+    """
+    Command line entry point: fuzz each candidate backend against the reference and print the results as JSON.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status, 1 if a candidate diverged
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the Gess Game backends against GessGame.")
+    parser.add_argument("--candidate", choices=sorted(CANDIDATES), action="append",
+                        help="backend to fuzz, may be repeated; defaults to bitboard and compact")
+    parser.add_argument("--sequences", type=int, default=1000, help="random sequences per candidate")
+    parser.add_argument("--length", type=int, default=200, help="move attempts per sequence")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--legal-every", type=int, default=0,
+                        help="accepted moves between full legal move list comparisons, 0 for none")
+    parser.add_argument("--no-minimize", action="store_true", help="report diverging sequences as found")
+    arguments = parser.parse_args(argv)
+
+    status = 0
+    for candidate in arguments.candidate or ["bitboard", "compact"]:
+        result = run_fuzz(candidate, arguments.sequences, arguments.length, arguments.seed, arguments.workers,
+                          arguments.legal_every, not arguments.no_minimize)
+        print(json.dumps(result, indent=2))
+        if result["divergence"] is not None:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,268 @@
 # Description: Portfolio Project Gess Game. Mix of Go and Chess. Turn-based, 2 players.
 
 
+import json
+import random
+import time
+
+
+# Stages of make_move() timed by the profiling counters, in the order they run
+VALIDATION_PHASES = ("check_state", "convert_to_axes", "generate_piece_and_footprint", "verify_piece_choice_validity",
+                     "check_center", "check_direction", "check_obstruction", "check_ring_break")
+MOVE_PHASES = VALIDATION_PHASES + ("apply_move", "check_win")
+
+# Codes of the reasons a move is rejected, in the order make_move() checks them; 0 is an accepted move
+ACCEPTED = 0
+GAME_FINISHED = 1
+INVALID_CENTER_X = 2
+INVALID_NEW_CENTER_X = 3
+INVALID_Y = 4
+MIXED_PIECE = 5
+BLACK_TO_MOVE = 6
+WHITE_TO_MOVE = 7
+TOO_FAR = 8
+INVALID_DIRECTION = 9
+OBSTRUCTION = 10
+OWN_LAST_RING = 11
+
+# Message of each rejection code, as printed by reject()
+REJECTION_MESSAGES = (None, "GAME FINISHED", "INVALID X AXIS SELECTION FOR CENTER",
+                      "INVALID X AXIS SELECTION FOR NEW CENTER", "INVALID Y AXIS SELECTION",
+                      "INVALID PIECE SELECTION; STONES OF BOTH COLOR PRESENT", "NOT YOUR TURN; BLACK TO MAKE MOVE",
+                      "NOT YOUR TURN; WHITE TO MAKE MOVE", "CANNOT MOVE THAT FAR WITH SELECTED PIECE",
+                      "INVALID MOVE; MOVEMENT DIRECTION NOT SUPPORTED BY PIECE STRUCTURE", "INVALID MOVE; OBSTRUCTION",
+                      "CANNOT BREAK OWN ONLY EXISTING RING")
+REJECTION_CODES = {message: code for code, message in enumerate(REJECTION_MESSAGES) if message is not None}
+
+
+def empty_stats():
+    """
+    Build the profiling counters of a game with every count at zero
+    :return: Moves accepted and rejected, [calls, total seconds, maximum seconds] of each phase and rejection counts
+    :rtype: dict
+    """
+    return {"accepted": 0, "rejected": 0, "phases": {phase: [0, 0.0, 0.0] for phase in MOVE_PHASES},
+            "rejections": {}}
+
+
+def build_zobrist_keys(seed):
+    """
+    Generate the random 64 bit keys used to hash positions: one key per stone color for each of the 400 squares of
+    the game board, indexed by x * 20 + y - 1, and one key for white to move. A fixed seed keeps hashes identical
+    between runs so they can be stored.
+    :param seed: int seed of the random number generator
+    :return: Black keys, white keys, side to move key
+    :rtype: tuple
+    """
+    generator = random.Random(seed)
+    black = [generator.getrandbits(64) for _ in range(400)]
+    white = [generator.getrandbits(64) for _ in range(400)]
+    return black, white, generator.getrandbits(64)
+
+
+ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_WHITE_TO_MOVE = build_zobrist_keys(20200514)
+
+# Starting layout of the game board; row and column labels are stored alongside the stones for get_board()
+INITIAL_BOARD = [
+    ["a", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "---", "---", "---"],
+    ["b", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "-W-", "---", "---"],
+    ["c", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["d", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "-W-", "---", "---"],
+    ["e", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "---", "-W-", "---"],
+    ["f", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "---", "-W-", "---", "---"],
+    ["g", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "---", "-W-", "---"],
+    ["h", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["i", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["j", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["k", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["l", "---", "-B-", "---", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "-W-", "---", "-W-", "---"],
+    ["m", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["n", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "---", "-W-", "---"],
+    ["o", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "---", "-W-", "---", "---"],
+    ["p", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "-W-", "---", "-W-", "---"],
+    ["q", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "-W-", "---", "---"],
+    ["r", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
+     "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
+    ["s", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "-W-", "---", "---"],
+    ["t", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
+     "---", "---", "---", "---", "---", "---", "---"],
+    [" ", "-1-", "-2-", "-3-", "-4-", "-5-", "-6-", "-7-", "-8-", "-9-", "-10", "-11", "-12", "-13",
+     "-14", "-15", "-16",
+     "-17", "-18", "-19", "-20"]
+]
+
+# Letters of the x axis; rows a and t are borders and can never hold a piece center
+X_AXIS = "abcdefghijklmnopqrst"
+CENTER_ROWS = X_AXIS[1:19]
+
+# Steps from a piece center to each square of its footprint, in the order of GessGame._piece
+PIECE_COMPASS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 0), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def build_cell_tables():
+    """
+    Generate the lookup tables between alphanumeric coordinates and board squares. Squares are numbered by the flat
+    cell index x * 20 + y - 1 also used by the Zobrist keys.
+    :return: Dict of every coordinate "a1" to "t20" to its cell index, list of (x, y) board indexes by cell index
+    :rtype: tuple
+    """
+    cell_index = {}
+    cell_axes = []
+    for x in range(20):
+        for y in range(1, 21):
+            cell_index[X_AXIS[x] + str(y)] = len(cell_axes)
+            cell_axes.append((x, y))
+    return cell_index, cell_axes
+
+
+def build_footprints():
+    """
+    Generate the footprint of a piece centered on every cell: the nine (x, y) board indexes it covers, in the order of
+    PIECE_COMPASS.
+    :return: List of footprint tuples indexed by the cell index of the center
+    :rtype: list
+    """
+    footprints = []
+    for x, y in CELL_AXES:
+        footprints.append(tuple((x + x_step, y + y_step) for x_step, y_step in PIECE_COMPASS))
+    return footprints
+
+
+def build_sweeps():
+    """
+    Generate the squares a piece passes over on its way to a new center, for every piece center, direction and
+    distance of 2 or 3 squares: the footprints of each step short of the new center, less the squares of the piece
+    itself. These squares must be empty for the move not to be obstructed.
+    :return: Dict of (center cell index, orientation, distance) to a tuple of (x, y) board indexes
+    :rtype: dict
+    """
+    sweeps = {}
+    for center in range(len(CELL_AXES)):
+        x, y = CELL_AXES[center]
+        if not (0 < x < 19 and 0 < y < 20):
+            continue
+        for orientation in range(9):
+            x_step, y_step = PIECE_COMPASS[orientation]
+            if orientation == 4:
+                continue
+            for distance in (2, 3):
+                if not (0 <= x + x_step * distance < 20 and 0 < y + y_step * distance <= 20):
+                    continue
+                cells = []
+                for step in range(1, distance):
+                    for cell in FOOTPRINTS[CELL_INDEX[X_AXIS[x + x_step * step] + str(y + y_step * step)]]:
+                        if cell not in FOOTPRINTS[center] and cell not in cells:
+                            cells.append(cell)
+                sweeps[(center, orientation, distance)] = tuple(cells)
+    return sweeps
+
+
+CELL_INDEX, CELL_AXES = build_cell_tables()
+FOOTPRINTS = build_footprints()
+SWEEPS = build_sweeps()
+
+# A 3x3 window is coded in base 3, square k of PIECE_COMPASS order being digit k: 0 empty, 1 black, 2 white
+STONE_DIGITS = {"---": 0, "-B-": 1, "-W-": 2}
+DIGIT_STONES = ("---", "-B-", "-W-")
+PATTERN_COUNT = 3 ** 9
+
+# Furthest a piece may travel; check_center() caps every piece at 3 squares whether or not its center holds a stone
+MAX_RANGE = 3
+
+
+def build_pattern_tables():
+    """
+    Generate the facts about every possible 3x3 window that move validation and ring counting need, indexed by the
+    window's pattern code.
+    :return: Lists of the stones of each window in PIECE_COMPASS order, owner color ("-B-", "-W-" or None for an
+    empty or mixed window), whether both colors are present, bitmask of the orientations holding a stone, maximum
+    range and ring color ("-B-", "-W-" or None)
+    :rtype: tuple
+    """
+    stones = []
+    owners = []
+    mixed = []
+    directions = []
+    ranges = []
+    rings = []
+    for code in range(PATTERN_COUNT):
+        digits = []
+        remainder = code
+        for _ in range(9):
+            remainder, digit = divmod(remainder, 3)
+            digits.append(digit)
+        stones.append(tuple(DIGIT_STONES[digit] for digit in digits))
+
+        has_black = 1 in digits
+        has_white = 2 in digits
+        owner = None
+        if has_black and not has_white:
+            owner = "-B-"
+        if has_white and not has_black:
+            owner = "-W-"
+        owners.append(owner)
+        mixed.append(has_black and has_white)
+
+        allowed = 0
+        for orientation in range(9):
+            if digits[orientation]:
+                allowed |= 1 << orientation
+        directions.append(allowed)
+        ranges.append(MAX_RANGE)
+
+        # An empty center surrounded by eight stones of one color
+        ring = None
+        if digits[4] == 0 and digits.count(1) == 8:
+            ring = "-B-"
+        if digits[4] == 0 and digits.count(2) == 8:
+            ring = "-W-"
+        rings.append(ring)
+    return stones, owners, mixed, directions, ranges, rings
+
+
+def build_cell_windows():
+    """
+    Generate, for every cell, the windows whose pattern code changes when the cell does. Patterns are kept for the
+    windows that can be a piece: centers on rows b to s and columns 2 to 19, which include every ring center.
+    :return: List indexed by cell index of tuples of (window center cell index, weight of the cell in its code)
+    :rtype: list
+    """
+    windows = []
+    for x, y in CELL_AXES:
+        cell_windows = []
+        for position in range(9):
+            x_step, y_step = PIECE_COMPASS[position]
+            center_x = x - x_step
+            center_y = y - y_step
+            if 0 < center_x < 19 and 1 < center_y < 20:
+                cell_windows.append((center_x * 20 + center_y - 1, 3 ** position))
+        windows.append(tuple(cell_windows))
+    return windows
+
+
+PATTERN_STONES, PATTERN_OWNER, PATTERN_MIXED, PATTERN_DIRECTIONS, PATTERN_RANGE, PATTERN_RING = \
+    build_pattern_tables()
+CELL_WINDOWS = build_cell_windows()
+
+
 class GessGame:
     """
     Gess Game class that serves to do the following:
@@ -17,8 +279,8 @@ class GessGame:
     def __init__(self):
         """
         Initialization method containing class data attributes:
-        :var self._board - Game board that is altered through make_move() method by the players
-        :var self._ring_board - Unseen game board utilized to track number of rings on game board when move is made
+        :var self._board - Game board that is altered through make_move() method by the players, copied from
+        INITIAL_BOARD
         :var self._state - State of game initialized as "UNFINISHED" and change in game_state() method
         :var self._x_axis - Reference list of the x axis for indexing, used in make_move() and convert_to_axes()
         :var self._coord_x_old - Parsed user input of piece center x coordinate (letter coordinate) on board,
@@ -29,15 +291,13 @@ class GessGame:
         initiated as None
         :var self._coord_y_new - Parsed user input of new footprint center y coordinate (letter coordinate) on board
         initiated as None
-        :var self._footprint_old - Selected piece footprint, initiated as empty list
-        :var self._footprint_new - New footprint of piece at desired location, initiated as empty list
-        :var self._ring_corner_x - X-axis index of top-left corner of ring; used in check_ring() method
-        :var self._ring_corner_y - Y-axis index of top-left corner of ring; used in check_ring() method
-        :var self._ring_check - List used to create potential ring piece; verified if piece or not in check_ring()
-        :var self._move_x - X-axis index of top-left corner of 'moving' footprint, used to check for obstructions
-        :var self._move_y - Y-axis index of top-left corner of 'moving' footprint, used to check for obstructions
-        :var self._footpring_move - 'Movement' footprint used to check for movement obstruction between old and new
-        piece centers
+        :var self._footprint_old - Selected piece footprint, taken from FOOTPRINTS, initiated as empty tuple
+        :var self._footprint_new - New footprint of piece at desired location, initiated as empty tuple
+        :var self._patterns - Pattern code of the 3x3 window around every piece center, indexed by cell index and kept
+        up to date by put_stone(); used to look windows up in the PATTERN tables
+        :var self._pattern - Pattern code of the selected piece
+        :var self._center_old - Cell index of the selected piece center, used to look up its footprint and sweeps
+        :var self._center_new - Cell index of the new footprint center
         :var self._white_ring_count - Tracker for number of white rings present on game board
         :var self._black_ring_count - Tracker for number of black rings present on game board
         :var self._piece_compass - Reference list for movement orientation based on stone presence in piece
@@ -46,96 +306,24 @@ class GessGame:
         the piece is permitted by checking stone placement in piece, initiated as None
         :var self._turn_count - Initiated as zero, used to keep track of turns and ergo which player is allowed to move
         :var self._termination_trigger - Trigger variable initialized as False used to stop make_move() method
+        :var self._rejection - Code of the first check the last move failed, ACCEPTED if it was made; see
+        REJECTION_MESSAGES
+        :var self._black_rings - Ring index; set of (x, y) centers of every black ring on the game board, kept up to
+        date by update_ring_index() after each move
+        :var self._white_rings - Ring index; set of (x, y) centers of every white ring on the game board
+        :var self._changes - Cells and ring index entries changed by the move being applied, as recorded by
+        set_stone() and update_ring_index()
+        :var self._journal - Stack of the changes, state, turn count and hash before every accepted move or
+        resignation, used by unmake_move() to take them back and by count_repetitions()
+        :var self._quiet - Set while generate_legal_moves() probes moves so rejections are not printed
+        :var self._hash - Zobrist hash of the stones on the game board and the player to move, updated by set_stone()
+        and make_move()
+        :var self._stats - Profiling counters, None unless turned on by enable_stats(): moves accepted and rejected,
+        [calls, total seconds, maximum seconds] of each phase of make_move() and a count of each rejection reason
+        :var self._subscribers - (callback, raw) pairs given the delta of every change to the position, see subscribe()
+        :var self._snapshot_cache - Serialized full position from get_serialized_snapshot(), None when stale
         """
-        self._board = [["a", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "---", "---", "---"],
-                       ["b", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "-W-", "---", "---"],
-                       ["c", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["d", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "-W-", "---", "---"],
-                       ["e", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "---", "-W-", "---"],
-                       ["f", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "---", "-W-", "---", "---"],
-                       ["g", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "---", "-W-", "---"],
-                       ["h", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["i", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["j", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["k", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["l", "---", "-B-", "---", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "-W-", "---", "-W-", "---"],
-                       ["m", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["n", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "---", "-W-", "---"],
-                       ["o", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "---", "-W-", "---", "---"],
-                       ["p", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "-W-", "---", "-W-", "---"],
-                       ["q", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "-W-", "---", "---"],
-                       ["r", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-                        "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-                       ["s", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "-W-", "---", "---"],
-                       ["t", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-                        "---", "---", "---", "---", "---", "---", "---"],
-                       [" ", "-1-", "-2-", "-3-", "-4-", "-5-", "-6-", "-7-", "-8-", "-9-", "-10", "-11", "-12", "-13",
-                        "-14", "-15", "-16",
-                        "-17", "-18", "-19", "-20"]
-                       ]
-        self._ring_board = [
-            ["a", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "---", "---", "---"],
-            ["b", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "-W-", "---", "---"],
-            ["c", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["d", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "-W-", "---", "---"],
-            ["e", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "---", "-W-", "---"],
-            ["f", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "---", "-W-", "---", "---"],
-            ["g", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "---", "-W-", "---"],
-            ["h", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["i", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["j", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["k", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["l", "---", "-B-", "---", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "-W-", "---", "-W-", "---"],
-            ["m", "---", "-B-", "-B-", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["n", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "---", "-W-", "---"],
-            ["o", "---", "---", "-B-", "---", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "---", "-W-", "---", "---"],
-            ["p", "---", "-B-", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "-W-", "---", "-W-", "---"],
-            ["q", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "-W-", "---", "---"],
-            ["r", "---", "-B-", "-B-", "-B-", "---", "---", "-B-", "---", "---", "---", "---", "---", "---",
-             "-W-", "---", "---", "-W-", "-W-", "-W-", "---"],
-            ["s", "---", "---", "-B-", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "-W-", "---", "---"],
-            ["t", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---", "---",
-             "---", "---", "---", "---", "---", "---", "---"],
-            [" ", "-1-", "-2-", "-3-", "-4-", "-5-", "-6-", "-7-", "-8-", "-9-", "-10", "-11", "-12", "-13",
-             "-14", "-15", "-16",
-             "-17", "-18", "-19", "-20"]
-            ]
+        self._board = [list(row) for row in INITIAL_BOARD]
         self._state = "UNFINISHED"
         self._x_axis = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q", "r", "s",
                         "t"]
@@ -143,21 +331,32 @@ class GessGame:
         self._coord_x_new = None
         self._coord_y_old = None
         self._coord_y_new = None
-        self._ring_corner_x = None
-        self._ring_corner_y = None
-        self._move_x = None
-        self._move_y = None
+        self._center_old = None
+        self._center_new = None
         self._white_ring_count = 1
         self._black_ring_count = 1
-        self._footprint_move = []
-        self._footprint_old = []
-        self._footprint_new = []
-        self._ring_check = []
+        self._footprint_old = ()
+        self._footprint_new = ()
+        self._patterns = None
+        self._pattern = 0
         self._piece_compass = [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 0], [0, 1], [1, -1], [1, 0], [1, 1]]
         self._piece = []
         self._orientation = None
         self._turn_count = 0
         self._termination_trigger = False
+        self._rejection = ACCEPTED
+        self._black_rings = set()
+        self._white_rings = set()
+        self._changes = None
+        self._journal = []
+        self._quiet = False
+        self._hash = 0
+        self._stats = None
+        self._subscribers = []
+        self._snapshot_cache = None
+        self.build_patterns()
+        self.build_ring_index()
+        self.build_hash()
 
     def get_game_state(self):
         """
@@ -201,6 +400,179 @@ class GessGame:
         """
         return self._orientation
 
+    def get_hash(self):
+        """
+        Get method to return the Zobrist hash of the position
+        :return: self._hash
+        :rtype: int
+        """
+        return self._hash
+
+    def get_rejection(self):
+        """
+        Get method to return the code of the first check the last move failed
+        :return: self._rejection, ACCEPTED if the move was made
+        :rtype: int
+        """
+        return self._rejection
+
+    def count_repetitions(self):
+        """
+        Method to count how many earlier positions of the game, as recorded in the journal, had the same stones and
+        player to move as the current one.
+        :return: Number of earlier occurrences of the position
+        :rtype: int
+        """
+        count = 0
+        for entry in self._journal:
+            if entry[3] == self._hash:
+                count += 1
+        return count
+
+    def enable_stats(self, enabled=True):
+        """
+        Method to turn the profiling counters of make_move() on or off. Turning them on starts from zero; turning them
+        off discards them, leaving make_move() with a single check of the cost.
+        :param enabled: Boolean value True to record counters
+        :return: No return.
+        """
+        self._stats = None
+        if enabled:
+            self._stats = empty_stats()
+
+    def reset_stats(self):
+        """
+        Method to set the profiling counters back to zero, if they are turned on.
+        :return: No return.
+        """
+        if self._stats is not None:
+            self._stats = empty_stats()
+
+    def get_stats(self):
+        """
+        Get method to return a snapshot of the profiling counters
+        :return: Moves accepted and rejected, calls, total milliseconds and maximum milliseconds of each phase of
+        make_move() and the number of times each rejection reason fired; None if the counters are off
+        :rtype: dict
+        """
+        if self._stats is None:
+            return None
+        phases = {}
+        for phase, (calls, total, longest) in self._stats["phases"].items():
+            phases[phase] = {"calls": calls, "total_ms": total * 1000, "max_ms": longest * 1000}
+        return {"accepted": self._stats["accepted"], "rejected": self._stats["rejected"], "phases": phases,
+                "rejections": dict(self._stats["rejections"])}
+
+    def count_rejection(self, message):
+        """
+        Support method adding a rejection reason to the profiling counters. Moves probed quietly by
+        generate_legal_moves() are not counted.
+        :param message: str reason the move is rejected
+        :return: No return.
+        """
+        if self._stats is not None and not self._quiet:
+            rejections = self._stats["rejections"]
+            rejections[message] = rejections.get(message, 0) + 1
+
+    def get_snapshot(self):
+        """
+        Get method to return a compact copy of the position that can be sent between processes cheaply: one integer
+        bitmask per stone color, bit x * 20 + y - 1 standing for the square at x, y, along with the turn count and
+        game state.
+        :return: Black stones, white stones, turn count, game state
+        :rtype: tuple
+        """
+        black = 0
+        white = 0
+        for x in range(20):
+            for y in range(1, 21):
+                if self._board[x][y] == "-B-":
+                    black |= 1 << (x * 20 + y - 1)
+                elif self._board[x][y] == "-W-":
+                    white |= 1 << (x * 20 + y - 1)
+        return black, white, self._turn_count, self._state
+
+    def load_snapshot(self, snapshot):
+        """
+        Method to set up the position of a snapshot from get_snapshot(). The journal is cleared, so moves made before
+        the snapshot cannot be taken back.
+        :param snapshot: tuple returned by get_snapshot()
+        :return: No return.
+        """
+        black, white, self._turn_count, self._state = snapshot
+        for x in range(20):
+            self._board[x][0] = self._x_axis[x]
+            for y in range(1, 21):
+                if black >> (x * 20 + y - 1) & 1:
+                    self._board[x][y] = "-B-"
+                elif white >> (x * 20 + y - 1) & 1:
+                    self._board[x][y] = "-W-"
+                else:
+                    self._board[x][y] = "---"
+        self._journal = []
+        self.build_patterns()
+        self.build_ring_index()
+        self.build_hash()
+        self.count_rings()
+        self._snapshot_cache = None
+        if self._subscribers:
+            self.publish(range(400))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Method to create a game set up with the position of a snapshot from get_snapshot().
+        :param snapshot: tuple returned by get_snapshot()
+        :return: New game
+        :rtype: GessGame
+        """
+        game = cls()
+        game.load_snapshot(snapshot)
+        return game
+
+    def get_stone(self, x, y):
+        """
+        Get method to return the contents of a square
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :return: "-B-", "-W-" or "---"
+        :rtype: str
+        """
+        return self._board[x][y]
+
+    def get_stone_counts(self):
+        """
+        Get method to return the number of stones of each color on the game board
+        :return: Number of black stones, number of white stones
+        :rtype: tuple
+        """
+        black = 0
+        white = 0
+        for row in self._board[:20]:
+            black += row.count("-B-")
+            white += row.count("-W-")
+        return black, white
+
+    def get_ring_counts(self):
+        """
+        Get method to return the number of rings of each color, read from the ring index
+        :return: Number of black rings, number of white rings
+        :rtype: tuple
+        """
+        return len(self._black_rings), len(self._white_rings)
+
+    def get_ring_centers(self):
+        """
+        Get method to return the centers of the rings on the game board
+        :return: Alphanumeric centers of black rings
+        :rtype: list
+        :return: Alphanumeric centers of white rings
+        :rtype: list
+        """
+        black = sorted(self._x_axis[x] + str(y) for x, y in self._black_rings)
+        white = sorted(self._x_axis[x] + str(y) for x, y in self._white_rings)
+        return black, white
+
     def get_board(self):
         """
         Get method used to return gameboard
@@ -212,13 +584,103 @@ class GessGame:
 
     def get_ring_board(self):
         """
-        Get method used to return gameboard
-        :return: self._ring_board
+        Get method used to return gameboard; rings are counted on the game board itself so there is no separate ring
+        board to show
+        :return: self._board
         :rtype: Print-out of list of list
         """
         for i in self._board:
             print(' '.join(i))
 
+    def subscribe(self, callback, raw=False):
+        """
+        Method to register a spectator. After every accepted move, resignation, unmade move or loaded snapshot the
+        callback is given the change as a JSON string, serialized once for all subscribers:
+        {"turn_count": int, "state": str, "cells": [[cell index, digit], ...]} listing only the squares that changed,
+        digits being those of STONE_DIGITS. Spectators start from get_serialized_snapshot().
+        :param callback: callable taking one argument
+        :param raw: Boolean value True to be given the change as the dict itself, unserialized; it is shared between
+        subscribers and must not be modified
+        :return: No return.
+        """
+        self._subscribers.append((callback, raw))
+
+    def unsubscribe(self, callback):
+        """
+        Method to remove a spectator registered with subscribe().
+        :param callback: callable passed to subscribe()
+        :return: No return.
+        """
+        self._subscribers = [entry for entry in self._subscribers if entry[0] != callback]
+
+    def get_serialized_snapshot(self):
+        """
+        Get method to return the whole position as a JSON string for spectators joining the game:
+        {"turn_count": int, "state": str, "cells": str} with one STONE_DIGITS digit per cell in cell index order. The
+        string is cached until the position changes.
+        :return: self._snapshot_cache
+        :rtype: str
+        """
+        if self._snapshot_cache is None:
+            black, white, turn_count, state = self.get_snapshot()
+            digits = []
+            for cell in range(400):
+                digits.append(str((black >> cell & 1) + 2 * (white >> cell & 1)))
+            self._snapshot_cache = json.dumps({"turn_count": turn_count, "state": state, "cells": "".join(digits)})
+        return self._snapshot_cache
+
+    def changed_cells(self, changes):
+        """
+        Support method listing the cells whose stone differs between the board before a move and the current board,
+        from the changes recorded by apply_move(). Squares changed and then changed back, such as footprint squares
+        cleared by border_scrubber(), are left out.
+        :param changes: tuple returned by apply_move()
+        :return: Cell indexes of the changed squares
+        :rtype: list
+        """
+        before = {}
+        for x, y, stone in changes[0]:
+            if y > 0 and (x, y) not in before:
+                before[(x, y)] = stone
+        cells = []
+        for (x, y), stone in before.items():
+            if self._board[x][y] != stone:
+                cells.append(x * 20 + y - 1)
+        return cells
+
+    def publish(self, cells):
+        """
+        Support method sending the delta of the given cells to every subscriber, serialized at most once.
+        :param cells: iterable of cell indexes that changed
+        :return: No return.
+        """
+        delta = []
+        for cell in cells:
+            x, y = CELL_AXES[cell]
+            delta.append([cell, STONE_DIGITS[self.get_stone(x, y)]])
+        change = {"turn_count": self._turn_count, "state": self._state, "cells": delta}
+        message = None
+        for callback, raw in list(self._subscribers):
+            if raw:
+                callback(change)
+                continue
+            if message is None:
+                message = json.dumps(change)
+            callback(message)
+
+    def reject(self, message):
+        """
+        Support method used by the validation methods to stop make_move() and report why the move is not allowed.
+        :param message: str reason the move is rejected
+        :return: No return.
+        """
+        self._termination_trigger = True
+        if self._rejection == ACCEPTED:
+            self._rejection = REJECTION_CODES[message]
+        self.count_rejection(message)
+        if not self._quiet:
+            print(message)
+
     def check_state(self):
         """
         Method to verify that the game has not yet been won and making a move is allowable.
@@ -226,6 +688,8 @@ class GessGame:
         """
         if self._state != "UNFINISHED":
             self._termination_trigger = True
+            self._rejection = GAME_FINISHED
+            self.count_rejection("GAME FINISHED")
 
     def convert_to_axes(self, centr, new_centr):
         """
@@ -236,84 +700,49 @@ class GessGame:
         placed
         :return: No return. Incorrect input return handled in make_move() termination_trigger check.
         """
-        # Deconstruct centr letter coordinate and number coordinate
-        coord_old = list(str(centr))
-        coord_new = list(str(new_centr))
-
-        # Check if 1st element is letter and in bounds
-        if coord_old[0] in self._x_axis:
-            if coord_old[0] != "a" and coord_old[0] != "t":
-                self._coord_x_old = self._x_axis.index(coord_old[0])
-        else:
-            self._termination_trigger = True
-            return print("INVALID X AXIS SELECTION FOR CENTER")
+        centr = str(centr)
+        new_centr = str(new_centr)
 
-        if coord_new[0] in self._x_axis:
-            if coord_new[0] != "a" and coord_new[0] != "t":
-                self._coord_x_new = self._x_axis.index(coord_new[0])
-        else:
-            self._termination_trigger = True
-            return print("INVALID X AXIS SELECTION FOR NEW CENTER")
+        # Check if 1st element is letter and in bounds; rows a and t are borders and cannot hold a center
+        if centr[:1] not in CENTER_ROWS:
+            return self.reject("INVALID X AXIS SELECTION FOR CENTER")
 
-        # Check if 2nd element (number) is one or two digits
-        self._coord_y_old = []
-        self._coord_y_new = []
-        if len(coord_old) > 2:
-            self._coord_y_old = [''.join(coord_old[1:3])]
-        else:
-            self._coord_y_old.append(coord_old[-1])
+        if new_centr[:1] not in CENTER_ROWS:
+            return self.reject("INVALID X AXIS SELECTION FOR NEW CENTER")
 
-        if len(coord_new) > 2:
-            self._coord_y_new = [''.join(coord_new[1:3])]
-        else:
-            self._coord_y_new.append(coord_new[-1])
+        # Look the coordinates up; anything other than a letter followed by a number from 1 to 20 is not a square
+        cell_old = CELL_INDEX.get(centr)
+        cell_new = CELL_INDEX.get(new_centr)
 
         # Check bounds
-        if not 1 < int(self._coord_y_old[-1]) < 20:
-            self._termination_trigger = True
-            return print("INVALID Y AXIS SELECTION")
+        if cell_old is None or not 1 < CELL_AXES[cell_old][1] < 20:
+            return self.reject("INVALID Y AXIS SELECTION")
+
+        # New footprint is placed on the game board to check ring breaks, so its center must stay within columns 1 to
+        # 19; beyond them the footprint would index past the board or wrap around to the opposite edge
+        if cell_new is None or not 0 < CELL_AXES[cell_new][1] < 20:
+            return self.reject("INVALID Y AXIS SELECTION")
 
-        # Convert str to int
-        self._coord_y_old = int(self._coord_y_old[-1])
-        self._coord_y_new = int(self._coord_y_new[-1])
+        self._coord_x_old, self._coord_y_old = CELL_AXES[cell_old]
+        self._coord_x_new, self._coord_y_new = CELL_AXES[cell_new]
 
     def generate_piece_and_footprint(self):
         """
         Support method for make_move()to generate the old and new footprints to act as current and next piece locations,
-        along with generating the piece itself in terms of its elements (stones, empty spaces)
+        along with generating the piece itself in terms of its elements (stones, empty spaces). Footprints are read from
+        the FOOTPRINTS table and the piece from the pattern of its window.
         :return: No return.
         """
 
-        # Footprint of gameboard indexes from first input coordinates of current piece center
-        self._footprint_old = [[self._coord_x_old - 1, self._coord_y_old - 1],
-                               [self._coord_x_old - 1, self._coord_y_old],
-                               [self._coord_x_old - 1, self._coord_y_old + 1],
-                               [self._coord_x_old, self._coord_y_old - 1], [self._coord_x_old, self._coord_y_old],
-                               [self._coord_x_old, self._coord_y_old + 1],
-                               [self._coord_x_old + 1, self._coord_y_old - 1],
-                               [self._coord_x_old + 1, self._coord_y_old],
-                               [self._coord_x_old + 1, self._coord_y_old + 1]]
-
-        # Footprint of gameboard indexes from second input coordinates of new center
-        self._footprint_new = [[self._coord_x_new - 1, self._coord_y_new - 1],
-                               [self._coord_x_new - 1, self._coord_y_new],
-                               [self._coord_x_new - 1, self._coord_y_new + 1],
-                               [self._coord_x_new, self._coord_y_new - 1], [self._coord_x_new, self._coord_y_new],
-                               [self._coord_x_new, self._coord_y_new + 1],
-                               [self._coord_x_new + 1, self._coord_y_new - 1],
-                               [self._coord_x_new + 1, self._coord_y_new],
-                               [self._coord_x_new + 1, self._coord_y_new + 1]]
-
-        # Formulate piece to be moved
-        self._piece = [self._board[self._coord_x_old - 1][self._coord_y_old - 1],
-                       self._board[self._coord_x_old - 1][self._coord_y_old],
-                       self._board[self._coord_x_old - 1][self._coord_y_old + 1],
-                       self._board[self._coord_x_old][self._coord_y_old - 1],
-                       self._board[self._coord_x_old][self._coord_y_old],
-                       self._board[self._coord_x_old][self._coord_y_old + 1],
-                       self._board[self._coord_x_old + 1][self._coord_y_old - 1],
-                       self._board[self._coord_x_old + 1][self._coord_y_old],
-                       self._board[self._coord_x_old + 1][self._coord_y_old + 1]]
+        # Footprints of gameboard indexes around the current piece center and the new center
+        self._center_old = self._coord_x_old * 20 + self._coord_y_old - 1
+        self._center_new = self._coord_x_new * 20 + self._coord_y_new - 1
+        self._footprint_old = FOOTPRINTS[self._center_old]
+        self._footprint_new = FOOTPRINTS[self._center_new]
+
+        # Formulate piece to be moved from the pattern of its window
+        self._pattern = self._patterns[self._center_old]
+        self._piece = PATTERN_STONES[self._pattern]
 
     def verify_piece_choice_validity(self):
         """
@@ -322,100 +751,77 @@ class GessGame:
         in make_move() termination_trigger check.
         """
         # Check for color singularity
-        if "-B-" in self._piece and "-W-" in self._piece:
-            self._termination_trigger = True
-            return print("INVALID PIECE SELECTION; STONES OF BOTH COLOR PRESENT")
+        if PATTERN_MIXED[self._pattern]:
+            return self.reject("INVALID PIECE SELECTION; STONES OF BOTH COLOR PRESENT")
 
         # Verify the chosen piece belongs to the player who's turn it is
         if (self._turn_count % 2) == 0 or self._turn_count == 0:
-            if "-W-" in self._piece:
-                self._termination_trigger = True
-                return print("NOT YOUR TURN; BLACK TO MAKE MOVE")
+            if PATTERN_OWNER[self._pattern] == "-W-":
+                return self.reject("NOT YOUR TURN; BLACK TO MAKE MOVE")
         else:
-            if "-B-" in self._piece:
-                self._termination_trigger = True
-                return print("NOT YOUR TURN; WHITE TO MAKE MOVE")
+            if PATTERN_OWNER[self._pattern] == "-B-":
+                return self.reject("NOT YOUR TURN; WHITE TO MAKE MOVE")
 
     def check_ring_break(self):
         """
         Method to verify that if ring break is occuring, that it is not the last ring the player has on the board.
-        This is done by executing the proposed move on the test board titled ring_board, and then counting the number
-        of rings remaining for each player after execution. Player can break other players ring but not their own from
-        making their move.
+        This is done by applying the proposed move to the game board, reading the number of rings remaining for each
+        player from the ring index and then taking the move back. Player can break other players ring but not their own
+        from making their move.
         :return: No return.
         """
-        # Perform Move On Test Board
-        count = 0
-        for _ in self._footprint_new:
-            self._ring_board[self._footprint_new[count][0]][self._footprint_new[count][1]] = self._piece[count]
-            # If there's overlap, place new footprint in that area; if not, then 'put' (more apt to say 'leave')
-            # old footprint
-            if self._footprint_old[count] in self._footprint_new:
-                self._ring_board[self._footprint_new[count][0]][self._footprint_new[count][1]] = self._piece[count]
-            else:
-                self._ring_board[self._footprint_old[count][0]][self._footprint_old[count][1]] = "---"
-            count += 1
+        # A move already rejected is not tried on the game board
+        if self._termination_trigger is True:
+            return
 
-        # Recount Rings; if they're at zero, do not allow move
-        self._black_ring_count = 0
-        self._white_ring_count = 0
-        for y in range(2, 18):
-            self._ring_corner_y = y
-
-            # X is x-axis; Letter
-            for x in range(1, 17):
-                self._ring_corner_x = x
-
-                # Generate temporary piece
-                self._ring_check = [self._ring_board[self._ring_corner_x][self._ring_corner_y],
-                                    self._ring_board[self._ring_corner_x][self._ring_corner_y + 1],
-                                    self._ring_board[self._ring_corner_x][self._ring_corner_y + 2],
-                                    self._ring_board[self._ring_corner_x + 1][self._ring_corner_y],
-                                    self._ring_board[self._ring_corner_x + 1][self._ring_corner_y + 1],
-                                    self._ring_board[self._ring_corner_x + 1][self._ring_corner_y + 2],
-                                    self._ring_board[self._ring_corner_x + 2][self._ring_corner_y],
-                                    self._ring_board[self._ring_corner_x + 2][self._ring_corner_y + 1],
-                                    self._ring_board[self._ring_corner_x + 2][self._ring_corner_y + 2]]
-
-                # Check if temporary piece can be classified as a ring and of what color, and add to tally
-                if self._ring_check.count("-B-") == 8 and self._ring_check[4] == "---":
-                    self._black_ring_count += 1
-
-                if self._ring_check.count("-W-") == 8 and self._ring_check[4] == "---":
-                    self._white_ring_count += 1
+        # Apply move, recount rings and undo; if they're at zero, do not allow move
+        changes = self.apply_move()
+        self.count_rings()
+        self.revert_move(changes)
 
         # Make sure ring being broken is the player's whose turn it is to allow offensive ring break of opponent
         if (self._turn_count % 2) == 0 or self._turn_count == 0:
             if self._black_ring_count == 0:
-                self._termination_trigger = True
-                return print("CANNOT BREAK OWN ONLY EXISTING RING")
+                return self.reject("CANNOT BREAK OWN ONLY EXISTING RING")
         else:
             if self._white_ring_count == 0:
-                self._termination_trigger = True
-                return print("CANNOT BREAK OWN ONLY EXISTING RING")
+                return self.reject("CANNOT BREAK OWN ONLY EXISTING RING")
 
     def check_center(self):
         """
-        Verifies whether movement larger than a maximum of 3 spaces can be made by checking center square contents
+        Verifies whether movement larger than the maximum range of the piece, read from its pattern, is attempted
         :return: No return.
         """
         x_diff = self._coord_x_new - self._coord_x_old
         y_diff = self._coord_y_new - self._coord_y_old
 
-        # Must have center piece occupied to move more than 3 squares
-        if abs(x_diff) > 3 or abs(y_diff) > 3:
-            # Player making turn already checked so color does not matter at this point
-            if "-B-" or "-W-" not in self._piece[4]:
-                self._termination_trigger = True
-                return print("CANNOT MOVE THAT FAR WITH SELECTED PIECE")
+        # Check the distance against the maximum range of the piece pattern
+        max_range = PATTERN_RANGE[self._pattern]
+        if abs(x_diff) > max_range or abs(y_diff) > max_range:
+            return self.reject("CANNOT MOVE THAT FAR WITH SELECTED PIECE")
 
     def check_direction(self):
         """
         Interpret direction of movement based on position of old and new center coordinates and verify it's validity.
         :return: No return.
         """
+        self.find_orientation()
+
+        # Verify that the move follows one of the compass directions and that the piece square corresponding with
+        # direction of movement is indeed occupied
+        if self._orientation is None or not PATTERN_DIRECTIONS[self._pattern] >> self._orientation & 1:
+            return self.reject("INVALID MOVE; MOVEMENT DIRECTION NOT SUPPORTED BY PIECE STRUCTURE")
+
+    def find_orientation(self):
+        """
+        Support method for check_direction() that interprets the direction of movement from the old and new center
+        coordinates and stores it as an index into self._piece_compass. Moves that do not follow a compass direction
+        leave the orientation as None.
+        :return: No return.
+        """
         x_diff = self._coord_x_new - self._coord_x_old
         y_diff = self._coord_y_new - self._coord_y_old
+        self._orientation = None
 
         # Check if direction of movement of chosen piece is valid
         if 0 <= abs(x_diff) <= 1 and 0 <= abs(y_diff) <= 1:
@@ -442,91 +848,117 @@ class GessGame:
                 y_diff -= 2
             if y_diff == -3:
                 y_diff += 2
-            m = self._piece_compass.index([x_diff, y_diff])
             self._orientation = self._piece_compass.index([x_diff, y_diff])
 
-        # Verify that piece square corresponding with direction of movement is indeed occupied
-        u = self._piece[self._orientation]
-        if self._piece[self._orientation] == "---":
-            self._termination_trigger = True
-            return print("INVALID MOVE; MOVEMENT DIRECTION NOT SUPPORTED BY PIECE STRUCTURE")
-
     def check_obstruction(self):
         """
-        Method to verify unobstructed travel for piece from old center coordinates to new center coordinates.
+        Method to verify unobstructed travel for piece from old center coordinates to new center coordinates, reading
+        the squares to check from the SWEEPS table.
         :return: No return.
         """
         x_diff = self._coord_x_new - self._coord_x_old
         y_diff = self._coord_y_new - self._coord_y_old
 
         # Check travel distance; Travel distance of one by the center should not be impacted by obstruction as piece
-        # capture will occur
-        if abs(x_diff > 1) or abs(y_diff > 1):
-            # Initialize origin of movement
-            self._move_x = self._coord_x_old
-            self._move_y = self._coord_y_old
-
-            # Verify and create center coordinates of the new temporary footprint_move which will incrementally shift
-            # in the desired direction away from the footprint_old towards footprint_new
-            for i in range(1, abs(x_diff) + 1):
-                if self._orientation == 0:
-                    self._move_x = self._move_x - 1
-                    self._move_y = self._move_y - 1
-
-                if self._orientation == 1:
-                    self._move_x = self._move_x - 1
-                    self._move_y = self._move_y
-
-                if self._orientation == 2:
-                    self._move_x = self._move_x - 1
-                    self._move_y = self._move_y + 1
-
-                if self._orientation == 3:
-                    self._move_x = self._move_x
-                    self._move_y = self._move_y - 1
-
-                if self._orientation == 5:
-                    self._move_x = self._move_x
-                    self._move_y = self._move_y + 1
-
-                if self._orientation == 6:
-                    self._move_x = self._move_x + 1
-                    self._move_y = self._move_y - 1
-
-                if self._orientation == 7:
-                    self._move_x = self._move_x + 1
-                    self._move_y = self._move_y
-
-                if self._orientation == 8:
-                    self._move_x = self._move_x + 1
-                    self._move_y = self._move_y + 1
-
-                # Generate new temporary footprint
-                self._footprint_move = [[self._move_x - 1, self._move_y - 1],
-                                        [self._move_x - 1, self._move_y],
-                                        [self._move_x - 1, self._move_y + 1],
-                                        [self._move_x, self._move_y - 1], [self._move_x, self._move_y],
-                                        [self._move_x, self._move_y + 1],
-                                        [self._move_x + 1, self._move_y - 1],
-                                        [self._move_x + 1, self._move_y],
-                                        [self._move_x + 1, self._move_y + 1]]
-
-                # Check if there are stones in the path of the piece
-                count = 0
-                for _ in self._footprint_move:
-                    # Do not count overlaps between the temporary piece and the chosen piece to be moved
-                    if self._footprint_move[count] not in self._footprint_old:
-                        # Check if stones are present
-                        if self._board[self._footprint_move[count][0]][self._footprint_move[count][1]] != "---":
-                            # Check if temporary footprint arrived at new footprint by comparing centers;
-                            # If it has, the piece only traveled a distance of one square and therefore captured stones
-                            # rather than having any in its path
-                            # If not, this means that, given the direction of travel, there are stones in the path
-                            # of the piece to the declared new center location; invalidate the move
-                            if self._footprint_move[4] != self._footprint_new[4]:
-                                self._termination_trigger = True
-                                return print("INVALID MOVE; OBSTRUCTION")
-                    count += 1
+        # capture will occur. The piece steps abs(x_diff) times, so moves along the y axis are never swept
+        if self._orientation is not None and (x_diff > 1 or y_diff > 1) and x_diff != 0:
+            # Check if there are stones in the path of the piece, outside the chosen piece itself and short of the new
+            # footprint, where arriving stones are captured rather than blocking the piece
+            board = self._board
+            for x, y in SWEEPS[(self._center_old, self._orientation, abs(x_diff))]:
+                if board[x][y] != "---":
+                    return self.reject("INVALID MOVE; OBSTRUCTION")
+
+    def set_stone(self, x, y, stone):
+        """
+        Support method to place a stone, or "---" for an empty square, on the game board. The previous contents are
+        recorded in self._changes when they differ so the change can be taken back, and the hash is updated.
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :param stone: str "-B-", "-W-" or "---"
+        :return: No return.
+        """
+        if self._board[x][y] != stone:
+            self._changes[0].append((x, y, self._board[x][y]))
+            # Column 0 holds the row letters; a footprint hanging off the left edge writes there but it is not part of
+            # the position
+            if y > 0:
+                self._hash ^= self.zobrist_key(x, y, self._board[x][y]) ^ self.zobrist_key(x, y, stone)
+            self.put_stone(x, y, stone)
+
+    def put_stone(self, x, y, stone):
+        """
+        Support method writing a square of the game board and updating the pattern codes of the windows covering it.
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :param stone: str "-B-", "-W-" or "---"
+        :return: No return.
+        """
+        if y > 0:
+            delta = STONE_DIGITS[stone] - STONE_DIGITS[self._board[x][y]]
+            patterns = self._patterns
+            for center, weight in CELL_WINDOWS[x * 20 + y - 1]:
+                patterns[center] += delta * weight
+        self._board[x][y] = stone
+
+    def build_patterns(self):
+        """
+        Method to compute the pattern code of every piece window from the whole game board; only needed when a board is
+        set up.
+        :return: No return.
+        """
+        self._patterns = [0] * 400
+        for cell in range(400):
+            x, y = CELL_AXES[cell]
+            digit = STONE_DIGITS[self._board[x][y]]
+            for center, weight in CELL_WINDOWS[cell]:
+                self._patterns[center] += digit * weight
+
+    def zobrist_key(self, x, y, stone):
+        """
+        Support method returning the hash key of a stone on a square.
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :param stone: str "-B-", "-W-" or "---"
+        :return: Key of the stone, 0 for an empty square
+        :rtype: int
+        """
+        if stone == "-B-":
+            return ZOBRIST_BLACK[x * 20 + y - 1]
+        if stone == "-W-":
+            return ZOBRIST_WHITE[x * 20 + y - 1]
+        return 0
+
+    def build_hash(self):
+        """
+        Method to compute the hash of the position from the whole game board; only needed when a board is set up.
+        :return: No return.
+        """
+        self._hash = 0
+        for x in range(20):
+            for y in range(1, 21):
+                self._hash ^= self.zobrist_key(x, y, self._board[x][y])
+        if self._turn_count % 2 == 1:
+            self._hash ^= ZOBRIST_WHITE_TO_MOVE
+
+    def move_piece(self):
+        """
+        Support method for make_move() that moves the validated piece from the old footprint to the new footprint on
+        the game board, capturing any stones under the new footprint.
+        :return: No return.
+        """
+        count = 0
+        for _ in self._footprint_new:
+            # If there's overlap, place new footprint in that area; if not, then 'put' (more apt to say 'leave')
+            # old footprint
+            if self._footprint_old[count] not in self._footprint_new:
+                self.set_stone(self._footprint_old[count][0], self._footprint_old[count][1], "---")
+            count += 1
+
+        count = 0
+        for _ in self._footprint_new:
+            self.set_stone(self._footprint_new[count][0], self._footprint_new[count][1], self._piece[count])
+            count += 1
 
     def border_scrubber(self):
         """
@@ -535,47 +967,127 @@ class GessGame:
         """
         # 'Clear' columns 1 and 20
         for i in range(0, 20):
-            self._board[i][1] = "---"
-            self._board[i][-1] = "---"
+            self.set_stone(i, 1, "---")
+            self.set_stone(i, 20, "---")
 
         # 'Clear' rows 0 and 19
         for i in range(1, 21):
-            self._board[0][i] = "---"
-            self._board[19][i] = "---"
+            self.set_stone(0, i, "---")
+            self.set_stone(19, i, "---")
+
+    def apply_move(self):
+        """
+        Support method that carries out the validated move: the piece is moved, the border cleared and the ring index
+        updated. Only the squares and ring centers that actually change are recorded.
+        :return: Changed squares as (x, y, previous stone), toggled ring centers as (color, (x, y)) and the hash before
+        the move
+        :rtype: tuple
+        """
+        self._changes = ([], [], self._hash)
+        self.move_piece()
+        self.border_scrubber()
+        self.update_ring_index()
+        return self._changes
+
+    def revert_move(self, changes):
+        """
+        Support method that takes back a move carried out by apply_move(), newest change first.
+        :param changes: tuple returned by apply_move()
+        :return: No return.
+        """
+        for x, y, stone in reversed(changes[0]):
+            self.put_stone(x, y, stone)
+        for color, center in reversed(changes[1]):
+            self.toggle_ring(color, center)
+        self._hash = changes[2]
+
+    def find_ring(self, x, y):
+        """
+        Support method to check whether the 3x3 window centered on the given indexes forms a ring: an empty center
+        surrounded by eight stones of the same color. The window's pattern code is looked up in PATTERN_RING.
+        :param x: int x axis index of the window center
+        :param y: int y axis index of the window center
+        :return: "-B-" or "-W-" for the ring color, None if the window is not a ring
+        :rtype: str
+        """
+        return PATTERN_RING[self._patterns[x * 20 + y - 1]]
+
+    def ring_update_region(self):
+        """
+        Support method listing the ring centers whose window overlaps the old or new footprint of the current move;
+        these are the only windows a move can turn into or out of a ring. Centers are limited to rows c to r and
+        columns 3 to 18, the area counted since the original full board scan.
+        :return: Window centers as (x, y) tuples
+        :rtype: set
+        """
+        region = set()
+        for center_x, center_y in ((self._coord_x_old, self._coord_y_old), (self._coord_x_new, self._coord_y_new)):
+            for x in range(max(center_x - 2, 2), min(center_x + 2, 17) + 1):
+                for y in range(max(center_y - 2, 3), min(center_y + 2, 18) + 1):
+                    region.add((x, y))
+        return region
+
+    def build_ring_index(self):
+        """
+        Method to fill the ring index by scanning every window of the game board; only needed when a board is set up.
+        :return: No return.
+        """
+        self._black_rings = set()
+        self._white_rings = set()
+        for x in range(2, 18):
+            for y in range(3, 19):
+                ring = self.find_ring(x, y)
+                if ring == "-B-":
+                    self._black_rings.add((x, y))
+                if ring == "-W-":
+                    self._white_rings.add((x, y))
+
+    def toggle_ring(self, color, center):
+        """
+        Support method to add a ring center to the ring index of the given color, or remove it if already present.
+        :param color: str "-B-" or "-W-"
+        :param center: tuple (x, y) window center
+        :return: No return.
+        """
+        if color == "-B-":
+            rings = self._black_rings
+        else:
+            rings = self._white_rings
+        if center in rings:
+            rings.remove(center)
+        else:
+            rings.add(center)
+
+    def update_ring_index(self):
+        """
+        Method to bring the ring index up to date after a piece has moved by re-testing only the windows overlapping
+        the old and new footprints. Border clearing never touches a counted window so it needs no update. Every
+        center added or removed is recorded in self._changes.
+        :return: No return.
+        """
+        for center in self.ring_update_region():
+            ring = self.find_ring(center[0], center[1])
+            if (ring == "-B-") != (center in self._black_rings):
+                self.toggle_ring("-B-", center)
+                self._changes[1].append(("-B-", center))
+            if (ring == "-W-") != (center in self._white_rings):
+                self.toggle_ring("-W-", center)
+                self._changes[1].append(("-W-", center))
+
+    def count_rings(self):
+        """
+        Support method to read the number of rings of each color from the ring index.
+        :return: No return.
+        """
+        self._black_ring_count = len(self._black_rings)
+        self._white_ring_count = len(self._white_rings)
 
     def check_win(self):
         """
-        Method to check how many rings exist on the game board after a piece has moved.
+        Method to check how many rings exist on the game board after a piece has moved, read from the ring index.
         :return: No return.
         """
-        # Iterate through each column to construct a temporary piece
-        self._black_ring_count = 0
-        self._white_ring_count = 0
-        # Y is y-axis; Number
-        for y in range(2, 18):
-            self._ring_corner_y = y
-
-            # X is x-axis; Letter
-            for x in range(1, 17):
-                self._ring_corner_x = x
-
-                # Generate temporary piece
-                self._ring_check = [self._board[self._ring_corner_x][self._ring_corner_y],
-                                    self._board[self._ring_corner_x][self._ring_corner_y + 1],
-                                    self._board[self._ring_corner_x][self._ring_corner_y + 2],
-                                    self._board[self._ring_corner_x + 1][self._ring_corner_y],
-                                    self._board[self._ring_corner_x + 1][self._ring_corner_y + 1],
-                                    self._board[self._ring_corner_x + 1][self._ring_corner_y + 2],
-                                    self._board[self._ring_corner_x + 2][self._ring_corner_y],
-                                    self._board[self._ring_corner_x + 2][self._ring_corner_y + 1],
-                                    self._board[self._ring_corner_x + 2][self._ring_corner_y + 2]]
-
-                # Check if temporary piece can be classified as a ring and of what color, and add to tally
-                if self._ring_check.count("-B-") == 8 and self._ring_check[4] == "---":
-                    self._black_ring_count += 1
-
-                if self._ring_check.count("-W-") == 8 and self._ring_check[4] == "---":
-                    self._white_ring_count += 1
+        self.count_rings()
 
         # Check if move made has reduced the ring tally of opposing player to 0
         if self._black_ring_count == 0:
@@ -584,13 +1096,6 @@ class GessGame:
         if self._white_ring_count == 0:
             self._state = "BLACK_WON"
 
-    def update_ring_board(self):
-        """
-        Method to match the ring counting board to the actual game board after a valid move is made
-        :return: No return.
-        """
-        self._ring_board = self._board
-
     def make_move(self, centr, new_centr):
         """
         Method to move user-selected piece to new location on the gameboard.
@@ -600,10 +1105,17 @@ class GessGame:
         :return: Boolean value True if execution not halted by activation of self._termination_trigger. False if it is.
         """
 
+        if self._stats is not None:
+            return self.make_move_with_stats(centr, new_centr)
+
         # Run validation functions
         self._termination_trigger = False
+        self._rejection = ACCEPTED
         self.check_state()
         self.convert_to_axes(centr, new_centr)
+        # Without valid coordinates there is no piece to check
+        if self._termination_trigger is True:
+            return False
         self.generate_piece_and_footprint()
         self.verify_piece_choice_validity()
         self.check_center()
@@ -614,33 +1126,253 @@ class GessGame:
         if self._termination_trigger is True:
             return False
 
-        # Initiate movement
-        count = 0
-        for _ in self._footprint_new:
-            self._board[self._footprint_new[count][0]][self._footprint_new[count][1]] = self._piece[count]
-            # If there's overlap, place new footprint in that area; if not, then 'put' (more apt to say 'leave')
-            # old footprint
-            if self._footprint_old[count] in self._footprint_new:
-                self._board[self._footprint_new[count][0]][self._footprint_new[count][1]] = self._piece[count]
-            else:
-                self._board[self._footprint_old[count][0]][self._footprint_old[count][1]] = "---"
+        self.finish_move()
+        return True
 
-            count += 1
+    def try_move(self, centr, new_centr):
+        """
+        Method to make a move quietly: nothing is printed, validation stops at the first failed check and the reason
+        is returned as a code instead. Meant for bots and servers probing many moves that may be illegal.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: ACCEPTED if the move was made, otherwise the code of the first failed check; messages are in
+        REJECTION_MESSAGES
+        :rtype: int
+        """
+        if self._stats is not None:
+            self.make_move_with_stats(centr, new_centr, quiet=True)
+            return self._rejection
 
-        self.border_scrubber()
-        self.check_win()
-        self.update_ring_board()
+        self._termination_trigger = False
+        self._rejection = ACCEPTED
+        self._quiet = True
+        self.check_state()
+        if self._termination_trigger is False:
+            self.convert_to_axes(centr, new_centr)
+        if self._termination_trigger is False:
+            self.generate_piece_and_footprint()
+            self.verify_piece_choice_validity()
+        if self._termination_trigger is False:
+            self.check_center()
+        if self._termination_trigger is False:
+            self.check_direction()
+        if self._termination_trigger is False:
+            self.check_obstruction()
+        if self._termination_trigger is False:
+            self.check_ring_break()
+        self._quiet = False
+
+        if self._termination_trigger is True:
+            return self._rejection
+
+        self.finish_move()
+        return ACCEPTED
+
+    def finish_move(self, phases=None):
+        """
+        Support method for make_move(), try_move() and make_move_with_stats() carrying out a validated move: the move
+        is applied and journaled, the win checked, the turn passed and spectators told.
+        :param phases: dict of the profiling counters of each phase to time apply_move() and check_win() into, None
+        to leave them untimed
+        :return: No return.
+        """
+        # The journal keeps the hash of the position the move is played from; apply_move() changes it
+        hash_before = self._hash
+        if phases is None:
+            self._journal.append((self.apply_move(), self._state, self._turn_count, hash_before))
+            self.check_win()
+        else:
+            timer = time.perf_counter
+            start = timer()
+            changes = self.apply_move()
+            self.record_phase(phases["apply_move"], timer() - start)
+            self._journal.append((changes, self._state, self._turn_count, hash_before))
+            start = timer()
+            self.check_win()
+            self.record_phase(phases["check_win"], timer() - start)
         self._turn_count += 1
+        self._hash ^= ZOBRIST_WHITE_TO_MOVE
+        self._snapshot_cache = None
+        if self._subscribers:
+            self.publish(self.changed_cells(self._journal[-1][0]))
+
+    def make_move_with_stats(self, centr, new_centr, quiet=False):
+        """
+        Support method for make_move() and try_move() running the same phases while recording their call counts and
+        wall times.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :param quiet: Boolean value True to validate as try_move() does: nothing is printed and validation stops at
+        the first failed check
+        :return: Boolean value True if execution not halted by activation of self._termination_trigger. False if it is.
+        """
+        timer = time.perf_counter
+        phases = self._stats["phases"]
+        self._termination_trigger = False
+        self._rejection = ACCEPTED
+        self._quiet = quiet
+        for phase in VALIDATION_PHASES:
+            method = getattr(self, phase)
+            start = timer()
+            if phase == "convert_to_axes":
+                method(centr, new_centr)
+            else:
+                method()
+            self.record_phase(phases[phase], timer() - start)
+            # Without valid coordinates there is no piece to check
+            if self._termination_trigger is True and (quiet or phase == "convert_to_axes"):
+                break
+        self._quiet = False
+
+        if self._termination_trigger is True:
+            self._stats["rejected"] += 1
+            # Quiet validation leaves the reason uncounted by reject()
+            if quiet:
+                self.count_rejection(REJECTION_MESSAGES[self._rejection])
+            return False
+
+        self.finish_move(phases)
+        self._stats["accepted"] += 1
+        return True
+
+    def record_phase(self, counters, elapsed):
+        """
+        Support method for make_move_with_stats() and finish_move() adding one timed call to the counters of a phase.
+        :param counters: list of calls, total seconds and maximum seconds of the phase
+        :param elapsed: float seconds the call took
+        :return: No return.
+        """
+        counters[0] += 1
+        counters[1] += elapsed
+        if elapsed > counters[2]:
+            counters[2] = elapsed
+
+    def unmake_move(self):
+        """
+        Method to take back the last accepted move or resignation, restoring the squares it changed, the ring index,
+        the game state, the turn count and the hash.
+        :return: Boolean value True if a move was taken back. False if there is nothing to take back.
+        """
+        if not self._journal:
+            return False
+
+        changes, self._state, self._turn_count, self._hash = self._journal.pop()
+        cells = ()
+        if changes is not None:
+            # The cells a move changed are the ones taking it back changes again
+            if self._subscribers:
+                cells = self.changed_cells(changes)
+            self.revert_move(changes)
+        self.count_rings()
+        self._snapshot_cache = None
+        if self._subscribers:
+            self.publish(cells)
         return True
 
+    def generate_legal_moves(self):
+        """
+        Generator of every legal move for the player whose turn it is, using the same validation methods as
+        make_move(). Each piece is checked once, then each direction its stones allow is walked outward one square at a
+        time until the edge of the game board, the maximum distance allowed by check_center() or the first obstruction.
+        Moving a piece onto its own center is included when the center stone allows it, as make_move() accepts it.
+        Moves are generated for the position on the board; make moves only after the generator is exhausted.
+        :return: Generator of (centr, new_centr) alphanumeric coordinate pairs
+        :rtype: generator
+        """
+        if self._state != "UNFINISHED":
+            return
+
+        for x in range(1, 19):
+            for y in range(2, 20):
+                for move in self.legal_moves_from(x, y):
+                    yield move
+
+    def validate_moves(self, moves):
+        """
+        Method to check a batch of candidate moves against the current position without making them. The checks are
+        vectorized with NumPy in GessValidation, which is only imported when this method is first used.
+        :param moves: sequence of (centr, new_centr) alphanumeric coordinate pairs
+        :return: NumPy boolean array, True for each move make_move() would accept, and NumPy array of the code of the
+        first check each move fails, ACCEPTED for legal moves; messages are in REJECTION_MESSAGES
+        :rtype: tuple
+        """
+        from GessValidation import validate_moves
+        return validate_moves(self, moves)
+
+    def legal_moves_from(self, x, y):
+        """
+        Support method for generate_legal_moves() listing the legal moves of the piece centered on the given indexes.
+        Validation runs quietly and the move under test is taken back by check_ring_break(); the code of the last
+        move's rejection is kept for get_rejection().
+        :param x: int x axis index of the piece center
+        :param y: int y axis index of the piece center
+        :return: List of (centr, new_centr) alphanumeric coordinate pairs
+        :rtype: list
+        """
+        moves = []
+        rejection = self._rejection
+        self._quiet = True
+        self._termination_trigger = False
+        self._coord_x_old = self._coord_x_new = x
+        self._coord_y_old = self._coord_y_new = y
+        self.generate_piece_and_footprint()
+        self.verify_piece_choice_validity()
+
+        orientation = 0
+        while orientation < 9 and self._termination_trigger is False:
+            x_step, y_step = self._piece_compass[orientation]
+            # The center square only allows the piece to stay where it is
+            distance = 1
+            if orientation == 4:
+                distance = 0
+
+            while distance <= 3:
+                x_new = x + x_step * distance
+                y_new = y + y_step * distance
+                if not (0 < x_new < 19 and 0 < y_new < 20):
+                    break
+
+                self._termination_trigger = False
+                self._coord_x_new = x_new
+                self._coord_y_new = y_new
+                self.generate_piece_and_footprint()
+                self.check_center()
+                self.check_direction()
+                # Neither an unsupported direction nor an obstruction allows any further squares in this direction
+                if self._termination_trigger is True:
+                    break
+                self.check_obstruction()
+                if self._termination_trigger is True:
+                    break
+                self.check_ring_break()
+                if self._termination_trigger is False:
+                    moves.append((self._x_axis[x] + str(y), self._x_axis[x_new] + str(y_new)))
+                if orientation == 4:
+                    break
+                distance += 1
+
+            self._termination_trigger = False
+            orientation += 1
+
+        self._quiet = False
+        self._rejection = rejection
+        return moves
+
     def resign_game(self):
         """
         Method to allow player to resign during their turn in the game
         :return: Statement declaring winner opposite of whoever resigned
         :rtype: str
         """
+        self._journal.append((None, self._state, self._turn_count, self._hash))
+
         # Verify who is asking to resign
         if (self._turn_count % 2) == 0 or self._turn_count == 0:
             self._state = "WHITE_WON"
         else:
             self._state = "BLACK_WON"
+        self._snapshot_cache = None
+        if self._subscribers:
+            self.publish(())
@@ -0,0 +1,696 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Durability for hosted Gess Games. Every session change is appended to a write-ahead log that is written
+# and synced in group commits, compact binary snapshots of all sessions are made in the background from the log, and
+# recovery rebuilds the sessions from the latest snapshot and the log after it, split across worker processes.
+
+import argparse
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from GessBitboard import BitboardGessGame
+from GessCompact import CompactGessGame
+from GessGame import GessGame
+from GessRecord import INITIAL_POSITION, POSITION_SIZE, RESIGN, STATES, decode_move, encode_move, pack_position, \
+    replay, unpack_position
+
+BACKENDS = {"string": GessGame, "bitboard": BitboardGessGame, "compact": CompactGessGame}
+
+# Log segment: a sequence of frames, each one group commit
+#   frame header   payload length, CRC32 of the payload
+#   payload        records of session id and 2 byte code: a GessRecord move code, RESIGN, OPEN or CLOSE
+# A frame cut short by a crash fails its length or CRC check and ends the segment.
+FRAME = struct.Struct("<II")
+RECORD = struct.Struct("<IH")
+
+# Snapshot: every open session as of the start of a log segment
+#   header         magic, format version, number of the first segment not included, highest session id ever opened,
+#                  number of sessions
+#   sessions       session id, turn count, state index, then the packed black and white stone bitmasks
+#   footer         CRC32 of everything before it
+SNAPSHOT_HEADER = struct.Struct("<4sBIII")
+SNAPSHOT_SESSION = struct.Struct("<IIB")
+SNAPSHOT_FOOTER = struct.Struct("<I")
+SNAPSHOT_MAGIC = b"GSNP"
+VERSION = 2
+
+# Codes of the session records besides moves and RESIGN, above every GessRecord move code
+OPEN = 0xFFFE
+CLOSE = 0xFFFD
+
+SEGMENT_NAME = "segment-%08d.wal"
+SNAPSHOT_NAME = "snapshot-%08d.snap"
+
+# Snapshot of a session opened since the last snapshot
+INITIAL_SNAPSHOT = INITIAL_POSITION + (0, "UNFINISHED")
+
+
+class JournalError(Exception):
+    """
+    Raised by SessionJournal calls once the commit thread has stopped on an error; records appended since the last
+    commit are not durable and nothing more is logged.
+    """
+
+
+def list_numbers(directory, name):
+    """
+    List the numbers of the journal files of one kind in a directory
+    :param directory: str journal directory
+    :param name: str SEGMENT_NAME or SNAPSHOT_NAME
+    :return: Sorted list of file numbers
+    :rtype: list
+    """
+    prefix, suffix = name.split("%08d")
+    numbers = []
+    for file_name in os.listdir(directory):
+        if file_name.startswith(prefix) and file_name.endswith(suffix):
+            number = file_name[len(prefix):len(file_name) - len(suffix)]
+            if number.isdigit():
+                numbers.append(int(number))
+    return sorted(numbers)
+
+
+def sync_directory(directory):
+    """
+    Make renames and new files in a directory durable, where the platform allows syncing directories
+    :param directory: str directory path
+    :return: No return.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def read_segment(path):
+    """
+    Read the records of a log segment, stopping at a frame cut short by a crash
+    :param path: str segment path
+    :return: List of (session id, code) records, Boolean value True if the segment ends in a damaged frame
+    :rtype: tuple
+    """
+    with open(path, "rb") as log_file:
+        data = log_file.read()
+    records = []
+    offset = 0
+    while offset < len(data):
+        if offset + FRAME.size > len(data):
+            return records, True
+        length, checksum = FRAME.unpack_from(data, offset)
+        payload = data[offset + FRAME.size:offset + FRAME.size + length]
+        if len(payload) != length or length % RECORD.size or zlib.crc32(payload) != checksum:
+            return records, True
+        records.extend(RECORD.iter_unpack(payload))
+        offset += FRAME.size + length
+    return records, False
+
+
+def write_snapshot(path, segment, snapshots, last_session=0):
+    """
+    Write a snapshot file atomically: it is written and synced under a temporary name, then renamed into place.
+    :param path: str snapshot path
+    :param segment: int number of the first log segment the snapshot does not include
+    :param snapshots: dict of session id to GessGame.get_snapshot() tuple
+    :param last_session: int highest session id ever opened, closed sessions included
+    :return: Size of the file in bytes
+    :rtype: int
+    """
+    parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, VERSION, segment, max(last_session, max(snapshots, default=0)),
+                                  len(snapshots))]
+    for session, (black, white, turn_count, state) in snapshots.items():
+        parts.append(SNAPSHOT_SESSION.pack(session, turn_count, STATES.index(state)))
+        parts.append(pack_position(black, white))
+    data = b"".join(parts)
+    data += SNAPSHOT_FOOTER.pack(zlib.crc32(data))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as snapshot_file:
+        snapshot_file.write(data)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary, path)
+    sync_directory(os.path.dirname(path) or ".")
+    return len(data)
+
+
+def read_snapshot(path):
+    """
+    Read a snapshot file
+    :param path: str snapshot path
+    :return: Number of the first log segment not included, dict of session id to snapshot tuple, highest session id
+    ever opened
+    :rtype: tuple
+    """
+    with open(path, "rb") as snapshot_file:
+        data = snapshot_file.read()
+    if len(data) < SNAPSHOT_HEADER.size + SNAPSHOT_FOOTER.size or \
+            SNAPSHOT_FOOTER.unpack_from(data, len(data) - SNAPSHOT_FOOTER.size)[0] != \
+            zlib.crc32(data[:len(data) - SNAPSHOT_FOOTER.size]):
+        raise ValueError("damaged snapshot " + path)
+    magic, version, segment, last_session, count = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != VERSION:
+        raise ValueError("not a version %d snapshot: %s" % (VERSION, path))
+
+    snapshots = {}
+    offset = SNAPSHOT_HEADER.size
+    for _ in range(count):
+        session, turn_count, state = SNAPSHOT_SESSION.unpack_from(data, offset)
+        offset += SNAPSHOT_SESSION.size
+        black, white = unpack_position(data[offset:offset + POSITION_SIZE])
+        offset += POSITION_SIZE
+        snapshots[session] = (black, white, turn_count, STATES[state])
+    return segment, snapshots, last_session
+
+
+def collect_sessions(directory, until=None):
+    """
+    Gather the open sessions of a journal: those of the latest snapshot, changed by the log segments after it.
+    :param directory: str journal directory
+    :param until: int number of the first segment to leave out, None to read every segment
+    :return: Dict of session id to [snapshot or None for a new game, list of move codes to replay], and counts of
+    the segments and records read, the records of unknown sessions and the highest session id ever opened
+    :rtype: tuple
+    """
+    sessions = {}
+    start = 0
+    last_session = 0
+    snapshot_numbers = [number for number in list_numbers(directory, SNAPSHOT_NAME)
+                        if until is None or number <= until]
+    if snapshot_numbers:
+        start, snapshots, last_session = read_snapshot(os.path.join(directory, SNAPSHOT_NAME % snapshot_numbers[-1]))
+        for session, snapshot in snapshots.items():
+            sessions[session] = [snapshot, []]
+
+    counts = {"snapshot_sessions": len(sessions), "segments": 0, "records": 0, "orphans": 0, "damaged": 0}
+    for number in list_numbers(directory, SEGMENT_NAME):
+        if number < start or (until is not None and number >= until):
+            continue
+        records, damaged = read_segment(os.path.join(directory, SEGMENT_NAME % number))
+        counts["segments"] += 1
+        counts["records"] += len(records)
+        counts["damaged"] += damaged
+        for session, code in records:
+            if code == OPEN:
+                sessions[session] = [None, []]
+                last_session = max(last_session, session)
+            elif code == CLOSE:
+                sessions.pop(session, None)
+            elif session in sessions:
+                sessions[session][1].append(code)
+            else:
+                counts["orphans"] += 1
+    counts["last_session"] = last_session
+    return sessions, counts
+
+
+def rebuild_sessions(game_class, items, as_snapshots=False):
+    """
+    Executor entry point rebuilding sessions: each game is set up from its snapshot and its logged moves replayed.
+    :param game_class: GessGame, a backend subclass or CompactGessGame
+    :param items: list of (session id, snapshot or None, list of move codes)
+    :param as_snapshots: Boolean value True to return the snapshots of the games instead of the games
+    :return: List of (session id, game or snapshot), number of logged moves the rules rejected
+    :rtype: tuple
+    """
+    results = []
+    rejected = 0
+    for session, snapshot, codes in items:
+        if snapshot is None:
+            game = game_class()
+        else:
+            game = game_class.from_snapshot(snapshot)
+        for code in codes:
+            if not replay(game, decode_move(code)):
+                rejected += 1
+        if as_snapshots:
+            results.append((session, game.get_snapshot()))
+        else:
+            results.append((session, game))
+    return results, rejected
+
+
+def compact(directory, until):
+    """
+    Executor entry point making a snapshot of every session as of the start of a log segment, from the previous
+    snapshot and the segments before it, then deleting the files the new snapshot replaces. Live games are never
+    touched, so snapshots cost the server nothing but the log rotation.
+    :param directory: str journal directory
+    :param until: int number of the first segment the snapshot leaves out; every segment before it must be closed
+    :return: Sessions, moves replayed, rejected moves, snapshot bytes and seconds taken
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    sessions, counts = collect_sessions(directory, until)
+    snapshots = {}
+    replays = []
+    moves = 0
+    for session, (snapshot, codes) in sessions.items():
+        if codes:
+            replays.append((session, snapshot, codes))
+            moves += len(codes)
+        else:
+            snapshots[session] = snapshot or INITIAL_SNAPSHOT
+    results, rejected = rebuild_sessions(BitboardGessGame, replays, as_snapshots=True)
+    snapshots.update(results)
+    size = write_snapshot(os.path.join(directory, SNAPSHOT_NAME % until), until, snapshots, counts["last_session"])
+
+    for number in list_numbers(directory, SNAPSHOT_NAME):
+        if number < until:
+            os.remove(os.path.join(directory, SNAPSHOT_NAME % number))
+    for number in list_numbers(directory, SEGMENT_NAME):
+        if number < until:
+            os.remove(os.path.join(directory, SEGMENT_NAME % number))
+    return {"sessions": len(snapshots), "moves": moves, "rejected": rejected, "bytes": size,
+            "seconds": time.perf_counter() - start}
+
+
+def recover(directory, game_class=GessGame, executor=None, chunk_size=2000):
+    """
+    Rebuild every open session of a journal from its latest snapshot and the log after it. With an executor the
+    sessions are rebuilt in chunks across its worker processes.
+    :param directory: str journal directory
+    :param game_class: GessGame, a backend subclass or CompactGessGame for the rebuilt games
+    :param executor: concurrent.futures executor, None to rebuild in this process
+    :param chunk_size: int number of sessions per executor task
+    :return: Dict of session id to game, and counts of sessions, records, moves replayed, rejected moves and seconds,
+    with the highest session id ever opened
+    :rtype: tuple
+    """
+    start = time.perf_counter()
+    counts = {"sessions": 0, "segments": 0, "records": 0, "moves": 0, "rejected": 0, "orphans": 0, "damaged": 0,
+              "last_session": 0}
+    games = {}
+    if not os.path.isdir(directory):
+        counts["seconds"] = time.perf_counter() - start
+        return games, counts
+
+    sessions, read_counts = collect_sessions(directory)
+    for key in ("segments", "records", "orphans", "damaged", "last_session"):
+        counts[key] = read_counts[key]
+    items = [(session, snapshot, codes) for session, (snapshot, codes) in sessions.items()]
+    counts["moves"] = sum(len(codes) for _, _, codes in items)
+    chunks = [items[index:index + chunk_size] for index in range(0, len(items), chunk_size)]
+    if executor is None:
+        outcomes = [rebuild_sessions(game_class, chunk) for chunk in chunks]
+    else:
+        outcomes = [future.result() for future in [executor.submit(rebuild_sessions, game_class, chunk)
+                                                   for chunk in chunks]]
+    for results, rejected in outcomes:
+        games.update(results)
+        counts["rejected"] += rejected
+    counts["sessions"] = len(games)
+    counts["seconds"] = time.perf_counter() - start
+    return games, counts
+
+
+class SessionJournal:
+    """
+    Session Journal class that serves to do the following:
+    - Append the opening, moves, resignation and closing of sessions to a write-ahead log; appending only packs the
+      record into a buffer, so it costs a few microseconds
+    - Write and sync the buffered records from a background thread in group commits: each commit takes every record
+      appended while the previous one was syncing, so one fsync covers any number of sessions
+    - Report when records are durable, by blocking in wait() or through a callback after each commit
+    - Stop at the first error writing the log, and raise it from every call after it instead of losing records
+    - Rotate the log into numbered segments and have compact() fold closed segments into a snapshot
+    """
+
+    def __init__(self, directory, sync=True, on_commit=None, on_error=None):
+        """
+        Initialization method containing class data attributes:
+        :param directory: str journal directory, created if missing
+        :param sync: Boolean value True to fsync every commit, False to leave flushed records to the operating system
+        :param on_commit: callable receiving the sequence number of the last durable record after each commit, called
+        from the commit thread
+        :param on_error: callable receiving the exception that stopped the commit thread, called from the commit thread
+        :var self._directory - Journal directory
+        :var self._sync - Boolean value True if commits are synced
+        :var self._on_commit - Commit callback, None if there is none
+        :var self._on_error - Failure callback, None if there is none
+        :var self._segment - Number of the segment being written
+        :var self._file - File of the segment being written
+        :var self._pending - bytearray of the records appended since the last commit started
+        :var self._appended - Sequence number of the last record appended, counting from 1
+        :var self._durable - Sequence number of the last record committed
+        :var self._rotate - Boolean value True when the next commit starts a new segment
+        :var self._closing - Boolean value True once close() is called
+        :var self._error - Exception that stopped the commit thread, None while it runs
+        :var self._condition - threading.Condition guarding the attributes above
+        :var self._commits - Number of commits written
+        :var self._bytes - Number of bytes written to the log
+        :var self._commit_seconds - Seconds spent writing and syncing commits
+        :var self._thread - Commit thread
+        """
+        os.makedirs(directory, exist_ok=True)
+        numbers = list_numbers(directory, SEGMENT_NAME) + list_numbers(directory, SNAPSHOT_NAME)
+        self._directory = directory
+        self._sync = sync
+        self._on_commit = on_commit
+        self._on_error = on_error
+        self._segment = max(numbers, default=-1) + 1
+        self._file = open(os.path.join(directory, SEGMENT_NAME % self._segment), "ab")
+        sync_directory(directory)
+        self._pending = bytearray()
+        self._appended = 0
+        self._durable = 0
+        self._rotate = False
+        self._closing = False
+        self._error = None
+        self._condition = threading.Condition()
+        self._commits = 0
+        self._bytes = 0
+        self._commit_seconds = 0.0
+        self._thread = threading.Thread(target=self.run_commits, name="GessJournal", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_directory(self):
+        """
+        Get method to return the journal directory
+        :return: self._directory
+        :rtype: str
+        """
+        return self._directory
+
+    def get_durable(self):
+        """
+        Get method to return the sequence number of the last durable record
+        :return: self._durable
+        :rtype: int
+        """
+        return self._durable
+
+    def get_error(self):
+        """
+        Get method to return the exception that stopped the commit thread
+        :return: self._error, None while the journal works
+        :rtype: Exception
+        """
+        return self._error
+
+    def check_error(self):
+        """
+        Support method raising JournalError if the commit thread has stopped on an error; called holding
+        self._condition.
+        :return: No return.
+        """
+        if self._error is not None:
+            raise JournalError("journal failed: " + str(self._error)) from self._error
+
+    def append(self, session, code):
+        """
+        Support method buffering one record for the next commit.
+        :param session: int session id
+        :param code: int record code
+        :return: Sequence number of the record
+        :rtype: int
+        """
+        with self._condition:
+            self.check_error()
+            if self._closing:
+                raise ValueError("journal is closed")
+            self._pending += RECORD.pack(session, code)
+            self._appended += 1
+            if len(self._pending) == RECORD.size:
+                self._condition.notify_all()
+            return self._appended
+
+    def open_session(self, session):
+        """
+        Method to log the start of a new game.
+        :param session: int session id
+        :return: Sequence number of the record
+        :rtype: int
+        """
+        return self.append(session, OPEN)
+
+    def log_move(self, session, centr, new_centr):
+        """
+        Method to log an accepted move.
+        :param session: int session id
+        :param centr: str alphanumeric coordinate of the piece center
+        :param new_centr: str alphanumeric coordinate of the new center
+        :return: Sequence number of the record
+        :rtype: int
+        """
+        return self.append(session, encode_move((centr, new_centr)))
+
+    def log_resign(self, session):
+        """
+        Method to log a resignation.
+        :param session: int session id
+        :return: Sequence number of the record
+        :rtype: int
+        """
+        return self.append(session, RESIGN)
+
+    def close_session(self, session):
+        """
+        Method to log that a session is closed; it is left out of snapshots and recovery from then on.
+        :param session: int session id
+        :return: Sequence number of the record
+        :rtype: int
+        """
+        return self.append(session, CLOSE)
+
+    def wait(self, sequence=None, timeout=None):
+        """
+        Method to block until a record is durable.
+        :param sequence: int sequence number of the record, defaults to the last one appended
+        :param timeout: float seconds to wait at most, None to wait as long as it takes
+        :return: Boolean value True if the record is durable, False if the timeout ran out
+        """
+        with self._condition:
+            if sequence is None:
+                sequence = self._appended
+            durable = self._condition.wait_for(lambda: self._durable >= sequence or self._error is not None, timeout)
+            if self._durable >= sequence:
+                return True
+            self.check_error()
+            return durable
+
+    def run_commits(self):
+        """
+        Commit thread loop: wait for appended records, write them as one frame, sync, and report them durable.
+        Records appended while a commit is being synced form the next commit. The first error stops the thread: it
+        is kept for every call waiting or coming after it, and passed to the failure callback.
+        :return: No return.
+        """
+        try:
+            self.write_commits()
+        except Exception as error:
+            with self._condition:
+                self._error = error
+                self._condition.notify_all()
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            if self._on_error is not None:
+                self._on_error(error)
+
+    def write_commits(self):
+        """
+        Support method for run_commits() writing commits until the journal is closed.
+        :return: No return.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._rotate or self._closing)
+                payload = bytes(self._pending)
+                self._pending.clear()
+                sequence = self._appended
+                rotate = self._rotate
+                closing = self._closing
+
+            start = time.perf_counter()
+            if payload:
+                self._file.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+                self._file.flush()
+                if self._sync:
+                    os.fsync(self._file.fileno())
+            if rotate and not closing:
+                self._file.close()
+                self._file = open(os.path.join(self._directory, SEGMENT_NAME % (self._segment + 1)), "ab")
+                sync_directory(self._directory)
+
+            with self._condition:
+                if payload:
+                    self._commits += 1
+                    self._bytes += FRAME.size + len(payload)
+                    self._commit_seconds += time.perf_counter() - start
+                self._durable = sequence
+                if rotate and not closing:
+                    self._segment += 1
+                    self._rotate = False
+                self._condition.notify_all()
+            if payload and self._on_commit is not None:
+                self._on_commit(sequence)
+            if closing:
+                self._file.close()
+                return
+
+    def rotate(self):
+        """
+        Method to close the segment being written and continue the log in a new one. Records appended before the
+        call go to the closed segment or an earlier one.
+        :return: Number of the new segment
+        :rtype: int
+        """
+        with self._condition:
+            self.check_error()
+            if self._closing:
+                raise ValueError("journal is closed")
+            segment = self._segment + 1
+            self._rotate = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._segment >= segment or self._error is not None or self._closing)
+            self.check_error()
+            if self._segment < segment:
+                # The commit thread does not rotate once the journal is closing
+                raise ValueError("journal is closed")
+            return segment
+
+    def checkpoint(self, executor=None):
+        """
+        Method to start a snapshot: the log is rotated, then compact() folds the closed segments into a snapshot,
+        on the executor if one is given.
+        :param executor: concurrent.futures executor, None to compact in this thread
+        :return: Future of the compact() results with an executor, otherwise the results
+        """
+        segment = self.rotate()
+        if executor is None:
+            return compact(self._directory, segment)
+        return executor.submit(compact, self._directory, segment)
+
+    def close(self):
+        """
+        Method to commit the remaining records and stop the commit thread. A failed journal closes without raising.
+        :return: No return.
+        """
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def get_stats(self):
+        """
+        Get method to return the log counters
+        :return: Records appended, commits, records per commit, bytes written, mean milliseconds per commit, the
+        segment being written and the error that stopped the log
+        :rtype: dict
+        """
+        with self._condition:
+            commits = self._commits
+            return {"records": self._appended, "durable": self._durable, "commits": commits,
+                    "records_per_commit": self._durable / commits if commits else 0.0, "bytes": self._bytes,
+                    "commit_ms": self._commit_seconds / commits * 1000 if commits else 0.0,
+                    "segment": self._segment, "error": None if self._error is None else str(self._error)}
+
+
+def benchmark(directory, sessions, moves, tail, game_class=BitboardGessGame, workers=None, seed=1):
+    """
+    Measure the journal: log random games for many sessions, snapshot them, log a tail of further moves, then recover
+    every session and check it against the games the scripts reach.
+    :param directory: str empty journal directory
+    :param sessions: int number of sessions
+    :param moves: int moves each session plays before the snapshot
+    :param tail: int moves each session plays after the snapshot
+    :param game_class: GessGame, a backend subclass or CompactGessGame for the recovered games
+    :param workers: int number of recovery processes, None to recover in this process
+    :param seed: int seed of the move scripts
+    :return: Logging, snapshot and recovery measurements
+    :rtype: dict
+    """
+    # GessServer imports this module
+    from GessServer import record_scripts
+
+    scripts = record_scripts(min(sessions, 64), moves + tail, seed)
+    expected = []
+    for script in scripts:
+        game = BitboardGessGame()
+        for move in script:
+            game.make_move(*move)
+        expected.append(game.get_snapshot())
+
+    result = {"sessions": sessions}
+    with SessionJournal(directory) as journal:
+        start = time.perf_counter()
+        for session in range(sessions):
+            journal.open_session(session)
+        for ply in range(moves + tail):
+            if ply == moves:
+                result["log_us_per_record"] = (time.perf_counter() - start) / max(journal.get_stats()["records"], 1) \
+                    * 1e6
+                journal.wait()
+                result["snapshot"] = journal.checkpoint()
+            for session in range(sessions):
+                script = scripts[session % len(scripts)]
+                if ply < len(script):
+                    journal.log_move(session, *script[ply])
+        journal.wait()
+        result["log"] = journal.get_stats()
+
+    executor = ProcessPoolExecutor(workers) if workers else None
+    try:
+        games, counts = recover(directory, game_class, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    result["recovery"] = counts
+    result["mismatches"] = sum(games[session].get_snapshot() != expected[session % len(scripts)]
+                               for session in range(sessions))
+    return result
+
+
+def main(argv=None):
+    """
+    Command line entry point: "bench" measures logging, snapshots and recovery, "recover" reports on a journal.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: No return.
+    """
+    parser = argparse.ArgumentParser(description="Gess Game session journal.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench = commands.add_parser("bench", help="measure logging, snapshots and recovery")
+    bench.add_argument("directory", help="empty journal directory")
+    bench.add_argument("--sessions", type=int, default=10000)
+    bench.add_argument("--moves", type=int, default=20, help="moves per session before the snapshot")
+    bench.add_argument("--tail", type=int, default=4, help="moves per session after the snapshot")
+    bench.add_argument("--backend", choices=sorted(BACKENDS), default="bitboard")
+    bench.add_argument("--workers", type=int, default=None, help="recovery processes")
+    check = commands.add_parser("recover", help="rebuild the sessions of a journal and report")
+    check.add_argument("directory")
+    check.add_argument("--backend", choices=sorted(BACKENDS), default="bitboard")
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "bench":
+        if os.path.isdir(arguments.directory) and os.listdir(arguments.directory):
+            parser.error("journal directory is not empty")
+        result = benchmark(arguments.directory, arguments.sessions, arguments.moves, arguments.tail,
+                           BACKENDS[arguments.backend], arguments.workers)
+    else:
+        games, result = recover(arguments.directory, BACKENDS[arguments.backend])
+        states = {}
+        for game in games.values():
+            states[game.get_game_state()] = states.get(game.get_game_state(), 0) + 1
+        result["states"] = states
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
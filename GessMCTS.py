@@ -0,0 +1,316 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Monte Carlo tree search player for the Gess Game. Playouts run in a pool of worker processes, each
+# growing its own tree from a snapshot of the root position, and the root statistics are merged into one tree.
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessEngine import evaluate
+
+# Scale turning an evaluation score into a winning chance when a playout stops before the game ends
+SCORE_SCALE = 20.0
+
+
+class MCTSNode:
+    """
+    Node of the search tree, standing for the position reached by its move.
+    """
+
+    def __init__(self, move=None, parent=None, black_moved=False):
+        """
+        Initialization method containing class data attributes:
+        :param move: (centr, new_centr) pair leading to the node, None for the root
+        :param parent: MCTSNode the move was made from, None for the root
+        :param black_moved: Boolean value True if black made the move leading to the node
+        :var self.move - Move leading to the node
+        :var self.parent - Parent node
+        :var self.black_moved - Whether black made the move; wins are counted for that player
+        :var self.children - List of expanded child nodes
+        :var self.untried - List of legal moves not yet expanded, None until the node is first expanded
+        :var self.visits - Number of playouts through the node
+        :var self.wins - Sum of playout results for the player who made the move
+        """
+        self.move = move
+        self.parent = parent
+        self.black_moved = black_moved
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """
+        Method to pick the child to descend into with the UCT formula.
+        :param exploration: float exploration constant
+        :return: Selected child
+        :rtype: MCTSNode
+        """
+        log_visits = math.log(self.visits)
+        best = None
+        best_value = -1.0
+        for child in self.children:
+            value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best = child
+                best_value = value
+        return best
+
+
+def black_result(game):
+    """
+    Score the end of a playout for black: 1 for a black win, 0 for a white win, otherwise the evaluation of the
+    position mapped onto a winning chance.
+    :param game: GessGame instance
+    :return: Result between 0 and 1
+    :rtype: float
+    """
+    state = game.get_game_state()
+    if state == "BLACK_WON":
+        return 1.0
+    if state == "WHITE_WON":
+        return 0.0
+    score = evaluate(game)
+    if game.get_turn_count() % 2 == 1:
+        score = -score
+    return 1.0 / (1.0 + math.exp(-score / SCORE_SCALE))
+
+
+def playout_move(game, rng, attempts=64):
+    """
+    Pick a random legal move cheaply by trying random piece centers until one has legal moves, falling back to the
+    full move list.
+    :param game: GessGame instance
+    :param rng: random.Random instance
+    :param attempts: int number of random centers to try
+    :return: (centr, new_centr) pair, None if there is no legal move
+    :rtype: tuple
+    """
+    for _ in range(attempts):
+        moves = game.legal_moves_from(rng.randint(1, 18), rng.randint(2, 19))
+        if moves:
+            return rng.choice(moves)
+    moves = list(game.generate_legal_moves())
+    if moves:
+        return rng.choice(moves)
+    return None
+
+
+def playout(game, rng, depth):
+    """
+    Play random moves from the position until the game ends or the depth is reached, then take them back.
+    :param game: GessGame instance
+    :param rng: random.Random instance
+    :param depth: int maximum number of moves to play
+    :return: Result for black between 0 and 1
+    :rtype: float
+    """
+    made = 0
+    while made < depth and game.get_game_state() == "UNFINISHED":
+        move = playout_move(game, rng)
+        if move is None:
+            break
+        game.make_move(*move)
+        made += 1
+
+    result = black_result(game)
+    for _ in range(made):
+        game.unmake_move()
+    return result
+
+
+def grow_tree(game, time_limit_ms, iterations, exploration, playout_depth, rng):
+    """
+    Run select, expand, playout and backpropagate iterations from the position of the game until the time limit or
+    iteration count is reached. The game is returned to the root position after each iteration.
+    :param game: GessGame instance at the root position
+    :param time_limit_ms: int time budget in milliseconds
+    :param iterations: int maximum number of iterations, None for no limit
+    :param exploration: float UCT exploration constant
+    :param playout_depth: int maximum number of random moves per playout
+    :param rng: random.Random instance
+    :return: Root node, number of iterations run
+    :rtype: tuple
+    """
+    deadline = time.perf_counter() + time_limit_ms / 1000
+    root = MCTSNode()
+    count = 0
+    while (iterations is None or count < iterations) and time.perf_counter() < deadline:
+        node = root
+        depth = 0
+
+        # Selection
+        while node.untried == [] and node.children:
+            node = node.select_child(exploration)
+            game.make_move(*node.move)
+            depth += 1
+
+        # Expansion
+        if node.untried is None:
+            node.untried = list(game.generate_legal_moves())
+        if node.untried:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            child = MCTSNode(move, node, game.get_turn_count() % 2 == 0)
+            game.make_move(*move)
+            depth += 1
+            node.children.append(child)
+            node = child
+
+        # Playout and backpropagation
+        result = playout(game, rng, playout_depth)
+        while node is not None:
+            node.visits += 1
+            if node.black_moved:
+                node.wins += result
+            else:
+                node.wins += 1.0 - result
+            node = node.parent
+
+        for _ in range(depth):
+            game.unmake_move()
+        count += 1
+    return root, count
+
+
+def run_worker(game_class, snapshot, time_limit_ms, iterations, exploration, playout_depth, seed):
+    """
+    Worker process entry point: rebuild the root position from its snapshot, grow a tree and report the statistics
+    of the root moves.
+    :param game_class: GessGame or a backend subclass to play with
+    :param snapshot: tuple from GessGame.get_snapshot()
+    :param time_limit_ms: int time budget in milliseconds
+    :param iterations: int maximum number of iterations, None for no limit
+    :param exploration: float UCT exploration constant
+    :param playout_depth: int maximum number of random moves per playout
+    :param seed: int seed of the worker's random number generator
+    :return: Dict of root move to (visits, wins), number of iterations run
+    :rtype: tuple
+    """
+    game = game_class.from_snapshot(snapshot)
+    root, count = grow_tree(game, time_limit_ms, iterations, exploration, playout_depth, random.Random(seed))
+    statistics = {}
+    for child in root.children:
+        statistics[child.move] = (child.visits, child.wins)
+    return statistics, count
+
+
+class GessMCTS:
+    """
+    Gess MCTS class that serves to do the following:
+    - Choose a move for the player to move with Monte Carlo tree search
+    - Spread playouts over a pool of worker processes with root parallelization: each worker searches its own tree
+      from a snapshot of the position and the root moves of all trees are merged
+    - Report iterations, playouts per second and the merged root statistics of the last search
+    """
+
+    def __init__(self, workers=None, time_limit_ms=1000, iterations=None, exploration=1.4, playout_depth=20,
+                 seed=None):
+        """
+        Initialization method containing class data attributes:
+        :param workers: int number of worker processes, defaults to the number of CPU cores; 1 searches in process
+        :param time_limit_ms: int default time budget of a move in milliseconds
+        :param iterations: int total iterations per move split between the workers, None to run until the time limit
+        :param exploration: float UCT exploration constant
+        :param playout_depth: int maximum number of random moves per playout
+        :param seed: int seed for the workers' random number generators, None for a random seed
+        :var self._workers - Number of worker processes
+        :var self._time_limit_ms - Default time budget of a move in milliseconds
+        :var self._iterations - Total iterations per move, or None
+        :var self._exploration - UCT exploration constant
+        :var self._playout_depth - Maximum number of random moves per playout
+        :var self._rng - Random number generator seeding the workers
+        :var self._executor - Process pool, started on first use and kept for later moves
+        :var self._root - Merged root node of the last search
+        :var self._stats - Results of the last search, returned by get_stats()
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._time_limit_ms = time_limit_ms
+        self._iterations = iterations
+        self._exploration = exploration
+        self._playout_depth = playout_depth
+        self._rng = random.Random(seed)
+        self._executor = None
+        self._root = None
+        self._stats = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Method to shut down the worker processes.
+        :return: No return.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_stats(self):
+        """
+        Get method to return the results of the last search
+        :return: Move, iterations, iterations per worker, elapsed milliseconds, playouts per second and root moves as
+        (move, visits, winning rate) sorted by visits
+        :rtype: dict
+        """
+        return dict(self._stats)
+
+    def choose_move(self, game, time_limit_ms=None):
+        """
+        Method to search the position of the game and pick the most visited root move.
+        :param game: GessGame instance; it is not modified
+        :param time_limit_ms: int time budget in milliseconds, defaults to the player setting
+        :return: Chosen (centr, new_centr) pair, None if there is no legal move
+        :rtype: tuple
+        """
+        if time_limit_ms is None:
+            time_limit_ms = self._time_limit_ms
+        iterations = None
+        if self._iterations is not None:
+            iterations = -(-self._iterations // self._workers)
+
+        start = time.perf_counter()
+        arguments = (type(game), game.get_snapshot(), time_limit_ms, iterations, self._exploration,
+                     self._playout_depth)
+        seeds = [self._rng.getrandbits(32) for _ in range(self._workers)]
+        if self._workers == 1:
+            results = [run_worker(*arguments, seeds[0])]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self._workers)
+            futures = [self._executor.submit(run_worker, *arguments, seed) for seed in seeds]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+        # Merge the root moves of every worker's tree
+        self._root = MCTSNode()
+        children = {}
+        counts = []
+        for statistics, count in results:
+            counts.append(count)
+            for move, (visits, wins) in statistics.items():
+                if move not in children:
+                    children[move] = MCTSNode(move, self._root, game.get_turn_count() % 2 == 0)
+                    self._root.children.append(children[move])
+                children[move].visits += visits
+                children[move].wins += wins
+                self._root.visits += visits
+
+        best = None
+        for child in self._root.children:
+            if best is None or child.visits > best.visits:
+                best = child
+        move = None
+        if best is not None:
+            move = best.move
+
+        ranking = sorted(self._root.children, key=lambda child: child.visits, reverse=True)
+        self._stats = {"move": move, "iterations": sum(counts), "iterations_per_worker": counts,
+                       "elapsed_ms": elapsed * 1000, "playouts_per_second": sum(counts) / elapsed if elapsed else 0.0,
+                       "root": [(child.move, child.visits, child.wins / child.visits) for child in ranking]}
+        return move
@@ -0,0 +1,244 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Perft tool counting the positions reachable from a Gess Game position in a fixed number of moves, to
+# benchmark move generation and to cross check the board backends against each other.
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessBitboard import BitboardGessGame
+from GessGame import GessGame
+from GessTransposition import TranspositionTable
+
+BACKENDS = {"string": GessGame, "bitboard": BitboardGessGame}
+
+# Known counts from the starting position by depth, which every backend must reproduce
+KNOWN_COUNTS = {1: 491, 2: 231752}
+
+# Moves out and back by both players, ending in the position they started from
+REPETITION_CYCLE = (("c3", "c4"), ("c18", "c17"), ("c4", "c3"), ("c17", "c18"))
+
+
+def perft(game, depth, table=None):
+    """
+    Count the leaf positions of the move tree of the given depth below the position of the game. The game is
+    searched with make_move() and unmake_move() and is left as it was found.
+    :param game: GessGame instance
+    :param depth: int number of moves to play
+    :param table: TranspositionTable caching counts by position hash and depth, or None
+    :return: Number of leaf positions
+    :rtype: int
+    """
+    if depth == 0:
+        return 1
+
+    key = None
+    if table is not None:
+        key = game.get_hash()
+        entry = table.probe(key)
+        if entry is not None and entry[1] == depth:
+            return entry[2]
+
+    moves = list(game.generate_legal_moves())
+    if depth == 1:
+        count = len(moves)
+    else:
+        count = 0
+        for move in moves:
+            game.make_move(*move)
+            count += perft(game, depth - 1, table)
+            game.unmake_move()
+
+    if table is not None:
+        table.store(key, depth, count)
+    return count
+
+
+def perft_move(game_class, snapshot, move, depth, table_size):
+    """
+    Worker process entry point: rebuild the position from its snapshot, play one root move and count the tree below
+    it.
+    :param game_class: GessGame or a backend subclass to count with
+    :param snapshot: tuple from GessGame.get_snapshot()
+    :param move: (centr, new_centr) root move
+    :param depth: int number of moves to play, including the root move
+    :param table_size: int number of cache slots, 0 for no cache
+    :return: Number of leaf positions below the root move
+    :rtype: int
+    """
+    game = game_class.from_snapshot(snapshot)
+    table = None
+    if table_size:
+        table = TranspositionTable(table_size)
+    game.make_move(*move)
+    return perft(game, depth - 1, table)
+
+
+def divide(game, depth, table_size=0, workers=1):
+    """
+    Count the leaf positions of the move tree of the given depth separately for each root move. With more than one
+    worker the root moves are shared out to worker processes, each with its own cache.
+    :param game: GessGame instance
+    :param depth: int number of moves to play, at least 1
+    :param table_size: int number of cache slots, 0 for no cache
+    :param workers: int number of worker processes, 1 counts in process
+    :return: Dict of root move to number of leaf positions, in generation order
+    :rtype: dict
+    """
+    moves = list(game.generate_legal_moves())
+    counts = {}
+    if workers == 1:
+        table = None
+        if table_size:
+            table = TranspositionTable(table_size)
+        for move in moves:
+            game.make_move(*move)
+            counts[move] = perft(game, depth - 1, table)
+            game.unmake_move()
+        return counts
+
+    snapshot = game.get_snapshot()
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(perft_move, type(game), snapshot, move, depth, table_size) for move in moves]
+        for move, future in zip(moves, futures):
+            counts[move] = future.result()
+    return counts
+
+
+def run_perft(game, depth, table_size=0, workers=1, split=False):
+    """
+    Count the move tree of the given depth and time the count.
+    :param game: GessGame instance
+    :param depth: int number of moves to play
+    :param table_size: int number of cache slots, 0 for no cache
+    :param workers: int number of worker processes, used when the count is split by root move
+    :param split: Boolean value True to report the count of each root move
+    :return: Depth, nodes, elapsed milliseconds, nodes per second and the count of each root move if split
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    counts = None
+    if depth > 0 and (split or workers > 1):
+        counts = divide(game, depth, table_size, workers)
+        nodes = sum(counts.values())
+    else:
+        table = None
+        if table_size:
+            table = TranspositionTable(table_size)
+        nodes = perft(game, depth, table)
+    elapsed = time.perf_counter() - start
+
+    result = {"depth": depth, "nodes": nodes, "elapsed_ms": elapsed * 1000,
+              "nodes_per_second": nodes / elapsed if elapsed else 0.0}
+    if split:
+        result["divide"] = counts
+    return result
+
+
+def check_known_counts(backends=None, max_depth=2, table_size=0, workers=1):
+    """
+    Regression check of move generation: count the starting position of every backend to each depth of KNOWN_COUNTS
+    and compare. It takes seconds rather than milliseconds, so it is run on demand with --check rather than on every
+    change.
+    :param backends: list of backend names, defaults to all
+    :param max_depth: int deepest known count to check
+    :param table_size: int number of cache slots, 0 for no cache
+    :param workers: int number of worker processes splitting the root moves
+    :return: List of (backend, depth, expected, counted) for each count that differs
+    :rtype: list
+    """
+    mismatches = []
+    for name in backends or sorted(BACKENDS):
+        for depth, expected in sorted(KNOWN_COUNTS.items()):
+            if depth > max_depth:
+                break
+            nodes = run_perft(BACKENDS[name](), depth, table_size, workers)["nodes"]
+            if nodes != expected:
+                mismatches.append((name, depth, expected, nodes))
+    return mismatches
+
+
+def check_repetitions(backends=None, cycles=2):
+    """
+    Regression check of the position journal: play REPETITION_CYCLE over and over on every backend, and after each
+    cycle compare the hash with the starting one and expect count_repetitions() to find the starting position once
+    for every cycle played.
+    :param backends: list of backend names, defaults to all
+    :param cycles: int number of cycles to play
+    :return: List of (backend, cycle, Boolean value True if the hash returned, repetitions counted) for each cycle
+    that differs
+    :rtype: list
+    """
+    mismatches = []
+    for name in backends or sorted(BACKENDS):
+        game = BACKENDS[name]()
+        start = game.get_hash()
+        for cycle in range(1, cycles + 1):
+            for centr, new_centr in REPETITION_CYCLE:
+                game.try_move(centr, new_centr)
+            repetitions = game.count_repetitions()
+            if game.get_hash() != start or repetitions != cycle:
+                mismatches.append((name, cycle, game.get_hash() == start, repetitions))
+    return mismatches
+
+
+def main(argv=None):
+    """
+    Command line entry point: count the move tree from the starting position, or from the position reached by a
+    sequence of moves, and print the count, the time taken and nodes per second. With --check, compare every backend
+    against the known counts of the starting position and check its repetition counts instead.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status, 1 if a known count was not reproduced
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Count the positions reachable in a Gess Game.")
+    parser.add_argument("depth", type=int, nargs="?", help="number of moves to play")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="string", help="board backend to count with")
+    parser.add_argument("--moves", nargs="*", default=[],
+                        help="moves leading to the position to count from, as center and new center pairs")
+    parser.add_argument("--divide", action="store_true", help="print the count of each root move")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes splitting the root moves")
+    parser.add_argument("--cache", type=int, default=0, help="cache slots, 0 for no cache")
+    parser.add_argument("--check", action="store_true",
+                        help="check every backend against the known counts up to depth, 2 by default, and check "
+                             "repetition counts")
+    arguments = parser.parse_args(argv)
+
+    if arguments.check:
+        mismatches = check_known_counts(max_depth=arguments.depth or max(KNOWN_COUNTS), table_size=arguments.cache,
+                                        workers=arguments.workers)
+        for name, depth, expected, nodes in mismatches:
+            print("MISMATCH %s depth %d: expected %d, counted %d" % (name, depth, expected, nodes))
+        if not mismatches:
+            print("known counts reproduced")
+        repetitions = check_repetitions()
+        for name, cycle, returned, counted in repetitions:
+            print("MISMATCH %s repetition cycle %d: hash %s, counted %d repetitions"
+                  % (name, cycle, "returned" if returned else "did not return", counted))
+        if not repetitions:
+            print("repetitions counted")
+        return 1 if mismatches or repetitions else 0
+    if arguments.depth is None:
+        parser.error("depth is required unless --check is given")
+
+    if len(arguments.moves) % 2:
+        parser.error("--moves takes center and new center pairs")
+    game = BACKENDS[arguments.backend]()
+    for index in range(0, len(arguments.moves), 2):
+        if not game.make_move(arguments.moves[index], arguments.moves[index + 1]):
+            parser.error("illegal move " + arguments.moves[index] + " " + arguments.moves[index + 1])
+
+    result = run_perft(game, arguments.depth, arguments.cache, arguments.workers, arguments.divide)
+    if arguments.divide:
+        for (centr, new_centr), count in result["divide"].items():
+            print(centr + " " + new_centr + ": " + str(count))
+    print("nodes: " + str(result["nodes"]))
+    print("time: %.0f ms" % result["elapsed_ms"])
+    print("nodes per second: %.0f" % result["nodes_per_second"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
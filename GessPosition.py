@@ -0,0 +1,301 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Immutable Gess Game positions. A Position is a value: playing a move returns a new Position that shares
+# every unchanged board row with its parent, so positions can be branched from freely, shared between threads and used
+# as dict keys.
+
+from GessCompact import CompactGessGame, BLACK, WHITE
+from GessGame import GessGame, DIGIT_STONES, REJECTION_MESSAGES, ACCEPTED, ZOBRIST_BLACK, ZOBRIST_WHITE, \
+    ZOBRIST_WHITE_TO_MOVE
+
+
+def row_hash(row, x):
+    """
+    Combine the Zobrist keys of the stones of one board row
+    :param row: bytes of the 20 STONE_DIGITS digits of the row
+    :param x: int x axis index of the row
+    :return: XOR of the keys
+    :rtype: int
+    """
+    combined = 0
+    cell = x * 20
+    for digit in row:
+        if digit == BLACK:
+            combined ^= ZOBRIST_BLACK[cell]
+        elif digit == WHITE:
+            combined ^= ZOBRIST_WHITE[cell]
+        cell += 1
+    return combined
+
+
+class Position:
+    """
+    Position class that serves to do the following:
+    - Hold the stones, turn count and state of a Gess Game as an immutable value
+    - Play moves and resignations by returning new positions; rows a move leaves unchanged are the same bytes objects
+      in the parent and the child
+    - Hash and compare by stones, player to move and game state, so positions reached by different move orders are
+      equal; the turn count is carried along but is not part of the value
+    - Convert to and from games of every backend through snapshots
+    Rules are applied by CompactGessGame on a scratch copy of the cells, so positions never change and need no locks.
+    """
+
+    __slots__ = ("_rows", "_turn_count", "_state", "_ring_counts", "_hash")
+
+    def __init__(self, rows, turn_count=0, state="UNFINISHED", ring_counts=None, position_hash=None):
+        """
+        Initialization method containing class data attributes:
+        :param rows: sequence of 20 bytes rows of 20 STONE_DIGITS digits, row x holding cells x * 20 to x * 20 + 19
+        :param turn_count: int turn count
+        :param state: str game state
+        :param ring_counts: tuple of the number of black and white rings, counted from the rows if None
+        :param position_hash: int Zobrist hash, computed from the rows if None
+        :var self._rows - Tuple of the 20 rows, shared with related positions
+        :var self._turn_count - Turn count; even for black to move
+        :var self._state - Game state
+        :var self._ring_counts - Number of black rings, number of white rings
+        :var self._hash - Zobrist hash of the stones and player to move, equal to GessGame.get_hash()
+        """
+        rows = tuple(bytes(row) for row in rows)
+        if len(rows) != 20 or any(len(row) != 20 for row in rows):
+            raise ValueError("a position has 20 rows of 20 cells")
+        if ring_counts is None:
+            game = CompactGessGame.from_cells(b"".join(rows), turn_count, state, (0, 0))
+            game.count_rings()
+            ring_counts = game.get_ring_counts()
+        if position_hash is None:
+            position_hash = 0
+            for x in range(20):
+                position_hash ^= row_hash(rows[x], x)
+            if turn_count % 2 == 1:
+                position_hash ^= ZOBRIST_WHITE_TO_MOVE
+        object.__setattr__(self, "_rows", rows)
+        object.__setattr__(self, "_turn_count", turn_count)
+        object.__setattr__(self, "_state", state)
+        object.__setattr__(self, "_ring_counts", tuple(ring_counts))
+        object.__setattr__(self, "_hash", position_hash)
+
+    def __setattr__(self, name, value):
+        """
+        Positions cannot be changed; play() and resign() return new ones.
+        """
+        raise AttributeError("Position is immutable")
+
+    def __delattr__(self, name):
+        """
+        Positions cannot be changed; play() and resign() return new ones.
+        """
+        raise AttributeError("Position is immutable")
+
+    def __eq__(self, other):
+        """
+        Positions are equal when they hold the same stones, the same player is to move and the game state matches.
+        """
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._hash == other._hash and self._turn_count % 2 == other._turn_count % 2 and \
+            self._state == other._state and self._rows == other._rows
+
+    def __hash__(self):
+        """
+        Hash of the position, its Zobrist hash.
+        """
+        return self._hash
+
+    def __repr__(self):
+        """
+        Short description of the position for debugging.
+        """
+        return "Position(turn_count=%d, state=%r, hash=%#018x)" % (self._turn_count, self._state, self._hash)
+
+    @classmethod
+    def initial(cls):
+        """
+        Method to create the starting position of a new game.
+        :return: Starting position
+        :rtype: Position
+        """
+        return INITIAL_POSITION
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Method to create the position of a snapshot from GessGame.get_snapshot() of any backend.
+        :param snapshot: tuple of black stones, white stones, turn count and game state
+        :return: Position of the snapshot
+        :rtype: Position
+        """
+        black, white, turn_count, state = snapshot
+        rows = []
+        for x in range(20):
+            row = bytearray(20)
+            for y in range(20):
+                if black >> (x * 20 + y) & 1:
+                    row[y] = BLACK
+                elif white >> (x * 20 + y) & 1:
+                    row[y] = WHITE
+            rows.append(row)
+        return cls(rows, turn_count, state)
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Method to create the position of a game of any backend.
+        :param game: GessGame, a backend subclass or CompactGessGame
+        :return: Current position of the game
+        :rtype: Position
+        """
+        return cls.from_snapshot(game.get_snapshot())
+
+    def to_game(self, game_class=GessGame):
+        """
+        Method to create a game set up with this position, to continue playing it with a mutable game.
+        :param game_class: GessGame, a backend subclass or CompactGessGame
+        :return: New game
+        :rtype: GessGame
+        """
+        return game_class.from_snapshot(self.get_snapshot())
+
+    def get_snapshot(self):
+        """
+        Get method to return the position in the snapshot format of GessGame.get_snapshot()
+        :return: Black stones, white stones, turn count, game state
+        :rtype: tuple
+        """
+        black = 0
+        white = 0
+        cell = 0
+        for row in self._rows:
+            for digit in row:
+                if digit == BLACK:
+                    black |= 1 << cell
+                elif digit == WHITE:
+                    white |= 1 << cell
+                cell += 1
+        return black, white, self._turn_count, self._state
+
+    def get_rows(self):
+        """
+        Get method to return the rows of the position
+        :return: self._rows
+        :rtype: tuple
+        """
+        return self._rows
+
+    def get_stone(self, x, y):
+        """
+        Get method to return the contents of a square
+        :param x: int x axis index of the square
+        :param y: int y axis index of the square
+        :return: "-B-", "-W-" or "---"
+        :rtype: str
+        """
+        return DIGIT_STONES[self._rows[x][y - 1]]
+
+    def get_turn_count(self):
+        """
+        Get method to return Turn Count
+        :return: self._turn_count
+        :rtype: int
+        """
+        return self._turn_count
+
+    def get_game_state(self):
+        """
+        Get method to return Game State
+        :return: self._state
+        :rtype: str
+        """
+        return self._state
+
+    def get_ring_counts(self):
+        """
+        Get method to return the number of rings of each color
+        :return: self._ring_counts
+        :rtype: tuple
+        """
+        return self._ring_counts
+
+    def get_hash(self):
+        """
+        Get method to return the Zobrist hash of the position
+        :return: self._hash
+        :rtype: int
+        """
+        return self._hash
+
+    def scratch_game(self):
+        """
+        Support method creating a compact game holding a copy of the position, to apply the rules on.
+        :return: New game
+        :rtype: CompactGessGame
+        """
+        return CompactGessGame.from_cells(b"".join(self._rows), self._turn_count, self._state, self._ring_counts)
+
+    def check_move(self, centr, new_centr):
+        """
+        Method to check a move against the rules without playing it.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: Rejection code of the first failed check, ACCEPTED for a legal move
+        :rtype: int
+        """
+        return self.scratch_game().check_move(centr, new_centr)
+
+    def play(self, centr, new_centr):
+        """
+        Method to play a move, returning the position after it. Rows the move leaves unchanged are shared with this
+        position.
+        :param centr: str alphanumeric combination for center of piece to be moved
+        :param new_centr: str alphanumeric combination for where the center of the selected piece is intended to be
+        placed
+        :return: Position after the move
+        :rtype: Position
+        :raises ValueError: if the move is not allowed, with the message of the first failed check
+        """
+        game = self.scratch_game()
+        code = game.try_move(centr, new_centr)
+        if code != ACCEPTED:
+            raise ValueError(REJECTION_MESSAGES[code])
+
+        cells = game.get_cells()
+        rows = list(self._rows)
+        position_hash = self._hash ^ ZOBRIST_WHITE_TO_MOVE
+        for x in range(20):
+            row = cells[x * 20:x * 20 + 20]
+            if row != rows[x]:
+                position_hash ^= row_hash(rows[x], x) ^ row_hash(row, x)
+                rows[x] = row
+        return Position(rows, game.get_turn_count(), game.get_game_state(), game.get_ring_counts(), position_hash)
+
+    def resign(self):
+        """
+        Method to resign for the player to move, returning the finished position; the rows are shared unchanged.
+        :return: Position won by the other player
+        :rtype: Position
+        """
+        state = "BLACK_WON"
+        if self._turn_count % 2 == 0:
+            state = "WHITE_WON"
+        return Position(self._rows, self._turn_count, state, self._ring_counts, self._hash)
+
+    def legal_moves(self):
+        """
+        Method to list every legal move for the player to move, in the order of GessGame.generate_legal_moves().
+        :return: List of (centr, new_centr) alphanumeric coordinate pairs
+        :rtype: list
+        """
+        return list(self.scratch_game().generate_legal_moves())
+
+    def children(self):
+        """
+        Generator of every position reachable in one legal move.
+        :return: Generator of (move, Position) pairs
+        :rtype: generator
+        """
+        for move in self.legal_moves():
+            yield move, self.play(*move)
+
+
+INITIAL_POSITION = Position.from_game(CompactGessGame())
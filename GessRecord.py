@@ -0,0 +1,501 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Compact binary record format for archiving Gess Games. Each move is stored in 2 bytes as its origin
+# square, direction and distance, with optional position checkpoints every few moves so any move of any game can be
+# reached without replaying the archive from the start.
+
+import mmap
+import struct
+
+from GessBitboard import BitboardGessGame, masks_from_board
+from GessGame import CELL_AXES, CELL_INDEX, INITIAL_BOARD, X_AXIS, ACCEPTED
+
+# File layout:
+#   file header    magic, format version, checkpoint interval
+#   game records   one after another, each laid out as below
+#   index          optional footer holding the offset of every game record, written by GameRecordWriter.close()
+# Game record:
+#   game header    marker, flags, final state, number of moves, turn count of the starting position
+#   start position black and white stone bitmasks, present if FLAG_START_POSITION is set
+#   moves          2 bytes each; after every checkpoint interval moves, a checkpoint of the position reached
+FILE_HEADER = struct.Struct("<4sBBH")
+GAME_HEADER = struct.Struct("<2sBBII")
+MOVE = struct.Struct("<H")
+INDEX_HEADER = struct.Struct("<4sI")
+INDEX_FOOTER = struct.Struct("<Q4s")
+OFFSET = struct.Struct("<Q")
+
+FILE_MAGIC = b"GESS"
+GAME_MARKER = b"GR"
+INDEX_MAGIC = b"GIDX"
+END_MAGIC = b"GEND"
+VERSION = 1
+
+FLAG_START_POSITION = 1
+
+# Bytes of one stone bitmask of the 400 squares
+MASK_SIZE = 50
+POSITION_SIZE = 2 * MASK_SIZE
+# A checkpoint is a position followed by the game state
+CHECKPOINT_SIZE = POSITION_SIZE + 1
+
+STATES = ("UNFINISHED", "BLACK_WON", "WHITE_WON")
+
+# Stone bitmasks of the standard starting position, used by games recorded without a start position
+INITIAL_POSITION = masks_from_board(INITIAL_BOARD)
+
+# Move code of a resignation; other codes are origin cell * 36 + orientation * 4 + distance
+RESIGN = 0xFFFF
+
+
+def encode_move(move):
+    """
+    Convert a move into its 2 byte code
+    :param move: (centr, new_centr) alphanumeric coordinate pair, or None for a resignation
+    :return: Move code
+    :rtype: int
+    """
+    if move is None:
+        return RESIGN
+    cell = CELL_INDEX.get(move[0])
+    cell_new = CELL_INDEX.get(move[1])
+    if cell is None or cell_new is None:
+        raise ValueError("invalid coordinate in move " + str(move))
+    x, y = CELL_AXES[cell]
+    x_new, y_new = CELL_AXES[cell_new]
+    x_diff = x_new - x
+    y_diff = y_new - y
+    distance = max(abs(x_diff), abs(y_diff))
+    if distance > 3 or abs(x_diff) not in (0, distance) or abs(y_diff) not in (0, distance):
+        raise ValueError("move does not follow a compass direction: " + str(move))
+    x_step = (x_diff > 0) - (x_diff < 0)
+    y_step = (y_diff > 0) - (y_diff < 0)
+    return cell * 36 + ((x_step + 1) * 3 + y_step + 1) * 4 + distance
+
+
+def decode_move(code):
+    """
+    Convert a move code back into the move
+    :param code: int move code
+    :return: (centr, new_centr) alphanumeric coordinate pair, or None for a resignation
+    :rtype: tuple
+    """
+    if code == RESIGN:
+        return None
+    cell, rest = divmod(code, 36)
+    if cell >= len(CELL_AXES):
+        raise ValueError("invalid move code " + str(code))
+    orientation, distance = divmod(rest, 4)
+    x, y = CELL_AXES[cell]
+    x_new = x + (orientation // 3 - 1) * distance
+    y_new = y + (orientation % 3 - 1) * distance
+    if not (0 <= x_new < 20 and 1 <= y_new <= 20):
+        raise ValueError("move code " + str(code) + " leaves the board")
+    return X_AXIS[x] + str(y), X_AXIS[x_new] + str(y_new)
+
+
+def pack_position(black, white):
+    """
+    Convert the stone bitmasks of a position into bytes
+    :param black: int black stone bitmask
+    :param white: int white stone bitmask
+    :return: Packed position
+    :rtype: bytes
+    """
+    return black.to_bytes(MASK_SIZE, "little") + white.to_bytes(MASK_SIZE, "little")
+
+
+def unpack_position(data):
+    """
+    Convert packed bytes back into the stone bitmasks of a position
+    :param data: bytes-like packed position
+    :return: Black stone bitmask, white stone bitmask
+    :rtype: tuple
+    """
+    return int.from_bytes(data[:MASK_SIZE], "little"), int.from_bytes(data[MASK_SIZE:POSITION_SIZE], "little")
+
+
+def record_size(flags, move_count, interval):
+    """
+    Compute the length of a game record from its header
+    :param flags: int game flags
+    :param move_count: int number of moves
+    :param interval: int checkpoint interval of the file, 0 for none
+    :return: Length in bytes
+    :rtype: int
+    """
+    size = GAME_HEADER.size + move_count * MOVE.size
+    if flags & FLAG_START_POSITION:
+        size += POSITION_SIZE
+    if interval:
+        size += move_count // interval * CHECKPOINT_SIZE
+    return size
+
+
+def move_offset(flags, index, interval):
+    """
+    Compute where a move is stored within its game record
+    :param flags: int game flags
+    :param index: int number of the move in the game, from 0
+    :param interval: int checkpoint interval of the file, 0 for none
+    :return: Offset from the start of the record
+    :rtype: int
+    """
+    offset = GAME_HEADER.size + index * MOVE.size
+    if flags & FLAG_START_POSITION:
+        offset += POSITION_SIZE
+    if interval:
+        offset += index // interval * CHECKPOINT_SIZE
+    return offset
+
+
+def replay(game, move):
+    """
+    Play a decoded move or resignation on a game
+    :param game: GessGame instance
+    :param move: (centr, new_centr) pair, or None for a resignation
+    :return: Boolean value True if the move was accepted
+    """
+    if move is None:
+        if game.get_game_state() != "UNFINISHED":
+            return False
+        game.resign_game()
+        return True
+    return game.try_move(*move) == ACCEPTED
+
+
+class GameRecordWriter:
+    """
+    Game record writer class that serves to do the following:
+    - Write games one at a time to a binary record file as they are produced
+    - Replay each game while writing it, rejecting illegal moves and recording the final state and checkpoints
+    - Write an index of the game offsets when closed, for random access by GameRecordReader
+    """
+
+    def __init__(self, path, checkpoint_interval=0, game_class=BitboardGessGame):
+        """
+        Initialization method containing class data attributes:
+        :param path: str path of the file to create
+        :param checkpoint_interval: int number of moves between position checkpoints, 0 for none
+        :param game_class: GessGame or a backend subclass used to replay the games
+        :var self._file - File being written
+        :var self._interval - Number of moves between checkpoints
+        :var self._game_class - Backend used to replay the games
+        :var self._offsets - Offset of every game record written so far
+        """
+        if not 0 <= checkpoint_interval <= 0xFFFF:
+            raise ValueError("checkpoint interval must be from 0 to 65535")
+        self._file = open(path, "wb")
+        self._interval = checkpoint_interval
+        self._game_class = game_class
+        self._offsets = []
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, VERSION, 0, checkpoint_interval))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_game(self, moves, snapshot=None):
+        """
+        Method to replay a game and append its record.
+        :param moves: sequence of (centr, new_centr) pairs, None for a resignation
+        :param snapshot: tuple from GessGame.get_snapshot() of the starting position, None for the standard start
+        :return: Number of the game in the file, from 0
+        :rtype: int
+        """
+        if snapshot is None:
+            game = self._game_class()
+        else:
+            game = self._game_class.from_snapshot(snapshot)
+        start = game.get_snapshot()
+
+        body = bytearray()
+        flags = 0
+        if snapshot is not None:
+            flags |= FLAG_START_POSITION
+            body += pack_position(start[0], start[1])
+
+        move_count = 0
+        for move in moves:
+            code = encode_move(move)
+            if not replay(game, move):
+                raise ValueError("illegal move " + str(move_count + 1) + " " + str(move))
+            body += MOVE.pack(code)
+            move_count += 1
+            if self._interval and move_count % self._interval == 0:
+                position = game.get_snapshot()
+                body += pack_position(position[0], position[1])
+                body.append(STATES.index(position[3]))
+
+        self._offsets.append(self._file.tell())
+        self._file.write(GAME_HEADER.pack(GAME_MARKER, flags, STATES.index(game.get_game_state()), move_count,
+                                          start[2]))
+        self._file.write(body)
+        return len(self._offsets) - 1
+
+    def write_games(self, games):
+        """
+        Method to write every game produced by an iterable, one at a time.
+        :param games: iterable of move sequences from the standard starting position
+        :return: Number of games written
+        :rtype: int
+        """
+        written = 0
+        for moves in games:
+            self.write_game(moves)
+            written += 1
+        return written
+
+    def close(self):
+        """
+        Method to write the index of game offsets and close the file.
+        :return: No return.
+        """
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(INDEX_HEADER.pack(INDEX_MAGIC, len(self._offsets)))
+        for offset in self._offsets:
+            self._file.write(OFFSET.pack(offset))
+        self._file.write(INDEX_FOOTER.pack(index_offset, END_MAGIC))
+        self._file.close()
+
+
+class GameRecord:
+    """
+    One game read from a record file: its starting position, moves and final state.
+    """
+
+    def __init__(self, snapshot, moves, state, checkpoints):
+        """
+        Initialization method containing class data attributes:
+        :param snapshot: tuple in the form of GessGame.get_snapshot() of the starting position
+        :param moves: list of (centr, new_centr) pairs, None for a resignation
+        :param state: str final game state
+        :param checkpoints: list of the snapshots stored every checkpoint interval moves
+        :var self.snapshot - Starting position
+        :var self.moves - Moves of the game
+        :var self.state - Final game state
+        :var self.checkpoints - Positions stored in the record
+        """
+        self.snapshot = snapshot
+        self.moves = moves
+        self.state = state
+        self.checkpoints = checkpoints
+
+
+def parse_game(data, offset, interval):
+    """
+    Decode the game record starting at an offset of a buffer
+    :param data: bytes-like buffer holding the record
+    :param offset: int offset of the record
+    :param interval: int checkpoint interval of the file, 0 for none
+    :return: Decoded game, offset just past the record
+    :rtype: tuple
+    """
+    marker, flags, state, move_count, turn_count = GAME_HEADER.unpack_from(data, offset)
+    if marker != GAME_MARKER:
+        raise ValueError("no game record at offset " + str(offset))
+    position = offset + GAME_HEADER.size
+    black, white = INITIAL_POSITION
+    if flags & FLAG_START_POSITION:
+        black, white = unpack_position(data[position:position + POSITION_SIZE])
+        position += POSITION_SIZE
+
+    moves = []
+    checkpoints = []
+    played = 0
+    for count in range(1, move_count + 1):
+        move = decode_move(MOVE.unpack_from(data, position)[0])
+        moves.append(move)
+        position += MOVE.size
+        # A resignation does not pass the turn
+        if move is not None:
+            played += 1
+        if interval and count % interval == 0:
+            checkpoint_black, checkpoint_white = unpack_position(data[position:position + POSITION_SIZE])
+            checkpoints.append((checkpoint_black, checkpoint_white, turn_count + played,
+                                STATES[data[position + POSITION_SIZE]]))
+            position += CHECKPOINT_SIZE
+    return GameRecord((black, white, turn_count, "UNFINISHED"), moves, STATES[state], checkpoints), position
+
+
+def read_games(path):
+    """
+    Generator reading the games of a record file one at a time, in the order they were written. The file is read
+    sequentially, so records can be read while the file is still being written.
+    :param path: str path of the record file
+    :return: Generator of GameRecord
+    :rtype: generator
+    """
+    with open(path, "rb") as file:
+        magic, version, _, interval = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+        if magic != FILE_MAGIC or version != VERSION:
+            raise ValueError("not a Gess game record file: " + path)
+        while True:
+            header = file.read(GAME_HEADER.size)
+            if len(header) < GAME_HEADER.size or header[:2] != GAME_MARKER:
+                return
+            flags, move_count = header[2], GAME_HEADER.unpack(header)[3]
+            data = header + file.read(record_size(flags, move_count, interval) - GAME_HEADER.size)
+            yield parse_game(data, 0, interval)[0]
+
+
+class GameRecordReader:
+    """
+    Game record reader class that serves to do the following:
+    - Map a record file into memory and find every game record through the index written at the end of the file,
+      or by stepping over the record headers if the file has no index
+    - Return any game, or the position after any move of any game, reading only that game's record and replaying
+      from the closest checkpoint
+    """
+
+    def __init__(self, path):
+        """
+        Initialization method containing class data attributes:
+        :param path: str path of the record file
+        :var self._file - Open record file
+        :var self._data - Memory map of the file
+        :var self._interval - Checkpoint interval of the file
+        :var self._offsets - Offset of every game record
+        """
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        magic = None
+        if len(self._data) >= FILE_HEADER.size:
+            magic, version, _, self._interval = FILE_HEADER.unpack_from(self._data, 0)
+        if magic != FILE_MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("not a Gess game record file: " + path)
+        try:
+            self._offsets = self.read_index()
+        except struct.error:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """
+        Method to count the games in the file
+        :return: Number of games
+        :rtype: int
+        """
+        return len(self._offsets)
+
+    def close(self):
+        """
+        Method to release the memory map and close the file.
+        :return: No return.
+        """
+        self._data.close()
+        self._file.close()
+
+    def read_index(self):
+        """
+        Support method loading the offsets of the game records from the index, or by stepping from one record header
+        to the next if the file was not closed by its writer.
+        :return: List of record offsets
+        :rtype: list
+        """
+        data = self._data
+        if len(data) >= FILE_HEADER.size + INDEX_FOOTER.size:
+            index_offset, end = INDEX_FOOTER.unpack_from(data, len(data) - INDEX_FOOTER.size)
+            if end == END_MAGIC:
+                magic, count = INDEX_HEADER.unpack_from(data, index_offset)
+                if magic == INDEX_MAGIC:
+                    start = index_offset + INDEX_HEADER.size
+                    return [OFFSET.unpack_from(data, start + i * OFFSET.size)[0] for i in range(count)]
+
+        offsets = []
+        offset = FILE_HEADER.size
+        while offset + GAME_HEADER.size <= len(data) and data[offset:offset + 2] == GAME_MARKER:
+            marker, flags, state, move_count, turn_count = GAME_HEADER.unpack_from(data, offset)
+            size = record_size(flags, move_count, self._interval)
+            if offset + size > len(data):
+                break
+            offsets.append(offset)
+            offset += size
+        return offsets
+
+    def get_game(self, number):
+        """
+        Get method to return one game of the file
+        :param number: int number of the game, from 0
+        :return: Decoded game
+        :rtype: GameRecord
+        """
+        return parse_game(self._data, self._offsets[number], self._interval)[0]
+
+    def get_move_count(self, number):
+        """
+        Get method to return the number of moves of a game
+        :param number: int number of the game, from 0
+        :return: Number of moves
+        :rtype: int
+        """
+        return GAME_HEADER.unpack_from(self._data, self._offsets[number])[3]
+
+    def get_move(self, number, index):
+        """
+        Get method to return one move of a game, read directly from its offset
+        :param number: int number of the game, from 0
+        :param index: int number of the move, from 0
+        :return: (centr, new_centr) pair, None for a resignation
+        :rtype: tuple
+        """
+        offset = self._offsets[number]
+        flags = self._data[offset + 2]
+        if not 0 <= index < self.get_move_count(number):
+            raise IndexError("move index out of range")
+        return decode_move(MOVE.unpack_from(self._data, offset + move_offset(flags, index, self._interval))[0])
+
+    def get_position(self, number, moves_played, game_class=BitboardGessGame):
+        """
+        Method to set up a game at the position reached after a number of moves of a recorded game, starting from
+        the last checkpoint at or before it and replaying only the moves after the checkpoint.
+        :param number: int number of the game, from 0
+        :param moves_played: int number of moves to play, from 0 to the number of moves of the game
+        :param game_class: GessGame or a backend subclass to set up
+        :return: Game at the requested position
+        :rtype: GessGame
+        """
+        offset = self._offsets[number]
+        marker, flags, state, move_count, turn_count = GAME_HEADER.unpack_from(self._data, offset)
+        if not 0 <= moves_played <= move_count:
+            raise IndexError("move index out of range")
+
+        first = 0
+        if self._interval and moves_played >= self._interval:
+            first = moves_played // self._interval * self._interval
+            position = offset + move_offset(flags, first, self._interval) - CHECKPOINT_SIZE
+            black, white = unpack_position(self._data[position:position + POSITION_SIZE])
+            # A resignation does not pass the turn; it ends the game, so only the last move can be one
+            played = first
+            if self.get_move(number, first - 1) is None:
+                played -= 1
+            snapshot = (black, white, turn_count + played, STATES[self._data[position + POSITION_SIZE]])
+        elif flags & FLAG_START_POSITION:
+            position = offset + GAME_HEADER.size
+            black, white = unpack_position(self._data[position:position + POSITION_SIZE])
+            snapshot = (black, white, turn_count, "UNFINISHED")
+        else:
+            snapshot = None
+
+        if snapshot is None:
+            game = game_class()
+        else:
+            game = game_class.from_snapshot(snapshot)
+        for index in range(first, moves_played):
+            replay(game, self.get_move(number, index))
+        return game
@@ -0,0 +1,165 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Bulk replay of recorded Gess Games. Every game of a directory of record files is replayed through the
+# game rules in a pool of worker processes, and one result per game is written as JSON lines as soon as it is ready.
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from GessBitboard import BitboardGessGame
+from GessGame import GessGame
+from GessRecord import GameRecordReader, replay
+
+BACKENDS = {"string": GessGame, "bitboard": BitboardGessGame}
+
+# Extension of the record files written by GessRecord.GameRecordWriter
+RECORD_EXTENSION = ".gess"
+
+
+def list_chunks(directory, chunk_size):
+    """
+    Generator splitting the games of every record file in a directory into chunks of consecutive game numbers. Only
+    the index of one file is read at a time.
+    :param directory: str path of the directory holding the record files
+    :param chunk_size: int maximum number of games per chunk
+    :return: Generator of (path, first game, last game + 1), or (path, None, error message) for unreadable files
+    :rtype: generator
+    """
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(RECORD_EXTENSION):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with GameRecordReader(path) as reader:
+                count = len(reader)
+        except (OSError, ValueError, struct.error) as error:
+            yield path, None, str(error)
+            continue
+        for start in range(0, count, chunk_size):
+            yield path, start, min(start + chunk_size, count)
+
+
+def replay_chunk(path, start, stop, game_class):
+    """
+    Replay a chunk of the games of a record file, stopping each game at its first illegal move.
+    :param path: str path of the record file
+    :param start: int number of the first game
+    :param stop: int number of the game after the last
+    :param game_class: GessGame or a backend subclass to replay with
+    :return: List of results, one dict per game, with an "error" key for records that cannot be decoded
+    :rtype: list
+    """
+    results = []
+    with GameRecordReader(path) as reader:
+        for number in range(start, stop):
+            try:
+                record = reader.get_game(number)
+            except (ValueError, IndexError, struct.error) as error:
+                results.append({"file": path, "game": number, "error": str(error)})
+                continue
+            game = game_class.from_snapshot(record.snapshot)
+            illegal = None
+            for index, move in enumerate(record.moves):
+                if not replay(game, move):
+                    illegal = {"index": index, "move": move}
+                    break
+            results.append({"file": path, "game": number, "state": game.get_game_state(),
+                            "turn_count": game.get_turn_count(), "recorded_state": record.state,
+                            "illegal_move": illegal})
+    return results
+
+
+def replay_directory(directory, workers=1, chunk_size=256, game_class=BitboardGessGame):
+    """
+    Generator replaying every game of the record files in a directory. Chunks are handed to the workers as others
+    finish, so no more than two chunks per worker are waiting at any time, and results are yielded in the order the
+    chunks complete.
+    :param directory: str path of the directory holding the record files
+    :param workers: int number of worker processes, 1 replays in process
+    :param chunk_size: int maximum number of games per chunk
+    :param game_class: GessGame or a backend subclass to replay with
+    :return: Generator of result dicts, one per game, with an "error" key for records or files that cannot be read
+    :rtype: generator
+    """
+    chunks = list_chunks(directory, chunk_size)
+    if workers == 1:
+        for path, start, stop in chunks:
+            if start is None:
+                yield {"file": path, "error": stop}
+                continue
+            for result in replay_chunk(path, start, stop, game_class):
+                yield result
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                elif chunk[1] is None:
+                    yield {"file": chunk[0], "error": chunk[2]}
+                else:
+                    pending.add(executor.submit(replay_chunk, chunk[0], chunk[1], chunk[2], game_class))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    yield result
+
+
+def main(argv=None):
+    """
+    Command line entry point: replay a directory of record files and write one JSON line per game, then a summary
+    to standard error.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status, 1 if any game has an illegal move, a final state differing from its record or an unreadable
+    file
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Replay and validate a directory of recorded Gess Games.")
+    parser.add_argument("directory", help="directory holding " + RECORD_EXTENSION + " record files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=256, help="games handed to a worker at a time")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="bitboard", help="board backend to replay with")
+    parser.add_argument("--output", help="file to write the results to, defaults to standard output")
+    arguments = parser.parse_args(argv)
+
+    output = sys.stdout
+    if arguments.output:
+        output = open(arguments.output, "w")
+    games = 0
+    failures = 0
+    start = time.perf_counter()
+    try:
+        for result in replay_directory(arguments.directory, arguments.workers, arguments.chunk_size,
+                                       BACKENDS[arguments.backend]):
+            output.write(json.dumps(result) + "\n")
+            if "error" in result:
+                failures += 1
+                continue
+            games += 1
+            if result["illegal_move"] is not None or result["state"] != result["recorded_state"]:
+                failures += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    sys.stderr.write("%d games, %d failures, %.1f s, %.0f games per second\n" %
+                     (games, failures, elapsed, games / elapsed if elapsed else 0.0))
+    if failures:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
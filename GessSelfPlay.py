@@ -0,0 +1,348 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Self-play training data for the Gess Game. Games are played by random or engine policies in worker
+# processes, every position is encoded as stacked binary planes with NumPy, and the planes, moves and outcomes are
+# appended to memory-mapped .npy shards listed in a manifest so an interrupted run can be resumed.
+
+import argparse
+import collections
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from GessBitboard import BitboardGessGame
+from GessEngine import GessEngine
+from GessGame import CELL_INDEX
+
+# Planes of each encoded position, in order; each is 20x20 indexed [x, y - 1] like the cell index x * 20 + y - 1
+PLANES = ("black", "white", "side_to_move", "black_rings", "white_rings")
+
+# Arrays stored for each position: dtype and shape after the position axis
+FIELDS = {"planes": ("uint8", (len(PLANES), 20, 20)), "moves": ("int16", (2,)), "outcomes": ("int8", ()),
+          "games": ("int32", ()), "plies": ("int16", ())}
+
+MANIFEST = "manifest.json"
+
+# Settings that must match to resume a run
+SETTINGS = ("shard_size", "seed", "policy", "max_moves", "depth", "explore")
+
+
+def mask_planes(masks):
+    """
+    Unpack a list of 400 bit cell masks into 20x20 planes at once.
+    :param masks: list of int bitmasks, bit x * 20 + y - 1 standing for the square at x, y
+    :return: Array of shape (len(masks), 20, 20) of 0 and 1
+    :rtype: numpy.ndarray
+    """
+    packed = np.frombuffer(b"".join(mask.to_bytes(50, "little") for mask in masks), dtype=np.uint8)
+    return np.unpackbits(packed.reshape(-1, 50), axis=1, bitorder="little").reshape(-1, 20, 20)
+
+
+def encode_positions(positions):
+    """
+    Encode positions as stacked planes: black stones, white stones, side to move (all ones when white is to move)
+    and the centers of each color's rings.
+    :param positions: list of (black, white, turn count, black ring centers, white ring centers) with masks as ints
+    :return: Array of shape (len(positions), len(PLANES), 20, 20) of 0 and 1
+    :rtype: numpy.ndarray
+    """
+    planes = np.zeros((len(positions), len(PLANES), 20, 20), dtype=np.uint8)
+    if not positions:
+        return planes
+    black, white, turn_counts, black_rings, white_rings = zip(*positions)
+    planes[:, 0] = mask_planes(black)
+    planes[:, 1] = mask_planes(white)
+    planes[:, 2] = (np.array(turn_counts) % 2)[:, None, None]
+    planes[:, 3] = mask_planes(black_rings)
+    planes[:, 4] = mask_planes(white_rings)
+    return planes
+
+
+def play_game(number, seed, policy, max_moves, depth, explore):
+    """
+    Play one self-play game and encode every position before a move. The game number and seed fix the random
+    choices, so a game played again on resume is the same game.
+    :param number: int number of the game in the run
+    :param seed: int seed of the run
+    :param policy: str "random" or "engine"
+    :param max_moves: int maximum number of moves before the game is abandoned
+    :param depth: int search depth of the engine policy
+    :param explore: float chance the engine policy plays a random move instead, for variety
+    :return: Dict of the FIELDS arrays of the game's positions and its final state
+    :rtype: dict
+    """
+    rng = random.Random("%d:%d" % (seed, number))
+    game = BitboardGessGame()
+    engine = None
+    if policy == "engine":
+        engine = GessEngine(time_limit_ms=10 ** 9, max_depth=depth, table_size=1 << 14)
+
+    positions = []
+    moves = []
+    while len(moves) < max_moves and game.get_game_state() == "UNFINISHED":
+        legal = list(game.generate_legal_moves())
+        if not legal:
+            break
+        if engine is None or rng.random() < explore:
+            move = rng.choice(legal)
+        else:
+            move = engine.choose_move(game)
+        black, white, turn_count = game.get_snapshot()[:3]
+        positions.append((black, white, turn_count) + game.get_ring_masks())
+        moves.append((CELL_INDEX[move[0]], CELL_INDEX[move[1]]))
+        game.make_move(*move)
+
+    # Outcomes are from the point of view of the player to move: 1 won, -1 lost, 0 abandoned
+    state = game.get_game_state()
+    winner = {"BLACK_WON": 0, "WHITE_WON": 1}.get(state)
+    outcomes = np.zeros(len(moves), dtype=np.int8)
+    if winner is not None:
+        outcomes[:] = np.where(np.arange(len(moves)) % 2 == winner, 1, -1)
+    return {"planes": encode_positions(positions), "moves": np.array(moves, dtype=np.int16).reshape(-1, 2),
+            "outcomes": outcomes, "games": np.full(len(moves), number, dtype=np.int32),
+            "plies": np.arange(len(moves), dtype=np.int16), "state": state}
+
+
+class ShardWriter:
+    """
+    Shard Writer class that serves to do the following:
+    - Append encoded positions to fixed size memory-mapped .npy shards, one file per field of FIELDS
+    - Record the games and positions written in a manifest, replaced atomically, so a run can resume from it
+    Positions past a shard's recorded count, left by an interrupted run, are overwritten on resume.
+    """
+
+    def __init__(self, directory, settings):
+        """
+        Initialization method containing class data attributes:
+        :param directory: str path of the output directory, created if missing
+        :param settings: dict of the SETTINGS values of the run
+        :var self._directory - Output directory
+        :var self._manifest - Settings, games completed and the position count of every shard
+        :var self._arrays - Dict of field name to the memory map of the current shard, None before the first write
+        :raises ValueError: if the directory holds a run with different settings
+        """
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as manifest:
+                self._manifest = json.load(manifest)
+            for name in SETTINGS:
+                if self._manifest["settings"][name] != settings[name]:
+                    raise ValueError("run in %s has %s %r" % (directory, name, self._manifest["settings"][name]))
+        else:
+            self._manifest = {"settings": dict(settings), "planes": list(PLANES), "games_completed": 0,
+                              "positions": 0, "shards": []}
+        self._arrays = None
+
+    def get_games_completed(self):
+        """
+        Get method to return the number of games written
+        :return: Games completed according to the manifest
+        :rtype: int
+        """
+        return self._manifest["games_completed"]
+
+    def get_manifest(self):
+        """
+        Get method to return the manifest
+        :return: self._manifest
+        :rtype: dict
+        """
+        return self._manifest
+
+    def shard_path(self, index, field):
+        """
+        Support method returning the path of the file of a field of a shard.
+        :param index: int shard number
+        :param field: str name from FIELDS
+        :return: File path
+        :rtype: str
+        """
+        return os.path.join(self._directory, "shard_%05d_%s.npy" % (index, field))
+
+    def open_shard(self):
+        """
+        Support method mapping the last shard of the manifest, creating a new one when there is none or it is full.
+        :return: No return.
+        """
+        shards = self._manifest["shards"]
+        size = self._manifest["settings"]["shard_size"]
+        if not shards or shards[-1]["positions"] == size:
+            shards.append({"index": len(shards), "positions": 0})
+            mode = "w+"
+        else:
+            mode = "r+"
+        index = shards[-1]["index"]
+        self._arrays = {}
+        for field, (dtype, shape) in FIELDS.items():
+            if mode == "w+":
+                self._arrays[field] = np.lib.format.open_memmap(self.shard_path(index, field), mode="w+",
+                                                                 dtype=dtype, shape=(size,) + shape)
+            else:
+                self._arrays[field] = np.load(self.shard_path(index, field), mmap_mode="r+")
+
+    def append(self, result):
+        """
+        Method to copy the positions of a game from play_game() into the shards, spilling into new shards as they
+        fill. The manifest is not updated until commit().
+        :param result: dict returned by play_game()
+        :return: No return.
+        """
+        count = len(result["outcomes"])
+        size = self._manifest["settings"]["shard_size"]
+        written = 0
+        while written < count:
+            if self._arrays is None or self._manifest["shards"][-1]["positions"] == size:
+                self.flush()
+                self.open_shard()
+            shard = self._manifest["shards"][-1]
+            take = min(count - written, size - shard["positions"])
+            for field in FIELDS:
+                self._arrays[field][shard["positions"]:shard["positions"] + take] = result[field][written:
+                                                                                                  written + take]
+            shard["positions"] += take
+            written += take
+        self._manifest["positions"] += count
+        self._manifest["games_completed"] += 1
+
+    def flush(self):
+        """
+        Support method writing the current shard's memory maps to disk.
+        :return: No return.
+        """
+        if self._arrays is not None:
+            for array in self._arrays.values():
+                array.flush()
+            self._arrays = None
+
+    def commit(self):
+        """
+        Method to flush the shards and then replace the manifest, so it never lists positions that are not on disk.
+        :return: No return.
+        """
+        if self._arrays is not None:
+            for array in self._arrays.values():
+                array.flush()
+        path = os.path.join(self._directory, MANIFEST)
+        with open(path + ".tmp", "w") as manifest:
+            json.dump(self._manifest, manifest, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """
+        Method to commit and release the memory maps.
+        :return: No return.
+        """
+        self.commit()
+        self.flush()
+
+
+def generate(directory, games, workers=1, shard_size=65536, seed=1, policy="random", max_moves=200, depth=2,
+             explore=0.1, commit_games=64):
+    """
+    Play self-play games into a shard directory, resuming after the games its manifest already lists. Games are
+    handed to the workers in order and written in order, with no more than four games per worker waiting, and the
+    manifest is committed every commit_games games.
+    :param directory: str path of the output directory
+    :param games: int total number of games the run should hold
+    :param workers: int number of worker processes, 1 plays in process
+    :param shard_size: int positions per shard
+    :param seed: int seed of the run
+    :param policy: str "random" or "engine"
+    :param max_moves: int maximum number of moves per game
+    :param depth: int search depth of the engine policy
+    :param explore: float chance the engine policy plays a random move
+    :param commit_games: int games written between manifest commits
+    :return: Manifest after the run
+    :rtype: dict
+    """
+    settings = {"shard_size": shard_size, "seed": seed, "policy": policy, "max_moves": max_moves, "depth": depth,
+                "explore": explore}
+    writer = ShardWriter(directory, settings)
+    numbers = range(writer.get_games_completed(), games)
+    arguments = (seed, policy, max_moves, depth, explore)
+    try:
+        if workers == 1:
+            for number in numbers:
+                writer.append(play_game(number, *arguments))
+                if writer.get_games_completed() % commit_games == 0:
+                    writer.commit()
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                pending = collections.deque()
+                numbers = iter(numbers)
+                while True:
+                    while len(pending) < workers * 4:
+                        number = next(numbers, None)
+                        if number is None:
+                            break
+                        pending.append(executor.submit(play_game, number, *arguments))
+                    if not pending:
+                        break
+                    writer.append(pending.popleft().result())
+                    if writer.get_games_completed() % commit_games == 0:
+                        writer.commit()
+    finally:
+        writer.close()
+    return writer.get_manifest()
+
+
+def read_shards(directory):
+    """
+    Generator over the shards of a run, memory mapped read only and cut to the positions the manifest lists.
+    :param directory: str path of the run directory
+    :return: Generator of dicts of field name to array
+    :rtype: generator
+    """
+    with open(os.path.join(directory, MANIFEST)) as manifest:
+        shards = json.load(manifest)["shards"]
+    for shard in shards:
+        arrays = {}
+        for field in FIELDS:
+            path = os.path.join(directory, "shard_%05d_%s.npy" % (shard["index"], field))
+            arrays[field] = np.load(path, mmap_mode="r")[:shard["positions"]]
+        yield arrays
+
+
+def main(argv=None):
+    """
+    Command line entry point: generate or resume a self-play run and print its manifest totals.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Generate Gess Game self-play training data as .npy shards.")
+    parser.add_argument("directory", help="output directory; an existing run in it is resumed")
+    parser.add_argument("--games", type=int, default=1000, help="total games the run should hold")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--shard-size", type=int, default=65536, help="positions per shard")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the run")
+    parser.add_argument("--policy", choices=("random", "engine"), default="random", help="move choice policy")
+    parser.add_argument("--max-moves", type=int, default=200, help="moves before a game is abandoned")
+    parser.add_argument("--depth", type=int, default=2, help="search depth of the engine policy")
+    parser.add_argument("--explore", type=float, default=0.1, help="chance the engine policy plays a random move")
+    parser.add_argument("--commit-games", type=int, default=64, help="games between manifest commits")
+    arguments = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        manifest = generate(arguments.directory, arguments.games, arguments.workers, arguments.shard_size,
+                            arguments.seed, arguments.policy, arguments.max_moves, arguments.depth, arguments.explore,
+                            arguments.commit_games)
+    except ValueError as error:
+        sys.stderr.write("%s\n" % error)
+        return 1
+    elapsed = time.perf_counter() - start
+    sys.stderr.write("%d games, %d positions, %d shards, %.1f s\n" % (manifest["games_completed"],
+                     manifest["positions"], len(manifest["shards"]), elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
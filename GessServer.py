@@ -0,0 +1,570 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Asyncio server hosting many concurrent Gess Game sessions over a JSON lines TCP protocol, and a load
+# generator client to measure it.
+
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessBitboard import BitboardGessGame
+from GessCompact import CompactGessGame
+from GessGame import GessGame, REJECTION_MESSAGES, ACCEPTED
+from GessJournal import JournalError, SessionJournal, compact, recover
+
+BACKENDS = {"string": GessGame, "bitboard": BitboardGessGame, "compact": CompactGessGame}
+
+# Longest request line accepted, in bytes
+LINE_LIMIT = 1 << 16
+
+# Protocol: every request and response is one JSON object on its own line. Requests carry an "op" and an optional
+# "id" that is echoed back; a connection may send any number of requests before reading the responses, which come
+# back in request order.
+#   {"op": "new"}                                   -> {"game": id}
+#   {"op": "move", "game": id, "from": "c3", "to": "c4"}
+#                                                   -> {"accepted": bool, "reason": str or null, "state": str}
+#   {"op": "resign", "game": id}                    -> {"state": str}
+#   {"op": "state", "game": id}                     -> {"state": str, "turn_count": int}
+#   {"op": "board", "game": id}                     -> {"rows": [20 rows of ".", "B", "W"], "turn_count", "state"}
+#   {"op": "moves", "game": id}                     -> {"moves": [[centr, new_centr], ...]}
+#   {"op": "watch", "game": id}                     -> {}, preceded by the event line
+#                                                      {"event": "snapshot", "game": id, "snapshot": full position}
+#   {"op": "unwatch", "game": id}                   -> {}
+#   {"op": "close", "game": id}                     -> {}
+#   {"op": "stats"}                                 -> {"sessions": int, "requests": int, "journal": log counters}
+# Every response has "ok"; failed requests have "ok": false and an "error" message instead of the results. A watching
+# connection is also sent {"event": "delta", "game": id, "delta": changed cells} after every change to the game, in
+# the formats of GessGame.get_serialized_snapshot() and GessGame.subscribe(). A server with a journal answers new, move,
+# resign and close only once the change is durable, and recovers every open game when it restarts. Once the journal
+# fails they are answered with its error, though the change stays in the game in memory.
+
+
+class RequestError(Exception):
+    """
+    Raised while handling a request that cannot be carried out, to answer it with an error.
+    """
+
+
+def play_move(game, centr, new_centr):
+    """
+    Make a move quietly
+    :param game: GessGame instance or CompactGessGame
+    :param centr: str alphanumeric coordinate of the piece center
+    :param new_centr: str alphanumeric coordinate of the new center
+    :return: Boolean value True if the move was made, message of the first failed check or None
+    :rtype: tuple
+    """
+    code = game.try_move(centr, new_centr)
+    return code == ACCEPTED, REJECTION_MESSAGES[code]
+
+
+def board_rows(snapshot):
+    """
+    Render the stones of a snapshot as one string per x axis row, "." for empty, "B" and "W" for stones
+    :param snapshot: tuple from GessGame.get_snapshot()
+    :return: List of 20 strings of 20 characters
+    :rtype: list
+    """
+    black, white = snapshot[:2]
+    rows = []
+    for x in range(20):
+        row = []
+        for y in range(1, 21):
+            bit = 1 << (x * 20 + y - 1)
+            if black & bit:
+                row.append("B")
+            elif white & bit:
+                row.append("W")
+            else:
+                row.append(".")
+        rows.append("".join(row))
+    return rows
+
+
+def list_legal_moves(game_class, snapshot):
+    """
+    Executor entry point listing the legal moves of a position rebuilt from its snapshot.
+    :param game_class: GessGame or a backend subclass
+    :param snapshot: tuple from GessGame.get_snapshot()
+    :return: List of [centr, new_centr] pairs
+    :rtype: list
+    """
+    return [list(move) for move in game_class.from_snapshot(snapshot).generate_legal_moves()]
+
+
+class GameSession:
+    """
+    One hosted game and the lock that keeps requests to it in order while one waits on the executor.
+    """
+
+    __slots__ = ("game", "lock")
+
+    def __init__(self, game):
+        """
+        Initialization method containing class data attributes:
+        :param game: GessGame instance
+        :var self.game - Game of the session
+        :var self.lock - asyncio.Lock held while a request uses the game
+        """
+        self.game = game
+        self.lock = asyncio.Lock()
+
+
+class GessServer:
+    """
+    Gess Server class that serves to do the following:
+    - Accept TCP connections and answer JSON lines requests, pipelined, in the order they arrive
+    - Host any number of game sessions shared by all connections
+    - Handle moves on the event loop, as they take well under a millisecond, and send listing the legal moves, which
+      takes tens of milliseconds, to a process pool
+    """
+
+    def __init__(self, host="127.0.0.1", port=7000, game_class=GessGame, workers=None, journal=None,
+                 checkpoint_interval=60.0):
+        """
+        Initialization method containing class data attributes:
+        :param host: str address to listen on
+        :param port: int port to listen on, 0 for any free port
+        :param game_class: GessGame, a backend subclass or CompactGessGame for new sessions
+        :param workers: int number of processes listing legal moves, defaults to the number of CPU cores
+        :param journal: str directory of the session journal, None to keep games in memory only
+        :param checkpoint_interval: float seconds between journal snapshots
+        :var self._host - Address to listen on
+        :var self._port - Port to listen on, updated to the bound port by start()
+        :var self._game_class - Backend of new sessions
+        :var self._workers - Number of executor processes
+        :var self._executor - Process pool for CPU heavy requests, started by start()
+        :var self._server - asyncio server, set by start()
+        :var self._sessions - Dict of game id to GameSession
+        :var self._ids - Counter handing out game ids
+        :var self._requests - Number of requests answered
+        :var self._journal_directory - Directory of the session journal, None without one
+        :var self._journal - SessionJournal logging session changes, opened by start()
+        :var self._checkpoint_interval - Seconds between journal snapshots
+        :var self._checkpoint_task - asyncio.Task starting journal snapshots
+        :var self._compaction - Future of the running journal snapshot, None if none has started
+        :var self._commit_waiters - deque of (sequence number, asyncio.Future) of requests waiting for a commit
+        :var self._recovery - Counts from recovering the journal, None without one
+        """
+        self._host = host
+        self._port = port
+        self._game_class = game_class
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = None
+        self._server = None
+        self._sessions = {}
+        self._ids = itertools.count(1)
+        self._requests = 0
+        self._journal_directory = journal
+        self._journal = None
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_task = None
+        self._compaction = None
+        self._commit_waiters = collections.deque()
+        self._recovery = None
+
+    def get_port(self):
+        """
+        Get method to return the port the server listens on
+        :return: self._port
+        :rtype: int
+        """
+        return self._port
+
+    async def start(self):
+        """
+        Method to start the executor, recover the sessions of the journal if there is one, and start listening.
+        :return: No return.
+        """
+        self._executor = ProcessPoolExecutor(self._workers)
+        if self._journal_directory is not None:
+            loop = asyncio.get_running_loop()
+            games, self._recovery = await loop.run_in_executor(None, recover, self._journal_directory,
+                                                               self._game_class, self._executor)
+            for game_id, game in games.items():
+                self._sessions[game_id] = GameSession(game)
+            # Ids of closed sessions are never handed out again
+            self._ids = itertools.count(max(self._recovery["last_session"], max(games, default=0)) + 1)
+            self._journal = SessionJournal(self._journal_directory, on_commit=lambda sequence:
+                                           loop.call_soon_threadsafe(self.release_commits, sequence),
+                                           on_error=lambda error: loop.call_soon_threadsafe(self.fail_commits, error))
+            self._checkpoint_task = asyncio.create_task(self.run_checkpoints())
+        self._server = await asyncio.start_server(self.handle_connection, self._host, self._port, limit=LINE_LIMIT)
+        self._port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """
+        Method to stop listening, commit the journal and shut down the executor.
+        :return: No return.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+            self._checkpoint_task = None
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def serve_forever(self):
+        """
+        Method to start the server and answer requests until cancelled.
+        :return: No return.
+        """
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def run_checkpoints(self):
+        """
+        Method starting a journal snapshot on the executor every checkpoint interval, unless the last one is still
+        running. Rotating the log waits for a commit and a directory sync, so it runs on a thread off the event loop.
+        :return: No return.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            if self._compaction is None or self._compaction.done():
+                try:
+                    segment = await loop.run_in_executor(None, self._journal.rotate)
+                except JournalError:
+                    # Requests report the failure; a failed log cannot be rotated again
+                    return
+                self._compaction = self._executor.submit(compact, self._journal.get_directory(), segment)
+
+    def release_commits(self, sequence):
+        """
+        Support method answering the requests waiting for journal records up to a sequence number, on the event
+        loop after each commit.
+        :param sequence: int sequence number of the last durable record
+        :return: No return.
+        """
+        waiters = self._commit_waiters
+        while waiters and waiters[0][0] <= sequence:
+            future = waiters.popleft()[1]
+            if not future.done():
+                future.set_result(None)
+
+    def fail_commits(self, error):
+        """
+        Support method answering every request waiting for a commit with the error that stopped the journal, on the
+        event loop.
+        :param error: Exception that stopped the commit thread
+        :return: No return.
+        """
+        waiters = self._commit_waiters
+        while waiters:
+            future = waiters.popleft()[1]
+            if not future.done():
+                future.set_exception(JournalError("journal failed: " + str(error)))
+
+    async def commit(self, sequence):
+        """
+        Support method waiting until a journal record is durable. Records are appended from the event loop only, so
+        waiters queue up in sequence order.
+        :param sequence: int sequence number of the record
+        :return: No return.
+        """
+        if self._journal.get_durable() >= sequence:
+            return
+        if self._journal.get_error() is not None:
+            raise JournalError("journal failed: " + str(self._journal.get_error()))
+        future = asyncio.get_running_loop().create_future()
+        self._commit_waiters.append((sequence, future))
+        await future
+
+    async def handle_connection(self, reader, writer):
+        """
+        Method answering the requests of one connection in order until it closes.
+        :param reader: asyncio.StreamReader of the connection
+        :param writer: asyncio.StreamWriter of the connection
+        :return: No return.
+        """
+        watches = {}
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"ok": false, "error": "request too long"}\n')
+                    break
+                if not line:
+                    break
+                response = await self.handle_line(line, writer, watches)
+                writer.write(json.dumps(response).encode() + b"\n")
+                # Only wait for the client to read when the send buffer is full
+                if writer.transport.get_write_buffer_size() > LINE_LIMIT:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id, callback in watches.items():
+                session = self._sessions.get(game_id)
+                if session is not None:
+                    session.game.unsubscribe(callback)
+            writer.close()
+
+    async def handle_line(self, line, writer, watches):
+        """
+        Support method decoding one request line and answering it.
+        :param line: bytes request line
+        :param writer: asyncio.StreamWriter of the connection
+        :param watches: dict of the game ids the connection watches to their subscribed callbacks
+        :return: Response
+        :rtype: dict
+        """
+        self._requests += 1
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "invalid JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be an object"}
+
+        try:
+            response = await self.handle_request(request, writer, watches)
+            response["ok"] = True
+        except (RequestError, JournalError) as error:
+            response = {"ok": False, "error": str(error)}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_request(self, request, writer, watches):
+        """
+        Support method carrying out one request.
+        :param request: dict decoded request
+        :param writer: asyncio.StreamWriter of the connection, for watch events
+        :param watches: dict of the game ids the connection watches to their subscribed callbacks
+        :return: Results of the request
+        :rtype: dict
+        """
+        op = request.get("op")
+        if op == "new":
+            game_id = next(self._ids)
+            self._sessions[game_id] = GameSession(self._game_class())
+            if self._journal is not None:
+                await self.commit(self._journal.open_session(game_id))
+            return {"game": game_id}
+        if op == "stats":
+            response = {"sessions": len(self._sessions), "requests": self._requests}
+            if self._journal is not None:
+                response["journal"] = self._journal.get_stats()
+                response["recovery"] = self._recovery
+            return response
+
+        game_id = request.get("game")
+        # Ids are ints; 1.0 or True would find the session but are not ids, and lists cannot be looked up at all
+        if type(game_id) is not int:
+            raise RequestError("game must be an integer id")
+        session = self._sessions.get(game_id)
+        if session is None:
+            raise RequestError("unknown game")
+        async with session.lock:
+            game = session.game
+            if op == "move":
+                centr = request.get("from")
+                new_centr = request.get("to")
+                if not isinstance(centr, str) or not isinstance(new_centr, str):
+                    raise RequestError("move needs from and to coordinates")
+                accepted, reason = play_move(game, centr, new_centr)
+                if accepted and self._journal is not None:
+                    await self.commit(self._journal.log_move(game_id, centr, new_centr))
+                return {"accepted": accepted, "reason": reason, "state": game.get_game_state()}
+            if op == "resign":
+                if game.get_game_state() != "UNFINISHED":
+                    raise RequestError("game is finished")
+                game.resign_game()
+                if self._journal is not None:
+                    await self.commit(self._journal.log_resign(game_id))
+                return {"state": game.get_game_state()}
+            if op == "state":
+                return {"state": game.get_game_state(), "turn_count": game.get_turn_count()}
+            if op == "board":
+                snapshot = game.get_snapshot()
+                return {"rows": board_rows(snapshot), "turn_count": snapshot[2], "state": snapshot[3]}
+            if op == "moves":
+                loop = asyncio.get_running_loop()
+                moves = await loop.run_in_executor(self._executor, list_legal_moves, type(game), game.get_snapshot())
+                return {"moves": moves}
+            if op == "watch":
+                return self.watch(game_id, game, writer, watches)
+            if op == "unwatch":
+                callback = watches.pop(game_id, None)
+                if callback is not None:
+                    game.unsubscribe(callback)
+                return {}
+            if op == "close":
+                del self._sessions[game_id]
+                if self._journal is not None:
+                    await self.commit(self._journal.close_session(game_id))
+                return {}
+        raise RequestError("unknown op")
+
+    def watch(self, game_id, game, writer, watches):
+        """
+        Support method subscribing a connection to the deltas of a game and sending it the cached full position to
+        start from. Every watcher is sent the same serialized delta, so a move costs one serialization however many
+        connections watch.
+        :param game_id: int id of the game
+        :param game: GessGame or a backend subclass
+        :param writer: asyncio.StreamWriter of the connection
+        :param watches: dict of the game ids the connection watches to their subscribed callbacks
+        :return: Empty results
+        :rtype: dict
+        """
+        if not hasattr(game, "subscribe"):
+            raise RequestError("backend does not stream deltas")
+        if game_id not in watches:
+            prefix = ('{"event": "delta", "game": %d, "delta": ' % game_id).encode()
+
+            def send_delta(message):
+                if not writer.is_closing():
+                    writer.write(prefix + message.encode() + b"}\n")
+
+            watches[game_id] = send_delta
+            game.subscribe(send_delta)
+        writer.write(('{"event": "snapshot", "game": %d, "snapshot": %s}\n' %
+                      (game_id, game.get_serialized_snapshot())).encode())
+        return {}
+
+
+def record_scripts(count, length, seed):
+    """
+    Play random games to use as move scripts for the load generator
+    :param count: int number of scripts
+    :param length: int maximum number of moves per script
+    :param seed: int seed of the random move choices
+    :return: List of move lists
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    scripts = []
+    for _ in range(count):
+        game = BitboardGessGame()
+        moves = []
+        while len(moves) < length and game.get_game_state() == "UNFINISHED":
+            legal = list(game.generate_legal_moves())
+            if not legal:
+                break
+            move = rng.choice(legal)
+            game.make_move(*move)
+            moves.append(move)
+        scripts.append(moves)
+    return scripts
+
+
+async def run_client(host, port, script, pipeline, latencies):
+    """
+    Load generator client: open a connection, start a game and play a script of moves, keeping up to the pipeline
+    depth of requests in flight.
+    :param host: str server address
+    :param port: int server port
+    :param script: list of (centr, new_centr) moves
+    :param pipeline: int maximum requests sent ahead of their responses
+    :param latencies: list receiving the seconds each request took
+    :return: Number of failed requests
+    :rtype: int
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+    writer.write(b'{"op": "new"}\n')
+    game_id = json.loads(await reader.readline())["game"]
+
+    requests = [{"op": "move", "game": game_id, "from": centr, "to": new_centr} for centr, new_centr in script]
+    requests.append({"op": "close", "game": game_id})
+    sent = []
+    failures = 0
+    index = 0
+    while index < len(requests) or sent:
+        while index < len(requests) and len(sent) < pipeline:
+            writer.write(json.dumps(requests[index]).encode() + b"\n")
+            sent.append(time.perf_counter())
+            index += 1
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent.pop(0))
+        if not response["ok"] or response.get("accepted") is False:
+            failures += 1
+    writer.close()
+    await writer.wait_closed()
+    return failures
+
+
+async def run_load(host, port, sessions, length, pipeline, seed=1):
+    """
+    Run concurrent load generator clients, one connection and game per session.
+    :param host: str server address
+    :param port: int server port
+    :param sessions: int number of concurrent sessions
+    :param length: int number of moves each session plays
+    :param pipeline: int maximum requests each client sends ahead of their responses
+    :param seed: int seed of the move scripts
+    :return: Sessions, requests, failures, elapsed seconds, requests per second and latency percentiles in
+    milliseconds
+    :rtype: dict
+    """
+    scripts = record_scripts(min(sessions, 16), length, seed)
+    latencies = []
+    start = time.perf_counter()
+    failures = await asyncio.gather(*[run_client(host, port, scripts[index % len(scripts)], pipeline, latencies)
+                                      for index in range(sessions)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {"sessions": sessions, "requests": len(latencies), "failures": sum(failures), "elapsed_s": elapsed,
+            "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+            "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            "p99_ms": latencies[len(latencies) * 99 // 100] * 1000 if latencies else 0.0}
+
+
+def main(argv=None):
+    """
+    Command line entry point: "serve" runs the server, "load" runs the load generator against a server.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: No return.
+    """
+    parser = argparse.ArgumentParser(description="Gess Game server and load generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="host games")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=7000)
+    serve.add_argument("--backend", choices=sorted(BACKENDS), default="string")
+    serve.add_argument("--workers", type=int, default=None, help="processes listing legal moves")
+    serve.add_argument("--journal", default=None, help="directory of the session journal")
+    serve.add_argument("--checkpoint-interval", type=float, default=60.0, help="seconds between journal snapshots")
+    load = commands.add_parser("load", help="generate load against a server")
+    load.add_argument("--host", default="127.0.0.1")
+    load.add_argument("--port", type=int, default=7000)
+    load.add_argument("--sessions", type=int, default=100, help="concurrent sessions")
+    load.add_argument("--moves", type=int, default=40, help="moves played per session")
+    load.add_argument("--pipeline", type=int, default=8, help="requests sent ahead of their responses")
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "serve":
+        server = GessServer(arguments.host, arguments.port, BACKENDS[arguments.backend], arguments.workers,
+                            arguments.journal, arguments.checkpoint_interval)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+    else:
+        result = asyncio.run(run_load(arguments.host, arguments.port, arguments.sessions, arguments.moves,
+                                      arguments.pipeline))
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Tournament runner for Gess Game players. Round-robin or gauntlet games are spread over a process pool,
+# results stream into Elo estimates and a sequential probability ratio test that can stop a match early, and the run
+# reports games per second and how busy each worker was.
+
+import argparse
+import itertools
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from GessBitboard import BitboardGessGame
+from GessEngine import GessEngine, evaluate
+from GessMCTS import GessMCTS
+
+# Kinds of player and the options each takes in a spec such as "engine:depth=3,time=200"
+PLAYER_OPTIONS = {"random": (), "greedy": (), "engine": ("depth", "time"), "mcts": ("iterations", "time")}
+
+
+def parse_player(spec):
+    """
+    Split a player spec into its kind and options, checking both.
+    :param spec: str such as "random", "greedy", "engine:depth=3" or "mcts:iterations=400,time=1000"
+    :return: Kind of player, dict of option name to int value
+    :rtype: tuple
+    :raises ValueError: for an unknown kind or option
+    """
+    kind, _, rest = spec.partition(":")
+    if kind not in PLAYER_OPTIONS:
+        raise ValueError("unknown player %r" % kind)
+    options = {}
+    for item in filter(None, rest.split(",")):
+        name, _, value = item.partition("=")
+        if name not in PLAYER_OPTIONS[kind]:
+            raise ValueError("player %r takes no option %r" % (kind, name))
+        options[name] = int(value)
+    return kind, options
+
+
+class Player:
+    """
+    Player class that serves to do the following:
+    - Choose moves for one side of a game according to a parsed player spec
+    - Own the engine or search tree of the spec for the length of a game
+    """
+
+    def __init__(self, spec, rng):
+        """
+        Initialization method containing class data attributes:
+        :param spec: str player spec, see parse_player()
+        :param rng: random.Random used for random and tie-breaking choices
+        :var self._kind - Kind of player
+        :var self._rng - Random number generator
+        :var self._search - GessEngine or GessMCTS of search players, None otherwise
+        """
+        self._kind, options = parse_player(spec)
+        self._rng = rng
+        self._search = None
+        if self._kind == "engine":
+            self._search = GessEngine(time_limit_ms=options.get("time", 10 ** 9), max_depth=options.get("depth", 2),
+                                      table_size=1 << 16)
+        elif self._kind == "mcts":
+            self._search = GessMCTS(workers=1, time_limit_ms=options.get("time", 10 ** 9),
+                                    iterations=options.get("iterations", 200), seed=rng.getrandbits(32))
+
+    def choose_move(self, game, legal):
+        """
+        Method to pick a move for the player to move.
+        :param game: GessGame instance
+        :param legal: list of the legal (centr, new_centr) moves of the position
+        :return: Chosen move
+        :rtype: tuple
+        """
+        if self._kind == "random":
+            return self._rng.choice(legal)
+        if self._kind == "greedy":
+            return self.greedy_move(game, legal)
+        return self._search.choose_move(game)
+
+    def greedy_move(self, game, legal):
+        """
+        Support method picking the move with the best static evaluation one ply ahead, ties broken at random.
+        :param game: GessGame instance
+        :param legal: list of legal moves
+        :return: Chosen move
+        :rtype: tuple
+        """
+        best = []
+        best_score = None
+        for move in legal:
+            game.make_move(*move)
+            score = -evaluate(game, 1)
+            game.unmake_move()
+            if best_score is None or score > best_score:
+                best = [move]
+                best_score = score
+            elif score == best_score:
+                best.append(move)
+        return self._rng.choice(best)
+
+    def close(self):
+        """
+        Method to release the player's search.
+        :return: No return.
+        """
+        if self._kind == "mcts":
+            self._search.close()
+
+
+def play_game(number, black, white, seed, max_moves, opening_plies):
+    """
+    Play one tournament game. The first plies are random, chosen from the game number and seed, so deterministic
+    players do not repeat the same game.
+    :param number: int number of the game
+    :param black: str spec of the player moving first
+    :param white: str spec of the player moving second
+    :param seed: int seed of the tournament
+    :param max_moves: int number of moves after which the game is a draw
+    :param opening_plies: int number of random opening moves
+    :return: Game number, player specs, score of the black player (1, 0.5 or 0), plies, seconds and worker process id
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    rng = random.Random("%d:%d" % (seed, number))
+    game = BitboardGessGame()
+    players = (Player(black, rng), Player(white, rng))
+    plies = 0
+    try:
+        while plies < max_moves and game.get_game_state() == "UNFINISHED":
+            legal = list(game.generate_legal_moves())
+            if not legal:
+                break
+            if plies < opening_plies:
+                move = rng.choice(legal)
+            else:
+                move = players[plies % 2].choose_move(game, legal)
+            game.make_move(*move)
+            plies += 1
+    finally:
+        for player in players:
+            player.close()
+
+    score = {"BLACK_WON": 1.0, "WHITE_WON": 0.0}.get(game.get_game_state(), 0.5)
+    return {"game": number, "black": black, "white": white, "score": score, "plies": plies,
+            "seconds": time.perf_counter() - start, "worker": os.getpid()}
+
+
+def schedule(players, mode, games_per_pair):
+    """
+    Generator of the games of a tournament, each pair of players alternating who moves first. Games of every pair
+    are interleaved so early stopping sees all pairs.
+    :param players: list of player specs
+    :param mode: str "round-robin" for every pair, "gauntlet" for the first player against each other one
+    :param games_per_pair: int number of games per pair
+    :return: Generator of (game number, black spec, white spec)
+    :rtype: generator
+    """
+    if mode == "gauntlet":
+        pairs = [(players[0], other) for other in players[1:]]
+    else:
+        pairs = list(itertools.combinations(players, 2))
+    number = 0
+    for index in range(games_per_pair):
+        for first, second in pairs:
+            if index % 2 == 0:
+                yield number, first, second
+            else:
+                yield number, second, first
+            number += 1
+
+
+def score_to_elo(score):
+    """
+    Convert an expected score into an Elo difference.
+    :param score: float expected score between 0 and 1
+    :return: Elo difference, infinite at a score of 0 or 1
+    :rtype: float
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return 400 * math.log10(score / (1 - score))
+
+
+def elo_to_score(elo):
+    """
+    Convert an Elo difference into an expected score.
+    :param elo: float Elo difference
+    :return: Expected score
+    :rtype: float
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class MatchStats:
+    """
+    Match Stats class that serves to do the following:
+    - Count the wins, draws and losses of one player against another
+    - Estimate the Elo difference with a 95 percent interval
+    - Compute the log likelihood ratio of the SPRT of elo1 against elo0
+    """
+
+    def __init__(self):
+        """
+        Initialization method containing class data attributes:
+        :var self._wins - Games won by the first player of the pair
+        :var self._draws - Drawn games
+        :var self._losses - Games lost by the first player of the pair
+        """
+        self._wins = 0
+        self._draws = 0
+        self._losses = 0
+
+    def add(self, score):
+        """
+        Method to count a game.
+        :param score: float score of the first player, 1, 0.5 or 0
+        :return: No return.
+        """
+        if score == 1:
+            self._wins += 1
+        elif score == 0:
+            self._losses += 1
+        else:
+            self._draws += 1
+
+    def get_counts(self):
+        """
+        Get method to return the game counts
+        :return: Wins, draws, losses
+        :rtype: tuple
+        """
+        return self._wins, self._draws, self._losses
+
+    def mean_and_variance(self):
+        """
+        Support method computing the mean score and its per game variance.
+        :return: Mean score, variance, number of games
+        :rtype: tuple
+        """
+        games = self._wins + self._draws + self._losses
+        if games == 0:
+            return 0.5, 0.0, 0
+        mean = (self._wins + 0.5 * self._draws) / games
+        variance = (self._wins * (1 - mean) ** 2 + self._draws * (0.5 - mean) ** 2 + self._losses * mean ** 2) / games
+        return mean, variance, games
+
+    def elo(self):
+        """
+        Method to estimate the Elo difference of the first player over the second.
+        :return: Estimate, lower and upper bound of the 95 percent interval
+        :rtype: tuple
+        """
+        mean, variance, games = self.mean_and_variance()
+        if games == 0:
+            return 0.0, -math.inf, math.inf
+        margin = 1.96 * math.sqrt(variance / games)
+        return score_to_elo(mean), score_to_elo(mean - margin), score_to_elo(mean + margin)
+
+    def llr(self, elo0, elo1):
+        """
+        Method to compute the log likelihood ratio of elo1 against elo0 with the normal approximation of the
+        generalized SPRT.
+        :param elo0: float Elo difference of the null hypothesis
+        :param elo1: float Elo difference of the alternative hypothesis
+        :return: Log likelihood ratio, 0 before the results vary
+        :rtype: float
+        """
+        mean, variance, games = self.mean_and_variance()
+        if variance == 0:
+            return 0.0
+        score0 = elo_to_score(elo0)
+        score1 = elo_to_score(elo1)
+        return games * (score1 - score0) * (2 * mean - score0 - score1) / (2 * variance)
+
+
+def sprt_bounds(alpha, beta):
+    """
+    Compute the stopping bounds of the SPRT.
+    :param alpha: float chance of accepting elo1 when elo0 holds
+    :param beta: float chance of accepting elo0 when elo1 holds
+    :return: Lower bound, accepting elo0, and upper bound, accepting elo1
+    :rtype: tuple
+    """
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def run_tournament(players, mode="round-robin", games_per_pair=100, workers=1, seed=1, max_moves=200,
+                   opening_plies=4, sprt=None, report=None):
+    """
+    Play a tournament over a process pool, with no more than four games per worker waiting. Results are counted as
+    they finish. With an SPRT of (elo0, elo1, alpha, beta), which needs exactly two players, the run stops once the
+    log likelihood ratio of the first player's advantage crosses a bound.
+    :param players: list of player specs
+    :param mode: str "round-robin" or "gauntlet"
+    :param games_per_pair: int number of games per pair
+    :param workers: int number of worker processes, 1 plays in process
+    :param seed: int seed of the opening moves and random players
+    :param max_moves: int number of moves after which a game is a draw
+    :param opening_plies: int number of random opening moves
+    :param sprt: tuple (elo0, elo1, alpha, beta), or None for no early stop
+    :param report: callable given each game result and the match stats as they arrive, or None
+    :return: Games played, elapsed seconds, games per second, dict of (player, opponent) to MatchStats, worker busy
+    fractions by process id, and the SPRT verdict ("H0", "H1" or None)
+    :rtype: dict
+    """
+    for spec in players:
+        parse_player(spec)
+    if sprt is not None and len(players) != 2:
+        raise ValueError("an SPRT needs exactly two players")
+
+    matches = {}
+    for first, second in itertools.combinations(players, 2):
+        matches[(first, second)] = MatchStats()
+    busy = {}
+    verdict = None
+    played = 0
+    start = time.perf_counter()
+
+    def record(result):
+        nonlocal verdict, played
+        played += 1
+        busy[result["worker"]] = busy.get(result["worker"], 0.0) + result["seconds"]
+        black, white = result["black"], result["white"]
+        if (black, white) in matches:
+            matches[(black, white)].add(result["score"])
+        else:
+            matches[(white, black)].add(1 - result["score"])
+        if report is not None:
+            report(result, matches)
+        if sprt is not None:
+            lower, upper = sprt_bounds(sprt[2], sprt[3])
+            llr = matches[tuple(players)].llr(sprt[0], sprt[1])
+            if llr <= lower:
+                verdict = "H0"
+            elif llr >= upper:
+                verdict = "H1"
+
+    games = schedule(players, mode, games_per_pair)
+    arguments = (seed, max_moves, opening_plies)
+    if workers == 1:
+        for number, black, white in games:
+            record(play_game(number, black, white, *arguments))
+            if verdict is not None:
+                break
+    else:
+        executor = ProcessPoolExecutor(workers)
+        pending = set()
+        try:
+            while verdict is None:
+                while len(pending) < workers * 4:
+                    game = next(games, None)
+                    if game is None:
+                        break
+                    pending.add(executor.submit(play_game, *(game + arguments)))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    return {"games": played, "elapsed_s": elapsed, "games_per_second": played / elapsed if elapsed else 0.0,
+            "matches": matches, "utilization": {worker: seconds / elapsed for worker, seconds in busy.items()},
+            "verdict": verdict}
+
+
+def main(argv=None):
+    """
+    Command line entry point: run a tournament and print the Elo table, the SPRT verdict, throughput and worker
+    utilization.
+    :param argv: list of command line arguments, defaults to sys.argv
+    :return: Exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Play a Gess Game tournament and report Elo differences.")
+    parser.add_argument("players", nargs="+", help="player specs: random, greedy, engine[:depth=N,time=MS], "
+                                                   "mcts[:iterations=N,time=MS]")
+    parser.add_argument("--mode", choices=("round-robin", "gauntlet"), default="round-robin")
+    parser.add_argument("--games", type=int, default=100, help="games per pair")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the openings and random players")
+    parser.add_argument("--max-moves", type=int, default=200, help="moves after which a game is a draw")
+    parser.add_argument("--opening-plies", type=int, default=4, help="random moves opening each game")
+    parser.add_argument("--sprt", type=float, nargs=4, metavar=("ELO0", "ELO1", "ALPHA", "BETA"),
+                        help="stop a two player match once the SPRT accepts a hypothesis")
+    parser.add_argument("--progress", type=int, default=0, help="print the standings every N games")
+    arguments = parser.parse_args(argv)
+
+    def report(result, matches):
+        if arguments.progress and sum(sum(stats.get_counts()) for stats in matches.values()) % arguments.progress == 0:
+            for (first, second), stats in matches.items():
+                print("  %s vs %s: %d-%d-%d" % ((first, second) + stats.get_counts()))
+
+    try:
+        results = run_tournament(arguments.players, arguments.mode, arguments.games, arguments.workers,
+                                 arguments.seed, arguments.max_moves, arguments.opening_plies, arguments.sprt, report)
+    except ValueError as error:
+        sys.stderr.write("%s\n" % error)
+        return 1
+
+    for (first, second), stats in results["matches"].items():
+        if sum(stats.get_counts()) == 0:
+            continue
+        elo, low, high = stats.elo()
+        print("%s vs %s: +%d =%d -%d  elo %+.1f [%+.1f, %+.1f]" % ((first, second) + stats.get_counts() +
+                                                                   (elo, low, high)))
+    if arguments.sprt is not None:
+        stats = results["matches"][tuple(arguments.players)]
+        lower, upper = sprt_bounds(arguments.sprt[2], arguments.sprt[3])
+        print("SPRT llr %.2f [%.2f, %.2f]: %s" % (stats.llr(arguments.sprt[0], arguments.sprt[1]), lower, upper,
+                                                   results["verdict"] or "no decision"))
+    print("%d games in %.1f s, %.2f games per second" % (results["games"], results["elapsed_s"],
+                                                         results["games_per_second"]))
+    for worker, fraction in sorted(results["utilization"].items()):
+        print("  worker %d busy %.0f%%" % (worker, fraction * 100))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Fixed size transposition table for Gess Game positions, keyed by the Zobrist hash from
+# GessGame.get_hash().
+
+# Meaning of a stored value: searched with a full window, or a bound left by an alpha-beta cutoff
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    """
+    Transposition table class that serves to do the following:
+    - Store search results by position hash in a fixed number of slots
+    - Return the stored result when the same position is reached through another move order
+    - Keep the deepest results when slots collide, while letting results left over from earlier searches be replaced
+    - Count probes, hits and replacements
+    """
+
+    def __init__(self, size=1 << 20):
+        """
+        Initialization method containing class data attributes:
+        :param size: int number of slots; rounded down to a power of two so a slot is found with a mask
+        :var self._mask - Mask applied to a hash to find its slot
+        :var self._slots - List of entries, each (hash, depth, value, flag, move, generation) or None
+        :var self._generation - Counter of searches, advanced by new_search(); entries from earlier searches are always
+        replaceable
+        :var self._probes - Number of lookups
+        :var self._hits - Number of lookups that found their position
+        :var self._replacements - Number of entries overwritten by a different position
+        """
+        slots = 1
+        while slots * 2 <= size:
+            slots *= 2
+        self._mask = slots - 1
+        self._slots = [None] * slots
+        self._generation = 0
+        self._probes = 0
+        self._hits = 0
+        self._replacements = 0
+
+    def __len__(self):
+        """
+        Method to count the occupied slots
+        :return: Number of stored entries
+        :rtype: int
+        """
+        return len(self._slots) - self._slots.count(None)
+
+    def get_stats(self):
+        """
+        Get method to return the usage counters of the table
+        :return: Slots, probes, hits and replacements
+        :rtype: dict
+        """
+        return {"slots": len(self._slots), "probes": self._probes, "hits": self._hits,
+                "replacements": self._replacements}
+
+    def new_search(self):
+        """
+        Method to mark the start of a new search so the entries of the previous one give way to new results.
+        :return: No return.
+        """
+        self._generation += 1
+
+    def clear(self):
+        """
+        Method to empty every slot and reset the counters.
+        :return: No return.
+        """
+        self._slots = [None] * len(self._slots)
+        self._generation = 0
+        self._probes = 0
+        self._hits = 0
+        self._replacements = 0
+
+    def probe(self, key):
+        """
+        Method to look up the entry stored for a position.
+        :param key: int Zobrist hash of the position
+        :return: Entry as (hash, depth, value, flag, move, generation), None if the position is not stored
+        :rtype: tuple
+        """
+        self._probes += 1
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self._hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, value, flag=EXACT, move=None):
+        """
+        Method to store a search result. Depth-preferred replacement: a slot holding another position is only taken
+        over if it came from an earlier search or was searched no deeper than the new result.
+        :param key: int Zobrist hash of the position
+        :param depth: int remaining search depth of the result
+        :param value: int score of the position
+        :param flag: EXACT, LOWER_BOUND or UPPER_BOUND
+        :param move: Best move found, as a (centr, new_centr) pair, or None
+        :return: Boolean value True if the result was stored. False if a deeper entry was kept.
+        """
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is not None and entry[0] != key:
+            if entry[5] == self._generation and entry[1] > depth:
+                return False
+            self._replacements += 1
+        elif entry is not None and move is None:
+            # Keep the best move of a shallower search of the same position for move ordering
+            move = entry[4]
+        self._slots[index] = (key, depth, value, flag, move, self._generation)
+        return True
@@ -0,0 +1,201 @@
+# Author: Artem Kuryachy
+# Date: 10/18/2026
+# Description: Batch move validation for the Gess Game. Checks thousands of candidate moves against one position at
+# once with NumPy arrays, giving the same verdict and first rejection reason as make_move() without changing the game.
+
+import numpy as np
+
+from GessGame import CELL_AXES, CELL_INDEX, CENTER_ROWS, MAX_RANGE, PIECE_COMPASS, ACCEPTED, GAME_FINISHED, \
+    INVALID_CENTER_X, INVALID_NEW_CENTER_X, INVALID_Y, MIXED_PIECE, BLACK_TO_MOVE, WHITE_TO_MOVE, TOO_FAR, \
+    INVALID_DIRECTION, OBSTRUCTION, OWN_LAST_RING
+
+# Steps from a piece center to each square of its footprint, for fancy indexing
+STEP_X = np.array([step[0] for step in PIECE_COMPASS])
+STEP_Y = np.array([step[1] for step in PIECE_COMPASS])
+
+# Candidates tried on copies of the board at a time by the ring break check, bounding its memory use
+CHUNK_SIZE = 4096
+
+
+def stone_planes(game):
+    """
+    Build boolean planes of the stones of each color, indexed [x, y] like the game board; column 0 holds no stones.
+    :param game: GessGame instance
+    :return: Black plane, white plane
+    :rtype: tuple
+    """
+    black, white = game.get_snapshot()[:2]
+    planes = np.zeros((2, 20, 21), dtype=bool)
+    for plane, bits in zip(planes, (black, white)):
+        cells = np.unpackbits(np.frombuffer(bits.to_bytes(50, "little"), dtype=np.uint8), bitorder="little")
+        plane[:, 1:] = cells.reshape(20, 20)
+    return planes[0], planes[1]
+
+
+def parse_moves(moves):
+    """
+    Convert candidate moves into board indexes with the same checks as GessGame.convert_to_axes(). Moves that fail
+    are given the indexes of b2 so later gathers stay on the board; their code already rejects them.
+    :param moves: sequence of (centr, new_centr) alphanumeric coordinate pairs
+    :return: Array of rejection codes, arrays of old x, old y, new x and new y indexes
+    :rtype: tuple
+    """
+    codes = []
+    axes = []
+    for centr, new_centr in moves:
+        centr = str(centr)
+        new_centr = str(new_centr)
+        cell_old = CELL_INDEX.get(centr)
+        cell_new = CELL_INDEX.get(new_centr)
+        code = ACCEPTED
+        if centr[:1] not in CENTER_ROWS:
+            code = INVALID_CENTER_X
+        elif new_centr[:1] not in CENTER_ROWS:
+            code = INVALID_NEW_CENTER_X
+        elif cell_old is None or not 1 < CELL_AXES[cell_old][1] < 20:
+            code = INVALID_Y
+        elif cell_new is None or not 0 < CELL_AXES[cell_new][1] < 20:
+            code = INVALID_Y
+
+        codes.append(code)
+        if code == ACCEPTED:
+            axes.append(CELL_AXES[cell_old] + CELL_AXES[cell_new])
+        else:
+            axes.append((1, 2, 1, 2))
+
+    axes = np.array(axes, dtype=np.intp).reshape(-1, 4)
+    return np.array(codes, dtype=np.int8), axes[:, 0], axes[:, 1], axes[:, 2], axes[:, 3]
+
+
+def reject(codes, failed, code):
+    """
+    Give a rejection code to the moves that fail a check and have not failed an earlier one.
+    :param codes: array of rejection codes, updated in place
+    :param failed: boolean array of the moves failing the check
+    :param code: int rejection code of the check
+    :return: No return.
+    """
+    codes[(codes == ACCEPTED) & failed] = code
+
+
+def sweep_blocked(occupied, x_old, y_old, x_step, y_step, step):
+    """
+    Find the moves whose piece, moved the given number of steps, would cover a stone outside its own footprint.
+    :param occupied: boolean plane of all stones
+    :param x_old: array of old center x indexes
+    :param y_old: array of old center y indexes
+    :param x_step: array of x direction steps
+    :param y_step: array of y direction steps
+    :param step: int number of steps taken
+    :return: Boolean array of blocked moves
+    :rtype: numpy.ndarray
+    """
+    x = x_old[:, None] + (x_step * step)[:, None] + STEP_X
+    y = y_old[:, None] + (y_step * step)[:, None] + STEP_Y
+    outside = (np.abs(x - x_old[:, None]) > 1) | (np.abs(y - y_old[:, None]) > 1)
+    stones = occupied[np.clip(x, 0, 19), np.clip(y, 0, 20)]
+    return (stones & outside).any(axis=1)
+
+
+def keeps_own_ring(black, white, piece_black, piece_white, x_old, y_old, x_new, y_new, black_to_move):
+    """
+    Apply each move to its own copy of the stone planes and check that the player moving keeps at least one ring.
+    Rings are found with a sliding 3x3 window sum over the windows counted by GessGame: an empty center whose window
+    holds eight stones of the player's color.
+    :param black: boolean black plane
+    :param white: boolean white plane
+    :param piece_black: boolean array of the black stones of each piece, in PIECE_COMPASS order
+    :param piece_white: boolean array of the white stones of each piece
+    :param x_old: array of old center x indexes
+    :param y_old: array of old center y indexes
+    :param x_new: array of new center x indexes
+    :param y_new: array of new center y indexes
+    :param black_to_move: Boolean value True if black is moving
+    :return: Boolean array, True for each move leaving the player a ring
+    :rtype: numpy.ndarray
+    """
+    count = len(x_old)
+    rows = np.arange(count)[:, None]
+    after_black = np.repeat(black[None], count, axis=0)
+    after_white = np.repeat(white[None], count, axis=0)
+
+    # Empty the old footprint, then place the piece on the new footprint
+    old_x = x_old[:, None] + STEP_X
+    old_y = y_old[:, None] + STEP_Y
+    new_x = x_new[:, None] + STEP_X
+    new_y = y_new[:, None] + STEP_Y
+    after_black[rows, old_x, old_y] = False
+    after_white[rows, old_x, old_y] = False
+    after_black[rows, new_x, new_y] = piece_black
+    after_white[rows, new_x, new_y] = piece_white
+
+    own = after_black if black_to_move else after_white
+    empty = ~(after_black | after_white)
+    total = np.zeros((count, 16, 16), dtype=np.int8)
+    for x_step, y_step in PIECE_COMPASS:
+        total += own[:, 2 + x_step:18 + x_step, 3 + y_step:19 + y_step]
+    rings = (total == 8) & empty[:, 2:18, 3:19]
+    return rings.any(axis=(1, 2))
+
+
+def validate_moves(game, moves):
+    """
+    Check a batch of candidate moves against the position of the game, applying the checks of make_move() in the
+    same order. The game is not changed.
+    :param game: GessGame instance
+    :param moves: sequence of (centr, new_centr) alphanumeric coordinate pairs
+    :return: Boolean array, True for each move make_move() would accept, and array of the code of the first check each
+    move fails, ACCEPTED for legal moves
+    :rtype: tuple
+    """
+    codes, x_old, y_old, x_new, y_new = parse_moves(moves)
+    if game.get_game_state() != "UNFINISHED":
+        codes[:] = GAME_FINISHED
+        return codes == ACCEPTED, codes
+
+    black, white = stone_planes(game)
+    black_to_move = game.get_turn_count() % 2 == 0
+
+    # Pieces gathered from the old footprints
+    piece_x = x_old[:, None] + STEP_X
+    piece_y = y_old[:, None] + STEP_Y
+    piece_black = black[piece_x, piece_y]
+    piece_white = white[piece_x, piece_y]
+    has_black = piece_black.any(axis=1)
+    has_white = piece_white.any(axis=1)
+    reject(codes, has_black & has_white, MIXED_PIECE)
+    if black_to_move:
+        reject(codes, has_white, BLACK_TO_MOVE)
+    else:
+        reject(codes, has_black, WHITE_TO_MOVE)
+
+    x_diff = x_new - x_old
+    y_diff = y_new - y_old
+    reject(codes, (np.abs(x_diff) > MAX_RANGE) | (np.abs(y_diff) > MAX_RANGE), TOO_FAR)
+
+    # A compass direction moves the same distance along each axis it moves on; the piece square of that direction,
+    # or the center for a move onto itself, must hold a stone
+    distance = np.maximum(np.abs(x_diff), np.abs(y_diff))
+    straight = ((x_diff == 0) | (np.abs(x_diff) == distance)) & ((y_diff == 0) | (np.abs(y_diff) == distance)) & \
+               (distance <= 3)
+    x_step = np.sign(x_diff)
+    y_step = np.sign(y_diff)
+    orientation = (x_step + 1) * 3 + y_step + 1
+    supported = (piece_black | piece_white)[np.arange(len(codes)), orientation]
+    reject(codes, ~(straight & supported), INVALID_DIRECTION)
+
+    # Sweep the footprints short of the new center, as GessGame.check_obstruction() does
+    occupied = black | white
+    swept = straight & ((x_diff > 1) | (y_diff > 1)) & (x_diff != 0)
+    blocked = sweep_blocked(occupied, x_old, y_old, x_step, y_step, 1)
+    blocked |= (distance == 3) & sweep_blocked(occupied, x_old, y_old, x_step, y_step, 2)
+    reject(codes, swept & blocked, OBSTRUCTION)
+
+    remaining = np.flatnonzero(codes == ACCEPTED)
+    for start in range(0, len(remaining), CHUNK_SIZE):
+        chunk = remaining[start:start + CHUNK_SIZE]
+        kept = keeps_own_ring(black, white, piece_black[chunk], piece_white[chunk], x_old[chunk], y_old[chunk],
+                              x_new[chunk], y_new[chunk], black_to_move)
+        codes[chunk[~kept]] = OWN_LAST_RING
+
+    return codes == ACCEPTED, codes